@@ -139,6 +139,9 @@ setup(
     #   py_modules=["my_module"],
     #
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),  # Required
+    package_data={
+        'validator_collection': ['_data/*.json'],
+    },
 
     # This field lists other packages that your project depends on to run.
     # Any package you put here will be installed by pip when your project is
@@ -161,6 +164,9 @@ setup(
     # projects.
     extras_require={  # Optional
         'dev': ['check-manifest','sphinx','sphinx-rtd-theme','sphinx-tabs'],
+        'idna': ['idna'],
+        'orjson': ['orjson'],
+        'numpy': ['numpy'],
         'test': ['coverage',
                  'pytest',
                  'pytest-benchmark',
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_benchmarks
+***********************************
+
+Throughput benchmarks, run with
+`pytest-benchmark <https://pytest-benchmark.readthedocs.io/>`_.
+
+Run only the benchmarks with::
+
+  $ pytest tests/test_benchmarks.py --benchmark-only
+
+"""
+
+import io
+import uuid
+
+import pytest
+
+import validator_collection.validators as validators
+
+
+EMAIL_ADDRESSES = [
+    'email@example.com',
+    'firstname.lastname@example.com',
+    'firstname+lastname@subdomain.example.com',
+    '1234567890@example.co.uk',
+    '"email"@example.com',
+    'test(comment)@test.com',
+    'email@[123.123.123.123]',
+    'very.unusual."@".unusual.com@example.com',
+    'email..email@example.com',
+    'plainaddress',
+]
+
+
+def validate_all(validator, values):
+    """Apply ``validator`` to each of ``values``, and return the number of
+    values that were valid."""
+    valid = 0
+    for value in values:
+        try:
+            validator(value)
+            valid += 1
+        except ValueError:
+            pass
+
+    return valid
+
+
+@pytest.mark.parametrize('values', [
+    EMAIL_ADDRESSES[:4],
+    EMAIL_ADDRESSES,
+], ids = ['common', 'mixed'])
+def test_email_throughput(benchmark, values):
+    valid = benchmark(validate_all, validators.email, values)
+    assert valid == len([x for x in values if '..' not in x and '@' in x])
+
+
+def test_email_throughput_domain_cache(benchmark):
+    values = EMAIL_ADDRESSES[:4] * 25
+    validators.enable_domain_cache()
+    try:
+        valid = benchmark(validate_all, validators.email, values)
+    finally:
+        validators.disable_domain_cache()
+
+    assert valid == len(values)
+
+
+def test_email_batch_throughput(benchmark):
+    values = EMAIL_ADDRESSES[:4] * 25
+    valid = benchmark(lambda: sum(1 for x in validators.email_batch(values) if x))
+    assert valid == len(values)
+
+
+@pytest.mark.parametrize('return_type', [None, int])
+def test_ipv4_throughput(benchmark, return_type):
+    values = ['%s.%s.%s.%s' % (x, 255 - x, x // 2, 7) for x in range(100)]
+    valid = benchmark(lambda: sum(1 for x in values
+                                  if validators.ipv4(x, return_type = return_type)
+                                  is not None))
+    assert valid == len(values)
+
+
+def test_ip_address_throughput(benchmark):
+    values = []
+    for x in range(50):
+        values.append('%s.%s.%s.%s' % (x, 255 - x, x // 2, 7))
+        values.append('2001:db8:%x::%x:%x' % (x, x * 7, 255 - x))
+    valid = benchmark(lambda: sum(1 for x in values if validators.ip_address(x)))
+    assert valid == len(values)
+
+
+def test_ip_address_denied_throughput(benchmark):
+    networks = ['%s.%s.%s.0/24' % (x % 256, (x * 7) % 256, (x * 13) % 256)
+                for x in range(5000)]
+    denied = validators.compile_ip_networks(networks)
+    values = ['%s.%s.%s.%s' % (x, 255 - x, x // 2, 7) for x in range(100)]
+    valid = benchmark(lambda: sum(1 for x in values
+                                  if validators.ip_address(x, denied = denied)))
+    assert valid == len(values)
+
+
+@pytest.mark.parametrize('validator', ['ipv4', 'ipv4_batch'])
+def test_ipv4_batch_throughput(benchmark, validator):
+    pytest.importorskip('numpy')
+    values = ['%s.%s.%s.%s' % (x % 256, 255 - x % 256, x // 256, 7)
+              for x in range(10000)]
+    if validator == 'ipv4':
+        valid = benchmark(lambda: sum(1 for x in values
+                                      if validators.ipv4(x, return_type = int)
+                                      is not None))
+    else:
+        valid = benchmark(lambda: int(validators.ipv4_batch(values)[1].sum()))
+
+    assert valid == len(values)
+
+
+def test_mac_address_batch_throughput(benchmark):
+    pytest.importorskip('numpy')
+    values = ['%02x:%02x:00:0e:30:%02x' % (x % 256, x // 256, x % 7)
+              for x in range(10000)]
+    valid = benchmark(lambda: int(validators.mac_address_batch(values)[1].sum()))
+    assert valid == len(values)
+
+
+@pytest.mark.parametrize('validator', ['uuid', 'uuid_batch'])
+def test_uuid_batch_throughput(benchmark, validator):
+    pytest.importorskip('numpy')
+    values = [str(uuid.UUID(int = x * 7919)) for x in range(10000)]
+    if validator == 'uuid':
+        valid = benchmark(lambda: sum(1 for x in values if validators.uuid(x)))
+    else:
+        valid = benchmark(lambda: int(validators.uuid_batch(values)[1].sum()))
+
+    assert valid == len(values)
+
+
+JSON_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer', 'minimum': 0},
+        'name': {'type': 'string', 'maxLength': 50},
+        'tags': {'type': 'array', 'items': {'type': 'string'}},
+    },
+    'required': ['id', 'name'],
+}
+
+
+@pytest.mark.parametrize('compiled', ['cached', 'jsonschema', 'native'])
+def test_json_schema_throughput(benchmark, compiled):
+    values = [{'id': x, 'name': 'name %s' % x, 'tags': ['a', 'b']}
+              for x in range(100)]
+    schema = JSON_SCHEMA
+    if compiled != 'cached':
+        schema = validators.compile_json_schema(JSON_SCHEMA,
+                                                native = compiled == 'native')
+
+    valid = benchmark(validate_all, lambda x: validators.json(x, schema), values)
+    assert valid == len(values)
+
+
+@pytest.mark.parametrize('check_formats', [False, True])
+def test_json_format_throughput(benchmark, check_formats):
+    schema = validators.compile_json_schema({
+        'type': 'object',
+        'properties': {
+            'email': {'type': 'string', 'format': 'email'},
+            'id': {'type': 'string', 'format': 'uuid'},
+        },
+    }, check_formats = check_formats)
+    values = [{'email': EMAIL_ADDRESSES[x % 4], 'id': str(uuid.UUID(int = x % 10))}
+              for x in range(100)]
+    valid = benchmark(validate_all, lambda x: validators.json(x, schema), values)
+    assert valid == len(values)
+
+
+@pytest.mark.parametrize('validator', ['json', 'json_lines'])
+def test_json_lines_throughput(benchmark, validator):
+    lines = ['{"id": %s, "name": "name %s", "tags": ["a"]}' % (x, x)
+             for x in range(1000)]
+    if validator == 'json':
+        valid = benchmark(validate_all,
+                          lambda x: validators.json(x, JSON_SCHEMA),
+                          lines)
+    else:
+        valid = benchmark(lambda: sum(1 for x in validators.json_lines(lines,
+                                                                       JSON_SCHEMA)
+                                      if x.is_valid))
+
+    assert valid == len(lines)
+
+
+@pytest.mark.parametrize('validator', ['json', 'json_array_elements'])
+def test_json_array_elements_throughput(benchmark, validator):
+    content = '[%s]' % ', '.join('{"id": %s, "name": "name %s", "tags": ["a"]}' % (x, x)
+                                 for x in range(1000))
+    schema = {'type': 'array', 'items': JSON_SCHEMA}
+    if validator == 'json':
+        valid = benchmark(lambda: len(validators.json(content, schema)))
+    else:
+        valid = benchmark(lambda: 1000 - len(list(validators.json_array_elements(
+            io.StringIO(content),
+            schema
+        ))))
+
+    assert valid == 1000
+
+
+@pytest.mark.parametrize('syntax_only', [False, True])
+def test_json_syntax_throughput(benchmark, syntax_only):
+    content = '[%s]' % ', '.join('{"id": %s, "name": "name %s", "tags": ["a"]}' % (x, x)
+                                 for x in range(10000))
+    validated = benchmark(lambda: validators.json(content, syntax_only = syntax_only))
+    assert validated is content if syntax_only else len(validated) == 10000
+
+
+@pytest.mark.parametrize('backend', validators.json_backends())
+def test_json_backend_throughput(benchmark, backend):
+    content = '[%s]' % ', '.join('{"id": %s, "name": "name %s", "tags": ["a"]}' % (x, x)
+                                 for x in range(1000))
+    json_serializer = validators.get_json_backend(backend)
+    valid = benchmark(lambda: len(validators.json(content,
+                                                  json_serializer = json_serializer)))
+    assert valid == 1000
+
+
+@pytest.mark.parametrize('decode', [True, False])
+def test_json_bytes_throughput(benchmark, decode):
+    content = ('[%s]' % ', '.join('{"id": %s, "name": "name %s", "tags": ["a"]}' % (x, x)
+                                  for x in range(1000))).encode('utf-8')
+    if decode:
+        valid = benchmark(lambda: len(validators.json(content.decode('utf-8'))))
+    else:
+        valid = benchmark(lambda: len(validators.json(memoryview(content))))
+
+    assert valid == 1000
+
+
+@pytest.mark.parametrize('limits', [False, True])
+def test_json_limits_throughput(benchmark, limits):
+    content = '[%s]' % ', '.join('{"id": %s, "name": "name %s", "tags": ["a"]}' % (x, x)
+                                 for x in range(10000))
+    kwargs = {}
+    if limits:
+        kwargs = {'max_depth': 32, 'max_items': 100000, 'max_string_length': 1024}
+
+    valid = benchmark(lambda: len(validators.json(content, **kwargs)))
+    assert valid == 10000
+
+
+def test_json_limits_rejection_throughput(benchmark):
+    content = '[%s]' % ', '.join(['1'] * 1000000)
+
+    def reject():
+        try:
+            validators.json(content, max_items = 1000)
+        except ValueError:
+            return True
+
+    assert benchmark(reject)
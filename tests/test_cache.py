@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_cache
+***********************************
+
+Tests for the LRU cache.
+
+"""
+
+import pytest
+
+from validator_collection._cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize = 2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+    assert len(cache) == 2
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+
+def test_lru_cache_info():
+    cache = LRUCache(maxsize = 4)
+    assert cache.hit_rate == 0.0
+
+    cache.set('a', False)
+    assert cache.get('a') is False
+    assert cache.get('b') is None
+    assert cache.get('b', 123) == 123
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.maxsize == 4
+    assert info.currsize == 1
+    assert info.hit_rate == pytest.approx(1 / 3.0)
+    assert cache.hit_rate == info.hit_rate
+
+    cache.clear()
+    assert cache.info() == (0, 0, 4, 0)
+
+
+@pytest.mark.parametrize('maxsize', [0, -1, None])
+def test_lru_cache_maxsize(maxsize):
+    with pytest.raises(ValueError):
+        LRUCache(maxsize = maxsize)
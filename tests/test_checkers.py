@@ -14,6 +14,7 @@ import fractions
 import io
 import os
 import random
+import re
 import sys
 import time as time_
 import uuid
@@ -22,6 +23,7 @@ from datetime import datetime, date, time, tzinfo, timedelta
 import pytest
 
 import validator_collection.checkers as checkers
+from validator_collection import errors
 
 from validator_collection._compat import TimeZone
 
@@ -254,6 +256,47 @@ def test_is_string(value, expects, coerce_value, minimum_length, maximum_length,
     assert result == expects
 
 
+
+
+@pytest.mark.parametrize('value, pattern, flags, fullmatch, maximum_length, expects', [
+    ('SKU-1234', r'SKU-\d{4}', 0, False, None, True),
+    ('SKU-1234x', r'SKU-\d{4}', 0, False, None, True),
+    ('SKU-1234x', r'SKU-\d{4}', 0, True, None, False),
+    ('sku-1234', r'SKU-\d{4}', 0, True, None, False),
+    ('sku-1234', r'SKU-\d{4}', re.IGNORECASE, True, None, True),
+    ('sku-1234', re.compile(r'SKU-\d{4}', re.I), 0, True, None, True),
+    ('', r'\d*', 0, True, None, True),
+    ('', r'\d+', 0, True, None, False),
+    ('SKU-1234', r'SKU-\d{4}', 0, True, 4, False),
+    ('SKU-1234', r'SKU-(', 0, False, None, False),
+    ('SKU-1234', re.compile(r'SKU'), re.I, False, None, False),
+])
+def test_is_string_pattern(value, pattern, flags, fullmatch, maximum_length, expects):
+    result = checkers.is_string(value,
+                                pattern = pattern,
+                                flags = flags,
+                                fullmatch = fullmatch,
+                                maximum_length = maximum_length)
+    assert result == expects
+
+
+
+
+@pytest.mark.parametrize('value, encoding, expects', [
+    (b'hello', 'ascii', True),
+    (b'h\xc3\xa9llo', 'ascii', False),
+    (b'h\xc3\xa9llo', 'utf-8', True),
+    (b'h\xe9llo', 'utf-8', False),
+    (bytearray(b'h\xc3\xa9llo'), 'utf-8', True),
+    (memoryview(b'h\xc3\xa9llo')[:2], 'utf-8', False),
+    (u'h\xe9llo', 'ascii', False),
+    (u'h\xe9llo', 'latin-1', True),
+    (b'hello', 'not-an-encoding', False),
+])
+def test_is_string_encoding(value, encoding, expects):
+    assert checkers.is_string(value, encoding = encoding) == expects
+
+
 @pytest.mark.parametrize('value, fails, allow_empty, minimum_length, maximum_length', [
     (['test', 123], False, False, None, None),
     ([], False, True, None, None),
@@ -372,6 +415,8 @@ def test_is_none(value, fails, allow_empty):
     ('123_variable', True, False),
     (None, True, False),
     ('raise Exception("Foo")\nxyz', True, False),
+    ('class', True, False),
+    ('match', False, False),
 ])
 def test_is_variable_name(value, fails, allow_empty):
     expects = not fails
@@ -395,7 +440,10 @@ def test_is_callable(value, fails, allow_empty):
 @pytest.mark.parametrize('value, fails, allow_empty', [
     (uuid.uuid4(), False, False),
     ('123e4567-e89b-12d3-a456-426655440000', False, False),
+    (uuid.uuid4().bytes, False, False),
     ('not-a-uuid', True, False),
+    (b'not-a-uuid', True, False),
+    (123, True, False),
     ('', True, False),
     (None, True, False),
 ])
@@ -892,6 +940,27 @@ def test_is_stringIO(value, fails, allow_empty):
     assert result == expects
 
 
+@pytest.mark.parametrize('value, kwargs, expects', [
+    (io.BytesIO(b'abcdef'), {'maximum_length': 6}, True),
+    (io.BytesIO(b'abcdef'), {'maximum_length': 5}, False),
+    (io.BytesIO(b'abcdef'), {'minimum_length': 7}, False),
+    (io.BytesIO(b'h\xe9llo'), {'encoding': 'utf-8'}, False),
+    (io.BytesIO(b'h\xe9llo'), {'encoding': 'latin-1'}, True),
+    (io.StringIO(u'abcdef'), {'maximum_length': 6}, True),
+    (io.StringIO(u'abcdef'), {'minimum_length': 7}, False),
+    (io.StringIO(u'h\xe9llo'), {'encoding': 'ascii'}, False),
+    (io.StringIO(u'h\xe9llo'), {'encoding': 'utf-8'}, True),
+])
+def test_is_IO_stream(value, kwargs, expects):
+    if isinstance(value, io.BytesIO):
+        result = checkers.is_bytesIO(value, **kwargs)
+    else:
+        result = checkers.is_stringIO(value, **kwargs)
+
+    assert result == expects
+    assert value.tell() == 0
+
+
 @pytest.mark.parametrize('value, fails, allow_empty', [
     ('/test', False, False),
     ('.', False, False),
@@ -1131,6 +1200,27 @@ def test_is_email(value, fails, allow_empty):
     assert result == expects
 
 
+@pytest.mark.parametrize('values, expects', [
+    (['email@example.com', 'plainaddress', None, 'email@example.com'],
+     [True, False, False, True]),
+    ([], []),
+    (['email@example.com'], [True]),
+])
+def test_is_email_batch(values, expects):
+    result = checkers.is_email_batch(values)
+    assert list(result) == expects
+
+
+@pytest.mark.parametrize('values, error', [
+    (123, errors.NotAnIterableError),
+    (None, errors.NotAnIterableError),
+    ('email@example.com', errors.CannotCoerceError),
+])
+def test_is_email_batch_not_a_batch(values, error):
+    with pytest.raises(error):
+        checkers.is_email_batch(values)
+
+
 @pytest.mark.parametrize('value, fails, allow_empty, allow_special_ips', [
     (u"http://foo.com/blah_blah", False, False, False),
     (u"http://foo.com/blah_blah/", False, False, False),
@@ -1432,6 +1522,34 @@ def test_is_domain(value, fails, allow_empty, allow_ips):
     assert result == expects
 
 
+@pytest.mark.parametrize('value, fails', [
+    (u"foo.com", False),
+    (u"www.example.co.uk", False),
+    (u"localhost", False),
+
+    (u"foo.notatld", True),
+    (u"co.uk", True),
+])
+def test_is_domain_strict_tld(value, fails):
+    expects = not fails
+    result = checkers.is_domain(value, strict_tld = True)
+    assert result == expects
+
+
+@pytest.mark.parametrize('value, fails', [
+    (u"foo.com", False),
+    (u"münchen.de", False),
+    (u"xn--mnchen-3ya.de", False),
+
+    (u"✪df.ws", True),
+    (u"xn--zz.com", True),
+])
+def test_is_domain_strict_idna(value, fails):
+    expects = not fails
+    result = checkers.is_domain(value, strict_idna = True)
+    assert result == expects
+
+
 @pytest.mark.parametrize('value, fails, allow_empty', [
     ('0.0.0.0', False, False),
     ('10.10.10.10', False, False),
@@ -1475,6 +1593,20 @@ def test_is_ip_address(value, fails, allow_empty):
     assert result == expects
 
 
+@pytest.mark.parametrize('value, strict, expects', [
+    ('10.0.0.0/8', True, True),
+    ('2001:db8::/32', True, True),
+    ('10.0.0.1/8', True, False),
+    ('10.0.0.1/8', False, True),
+    ('10.0.0.0/33', True, False),
+    ('not-a-network', True, False),
+    (None, True, False),
+])
+def test_is_ip_network(value, strict, expects):
+    result = checkers.is_ip_network(value, strict = strict)
+    assert result == expects
+
+
 @pytest.mark.parametrize('value, fails, allow_empty', [
     ('0.0.0.0', False, False),
     ('10.10.10.10', False, False),
@@ -1536,12 +1668,15 @@ def test_is_ipv6(value, fails, allow_empty):
     ('36-5d-44-50-36-ae', False, False),
     ('6c-ee-1b-41-d9-ea', False, False),
     ('6c-ee-1b-41-d9-ea', False, False),
+    ('0123.4567.abCD', False, False),
+    ('01234567abCD', False, False),
     ('0.0.0', True, False),
     ('0', True, False),
     ('abc0.0.0.0', True, False),
     ('a.b.c.d', True, False),
     ('275.276.278.279', True, False),
     ('not-a-valid-value', True, False),
+    ('01:23:45:67:ab:cd:ef:01', True, False),
     (123, True, False),
     ("", True, False),
     (None, True, False),
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_email_differential
+***********************************
+
+Differential tests that pin the behavior of
+:func:`email <validator_collection.validators.email>` to that of its original
+multi-pass implementation, which is kept here as a reference.
+
+"""
+
+import random
+import string as string_
+
+import pytest
+
+import validator_collection.validators as validators
+from validator_collection import errors
+
+
+def reference_email(value):
+    """The multi-pass email validator, as it stood before the single-pass
+    tokenizer replaced it."""
+    # pylint: disable=too-many-branches,too-many-statements,R0914
+    if '@' not in value:
+        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+    if '(' in value and ')' in value:
+        open_parentheses = value.find('(')
+        close_parentheses = value.find(')') + 1
+
+        if close_parentheses < open_parentheses:
+            raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                           'address' % value)
+
+        commented_value = value[open_parentheses:close_parentheses]
+        value = value.replace(commented_value, '')
+    elif '(' in value:
+        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+    elif ')' in value:
+        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+
+    if '<' in value or '>' in value:
+        lt_position = value.find('<')
+        gt_position = value.find('>')
+        first_quote_position = -1
+        second_quote_position = -1
+
+        if lt_position >= 0:
+            first_quote_position = value.find('"', 0, lt_position)
+        if gt_position >= 0:
+            second_quote_position = value.find('"', gt_position)
+
+        if first_quote_position < 0 or second_quote_position < 0:
+            raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                           'address' % value)
+
+    at_count = value.count('@')
+    if at_count > 1:
+        last_at_position = 0
+        last_quote_position = 0
+        for x in range(0, at_count):                                            # pylint: disable=W0612
+            at_position = value.find('@', last_at_position + 1)
+            if at_position >= 0:
+                first_quote_position = value.find('"',
+                                                  last_quote_position,
+                                                  at_position)
+                second_quote_position = value.find('"',
+                                                   first_quote_position)
+                if first_quote_position < 0 or second_quote_position < 0:
+                    raise errors.InvalidEmailError(
+                        'value (%s) is not a valid email address' % value
+                    )
+            last_at_position = at_position
+            last_quote_position = second_quote_position
+
+    split_values = value.split('@')
+    if len(split_values) < 2:
+        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+
+    local_value = ''.join(split_values[:-1])
+    domain_value = split_values[-1]
+    is_domain = False
+    is_ip = False
+    try:
+        if domain_value.startswith('[') and domain_value.endswith(']'):
+            domain_value = domain_value[1:-1]
+        validators.domain(domain_value)
+        is_domain = True
+    except ValueError:
+        is_domain = False
+
+    if not is_domain:
+        try:
+            validators.ip_address(domain_value, force_run = True)               # pylint: disable=E1123
+            is_ip = True
+        except ValueError:
+            is_ip = False
+
+    if not is_domain and is_ip:
+        try:
+            reference_email(local_value + '@test.com')
+        except ValueError:
+            raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                           'address' % value)
+
+        return value
+
+    if not is_domain:
+        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+    else:
+        is_valid = validators.EMAIL_REGEX.search(value)
+
+        if not is_valid:
+            raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                           'address' % value)
+
+        matched_string = is_valid.group(0)
+        position = value.find(matched_string)
+        if position > 0:
+            prefix = value[:position]
+            if prefix[0] in string_.punctuation:
+                raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                               'address' % value)
+            if '..' in prefix:
+                raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                               'address' % value)
+
+        end_of_match = position + len(matched_string)
+        suffix = value[end_of_match:]
+        if suffix:
+            raise errors.InvalidEmailError('value (%s) is not a valid email '
+                                           'address' % value)
+
+    return value
+
+
+def outcome(validator, value):
+    """Return the value ``validator`` returns for ``value``, or ``None`` if it
+    raises a :class:`ValueError <python:ValueError>`."""
+    try:
+        return validator(value)
+    except ValueError:
+        return None
+
+
+CORPUS = [
+    'test@domain.dev',
+    'test@domain.com',
+    'test@domain.co.uk',
+    'Email@example.com',
+    'email@example.com',
+    'firstname.lastname@example.com',
+    'email@subdomain.example.com',
+    'firstname+lastname@example.com',
+    'email@123.123.123.123',
+    'email@[123.123.123.123]',
+    '"email"@example.com',
+    '1234567890@example.com',
+    'email@example-one.com',
+    '_______@example.com',
+    'email@example.name',
+    'email@example.museum',
+    'email@example.co.jp',
+    'firstname-lastname@example.com',
+    'much."more\\ unusual"@example.com',
+    'very.unusual."@".unusual.com@example.com',
+    'very."(),:;<>[]".VERY."very@\\ "very".unusual@strange.example.com',
+    'Joe.Smith."<".email.">".test@example.com',
+    'test(comment)@test.com',
+    '(comment)test@test.com',
+    'test@(comment)test.com',
+    '"x"@[1.2.3.a:b@foo.com]',
+    'a@[1.2.3.tag:x]',
+    '"a\\"b"@c.com',
+    'plainaddress',
+    '#@%^%#$@#$@#.com',
+    '@example.com',
+    'Joe Smith <email@example.com>',
+    'email.example.com',
+    'email@example@example.com',
+    '.email@example.com',
+    'email.@example.com',
+    'email..email@example.com',
+    'email@example.com (Joe Smith)',
+    'email@example',
+    'email@-example.com',
+    'email@111.222.333.44444',
+    'email@example..com',
+    'Abc..123@example.com',
+    '"(),:;<>[\\]@example.com',
+    'just"not"right@example.com',
+    'this\\ is"really"not\\allowed@example.com',
+    'test@test)comment(.com',
+    'test(comment@test.com',
+    'test)comment@test.com',
+]
+
+FUZZ_ALPHABET = list('aZ0.@"()<>[]\\ -_:.x1!#;,') + \
+    ['.com', '@b.com', 'example', '1.2.3.4', '\t', u'\xe9']
+
+
+def fuzz_values(seed, count):
+    """Yield ``count`` mutations of the :data:`CORPUS` and random strings over
+    :data:`FUZZ_ALPHABET`."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        if rng.random() < 0.5:
+            characters = list(rng.choice(CORPUS))
+            for _ in range(rng.randint(1, 3)):
+                operation = rng.random()
+                position = rng.randint(0, len(characters))
+                if operation < 0.4:
+                    characters.insert(position, rng.choice(FUZZ_ALPHABET))
+                elif characters and operation < 0.7:
+                    del characters[min(position, len(characters) - 1)]
+                elif characters:
+                    characters[min(position, len(characters) - 1)] = \
+                        rng.choice(FUZZ_ALPHABET)
+            value = ''.join(characters)
+        else:
+            value = ''.join(rng.choice(FUZZ_ALPHABET)
+                            for _ in range(rng.randint(1, 12)))
+
+        if value:
+            yield value
+
+
+@pytest.mark.parametrize('value', CORPUS)
+def test_email_matches_reference(value):
+    assert outcome(validators.email, value) == outcome(reference_email, value)
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2, 3])
+def test_email_matches_reference_fuzzed(seed):
+    mismatches = [
+        value for value in fuzz_values(seed, 2500)
+        if outcome(validators.email, value) != outcome(reference_email, value)
+    ]
+
+    assert mismatches == []
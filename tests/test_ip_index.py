@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_ip_index
+***********************************
+
+Tests for the IP network index.
+
+"""
+
+import random
+
+import pytest
+
+from validator_collection._ip_index import IPNetworkIndex
+
+
+def test_ip_network_index_merges_intervals():
+    index = IPNetworkIndex([(10, 19), (20, 29), (25, 40), (50, 60), (0, 2)],
+                           [(5, 5)])
+    assert len(index) == 4
+    assert index.contains(4, 0)
+    assert index.contains(4, 2)
+    assert not index.contains(4, 3)
+    assert index.contains(4, 10)
+    assert index.contains(4, 40)
+    assert not index.contains(4, 41)
+    assert not index.contains(4, 49)
+    assert index.contains(4, 50)
+    assert not index.contains(4, 61)
+    assert index.contains(6, 5)
+    assert not index.contains(6, 4)
+    assert not index.contains(6, 6)
+
+
+def test_ip_network_index_ipv4_mapped():
+    index = IPNetworkIndex([(10, 19)])
+    assert index.contains(6, (0xffff << 32) + 10)
+    assert not index.contains(6, (0xffff << 32) + 20)
+    assert not index.contains(6, 10)
+
+
+def test_ip_network_index_empty():
+    index = IPNetworkIndex()
+    assert len(index) == 0
+    assert not index.contains(4, 0)
+    assert not index.contains(6, 0)
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_ip_network_index_matches_linear_search(seed):
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(200):
+        first = rng.randint(0, 10000)
+        intervals.append((first, first + rng.randint(0, 100)))
+
+    index = IPNetworkIndex(intervals)
+    for address in range(0, 10200, 7):
+        expects = any(first <= address <= last for first, last in intervals)
+        assert index.contains(4, address) == expects
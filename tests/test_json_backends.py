@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_json_backends
+***********************************
+
+Tests for the registry of JSON backends.
+
+"""
+
+import json
+
+import pytest
+
+from validator_collection import _json_backends, checkers, errors, validators
+from validator_collection._compat import json_
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolate the registry of backends, and the selected backend, from other
+    tests."""
+    monkeypatch.setattr(_json_backends, '_BACKENDS', dict(_json_backends._BACKENDS))
+    monkeypatch.setattr(_json_backends, '_SELECTED', None)
+
+
+class _CountingLoads(object):
+    """A ``loads`` callable that records the values it is passed."""
+
+    def __init__(self):
+        self.values = []
+
+    def __call__(self, value):
+        self.values.append(value)
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+
+        return json.loads(value)
+
+
+def test_json_backends():
+    names = validators.json_backends()
+    assert 'json' in names
+    priorities = [validators.get_json_backend(x).priority for x in names]
+    assert priorities == sorted(priorities, reverse = True)
+    assert validators.get_json_backend().name == json_.__name__
+
+    with pytest.raises(ValueError):
+        validators.get_json_backend('not-a-backend')
+
+
+@pytest.mark.usefixtures('registry')
+def test_register_json_backend():
+    loads = _CountingLoads()
+    backend = validators.register_json_backend('counting', loads, priority = 1000)
+    assert validators.json_backends()[0] == 'counting'
+    assert validators.get_json_backend().name == json_.__name__
+    assert validators.set_json_backend('counting') is backend
+
+    assert validators.json('{"a": 1}') == {'a': 1}
+    assert validators.dict('{"b": 2}') == {'b': 2}
+    assert checkers.is_json('[1]')
+    assert checkers.is_dict('{"c": 3}')
+    assert loads.values == ['{"a": 1}', '{"b": 2}', '[1]', '{"c": 3}']
+
+    with pytest.raises(ValueError):
+        validators.register_json_backend('not-callable', None)
+
+
+@pytest.mark.usefixtures('registry')
+def test_set_json_backend():
+    loads = _CountingLoads()
+    validators.register_json_backend('counting', loads, priority = -1)
+    assert validators.get_json_backend().name == json_.__name__
+
+    assert validators.set_json_backend('counting').name == 'counting'
+    validators.json('[2]')
+    assert loads.values == ['[2]']
+
+    assert validators.set_json_backend().name == json_.__name__
+    validators.json('[3]')
+    assert loads.values == ['[2]']
+
+    with pytest.raises(ValueError):
+        validators.set_json_backend('not-a-backend')
+
+
+@pytest.mark.parametrize('value', [b'[1]', bytearray(b'[1]'), memoryview(b'[1]')])
+@pytest.mark.parametrize('bytes_types', [(), (bytes, bytearray, memoryview)])
+def test_json_backend_bytes(value, bytes_types):
+    loads = _CountingLoads()
+    backend = _json_backends.JSONBackend('counting', loads, bytes_types = bytes_types)
+    assert backend.loads(value) == [1]
+    if bytes_types:
+        assert loads.values[0] is value
+    else:
+        assert loads.values == [u'[1]']
+
+
+def test_benchmark_json_backends():
+    timings = validators.benchmark_json_backends(number = 2)
+    assert set(timings) == set(validators.json_backends())
+    assert list(timings.values()) == sorted(timings.values())
+
+    assert 'json' not in validators.benchmark_json_backends('{not json', number = 1)
+
+
+@pytest.mark.usefixtures('registry')
+def test_json_backend_errors():
+    def loads(value):
+        raise ValueError('always fails')
+
+    validators.register_json_backend('failing', loads, priority = 1000)
+    validators.set_json_backend('failing')
+    with pytest.raises(errors.CannotCoerceError):
+        validators.json('[1]')
+    assert not checkers.is_json('[1]')
+    assert validators.json('[1]', json_serializer = json) == [1]
+
+
+@pytest.mark.usefixtures('registry')
+@pytest.mark.parametrize('value', [u'{"a": NaN}', u'{"a": -Infinity}', u'{"a": "\\ud800"}'])
+def test_json_backend_default_verdicts(value):
+    """Which documents are valid JSON must not depend on which backends are
+    installed, or in what order they are ranked: they are those that the
+    library's default decoder accepts."""
+    validators.register_json_backend('strict', _strict_loads, priority = 1000)
+    assert validators.json_backends()[0] == 'strict'
+
+    try:
+        json_.loads(value)
+        expects = True
+    except ValueError:
+        expects = False
+
+    assert checkers.is_json(value) == expects
+    assert checkers.is_json(value.encode('utf-8')) == expects
+
+    validators.set_json_backend('strict')
+    assert not checkers.is_json(value)
+
+
+def _strict_loads(value):
+    def reject(constant):
+        raise ValueError('%s is not allowed' % constant)
+
+    result = json.loads(value, parse_constant = reject)
+    if u'\\ud800' in value:
+        raise ValueError('unpaired surrogate')
+
+    return result
+
+
+def test_json_backend_default():
+    """The default backend is the decoder the library has always used."""
+    assert validators.get_json_backend().name == json_.__name__
+    assert validators.get_json_backend()._loads is json_.loads
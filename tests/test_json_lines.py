@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_json_lines
+***********************************
+
+Tests for reading newline-delimited JSON sources.
+
+"""
+
+import io
+
+import pytest
+
+from validator_collection._json_lines import JSONLineResult, iter_lines, \
+    iter_range_lines, newline_ranges
+
+
+CONTENT = u'{"a": 1}\n\n  \n{"b": "\xe9"}\r\n[1]'
+
+EXPECTED = [(1, 0), (4, 13), (5, 26)]
+
+
+@pytest.mark.parametrize('source', [
+    lambda path: path,
+    lambda path: io.open(path, 'rb'),
+    lambda path: io.open(path, 'r', encoding = 'utf-8', newline = ''),
+    lambda path: io.BytesIO(CONTENT.encode('utf-8')),
+    lambda path: CONTENT.encode('utf-8').splitlines(True),
+    lambda path: CONTENT.splitlines(True),
+])
+def test_iter_lines(tmpdir, source):
+    path = str(tmpdir.join('lines.ndjson'))
+    with io.open(path, 'wb') as ndjson_file:
+        ndjson_file.write(CONTENT.encode('utf-8'))
+
+    lines = list(iter_lines(source(path)))
+    assert [(x[0], x[1]) for x in lines] == EXPECTED
+    assert [x[2].strip() for x in lines][-1] in (u'[1]', b'[1]')
+
+
+def test_iter_lines_unterminated_items():
+    lines = list(iter_lines([u'{"a": 1}', u'', u'{"b": "\xe9"}', u'[1]']))
+    assert [(x[0], x[1]) for x in lines] == [(1, 0), (3, 10), (4, 22)]
+
+
+def test_json_line_result():
+    assert JSONLineResult(1, 0, {}, None).is_valid
+    assert not JSONLineResult(1, 0, None, ValueError()).is_valid
+
+
+@pytest.mark.parametrize('range_size', [1, 2, 3, 5, 8, 100])
+def test_newline_ranges(range_size):
+    buffer = b'aa\nbbbb\n\nc\ndddddd'
+    ranges = newline_ranges(buffer, len(buffer), range_size)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(buffer)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert buffer[end - 1:end] == b'\n'
+    for start, end in ranges[:-1]:
+        assert end - start >= range_size or buffer[end - 1:end] == b'\n'
+
+
+def test_newline_ranges_empty():
+    assert newline_ranges(b'', 0, 10) == []
+
+
+def test_iter_range_lines():
+    buffer = b'aa\nbbbb\n\nc\ndddddd'
+    assert list(iter_range_lines(buffer, 8, len(buffer))) == [
+        (1, 8, b'\n'),
+        (2, 9, b'c\n'),
+        (3, 11, b'dddddd'),
+    ]
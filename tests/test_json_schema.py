@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_json_schema
+***********************************
+
+Tests for compiled JSON Schemas.
+
+"""
+
+import jsonschema
+import pytest
+
+from validator_collection import errors
+from validator_collection._json_schema import CompiledJSONSchema, FormatChecker
+
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'name': {'type': 'string'},
+        'age': {'type': 'integer', 'minimum': 0},
+    },
+    'required': ['name'],
+}
+
+
+@pytest.mark.parametrize('value, expects', [
+    ({'name': 'test'}, True),
+    ({'name': 'test', 'age': 3}, True),
+    ({'age': 3}, False),
+    ({'name': 'test', 'age': -1}, False),
+    ([], False),
+])
+def test_compiled_json_schema(value, expects):
+    compiled = CompiledJSONSchema(SCHEMA)
+    assert compiled.is_valid(value) is expects
+    if expects:
+        assert compiled.validate(value) is value
+    else:
+        with pytest.raises(errors.JSONValidationError):
+            compiled.validate(value)
+
+
+def test_compiled_json_schema_invalid_schema():
+    with pytest.raises(errors.NotJSONSchemaError):
+        CompiledJSONSchema({'type': 'not-a-type'})
+
+
+
+NATIVE_SCHEMAS = [
+    {'type': 'integer'},
+    {'$schema': 'http://json-schema.org/draft-04/schema#', 'type': 'integer'},
+    {'type': ['string', 'null']},
+    {'type': 'number', 'minimum': 0, 'maximum': 10},
+    {'type': 'boolean'},
+    {'minLength': 2, 'maxLength': 3},
+    {'pattern': '^a+$'},
+    {'enum': [1, 'a', None, [1, 2], {'a': 1}, False]},
+    {'enum': [True]},
+    {'type': 'array', 'items': {'type': 'integer', 'minimum': 1}},
+    {'type': 'object',
+     'title': 'An object',
+     'properties': {'a': {'type': 'string'}, 'b': True, 'c': False},
+     'required': ['a']},
+    {'items': {'enum': [0, 1]}},
+]
+
+VALUES = [None, True, False, 0, 1, 2, -1, 1.0, 1.5, 11, 'a', 'aa', 'aaa', 'aaaa',
+          'ab', '', [], [1], [0, 1], [1, 2], [True], {}, {'a': 1}, {'a': 'x'},
+          {'a': 'x', 'c': 1}, {'b': 1}]
+
+
+@pytest.mark.parametrize('schema', NATIVE_SCHEMAS)
+def test_compiled_json_schema_native_matches_jsonschema(schema):
+    native = CompiledJSONSchema(schema)
+    reference = CompiledJSONSchema(schema, native = False)
+    assert native.is_native
+    assert not reference.is_native
+
+    for value in VALUES:
+        assert native.is_valid(value) is reference.is_valid(value), value
+        try:
+            native.validate(value)
+            is_valid = True
+        except errors.JSONValidationError:
+            is_valid = False
+
+        assert is_valid is reference.is_valid(value), value
+
+
+@pytest.mark.parametrize('schema', [
+    {'additionalProperties': False},
+    {'properties': {'a': {'$ref': '#/definitions/a'}},
+     'definitions': {'a': {'type': 'string'}}},
+    {'$schema': 'http://json-schema.org/draft-04/schema#',
+     'items': [{'type': 'string'}]},
+    {'$schema': 'http://json-schema.org/draft-03/schema#', 'type': 'integer'},
+    {'type': 'object', 'properties': {'a': {'anyOf': [{'type': 'string'}]}}},
+])
+def test_compiled_json_schema_falls_back(schema):
+    assert not CompiledJSONSchema(schema).is_native
+
+
+def is_even_length(value):
+    if len(value) % 2:
+        raise ValueError('odd length')
+
+
+def test_format_checker():
+    checker = FormatChecker({'even': is_even_length}, maxsize = 8)
+    assert checker.conforms('ab', 'even')
+    assert not checker.conforms('abc', 'even')
+    assert checker.conforms(123, 'even')
+    assert checker.conforms('abc', 'unknown-format')
+    with pytest.raises(jsonschema.exceptions.FormatError) as error:
+        checker.check('abc', 'even')
+
+    assert checker.cache.info().hits == 1
+    assert checker.cache.info().misses == 2
+    assert 'even' in str(error.value)
+
+
+@pytest.mark.parametrize('native', [True, False])
+def test_compiled_json_schema_format_checker(native):
+    checker = FormatChecker({'even': is_even_length})
+    schema = {'properties': {'a': {'format': 'even'}}}
+    compiled = CompiledJSONSchema(schema, native = native, format_checker = checker)
+    unchecked = CompiledJSONSchema(schema, native = native)
+    assert compiled.is_native is native
+    assert compiled.is_valid({'a': 'ab'})
+    assert not compiled.is_valid({'a': 'abc'})
+    assert unchecked.is_valid({'a': 'abc'})
+    with pytest.raises(errors.JSONValidationError):
+        compiled.validate({'a': 'abc'})
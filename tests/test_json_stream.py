@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_json_stream
+***********************************
+
+Tests for reading the elements of a top-level JSON array.
+
+"""
+
+import io
+import json
+
+import pytest
+
+from validator_collection._json_stream import JSONArrayReader
+from validator_collection import errors
+
+
+CONTENT = u' [{"a": [1, {"b": "]}"}]}, "x\\"]", 1.5e3 ,null,\n[[]], {"\xe9": "\\\\"}] \n'
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+@pytest.mark.parametrize('encode', [False, True])
+def test_json_array_reader(chunk_size, encode):
+    content = CONTENT.encode('utf-8') if encode else CONTENT
+    elements = list(JSONArrayReader(io.BytesIO(content) if encode else io.StringIO(content),
+                                    chunk_size))
+
+    assert [x[0] for x in elements] == list(range(6))
+    assert [json.loads(x[2].decode('utf-8') if encode else x[2])
+            for x in elements] == json.loads(CONTENT)
+    for _, offset, element in elements:
+        assert content[offset:offset + len(element)] == element
+
+
+@pytest.mark.parametrize('content', ['[]', ' [\n] ', '[ 1 ]', '["a"]'])
+def test_json_array_reader_small(content):
+    assert [x[2] for x in JSONArrayReader(io.StringIO(content), 1)] == \
+        [x for x in content.strip('[] \n').split(',') if x.strip()]
+
+
+@pytest.mark.parametrize('content, message', [
+    (u'', 'expected [ at offset 0'),
+    (u'{"a": 1}', 'expected [ at offset 0'),
+    (u'[', 'expected a value'),
+    (u'[,1]', 'expected a value at offset 1'),
+    (u'[1,]', 'expected a value at offset 3'),
+    (u'[1 2]', 'expected , or ] at offset 3'),
+    (u'[1', 'unexpected end of data at offset 2'),
+    (u'[{"a": 1}', 'unexpected end of data'),
+    (u'["a', 'unexpected end of data at offset 1'),
+    (u'[1] 2', 'unexpected data after the array at offset 4'),
+])
+def test_json_array_reader_invalid(content, message):
+    with pytest.raises(errors.NotJSONError) as error:
+        list(JSONArrayReader(io.StringIO(content), 2))
+
+    assert message in str(error.value)
+
+
+def test_json_array_reader_is_lazy():
+    class TrackedBytesIO(io.BytesIO):
+        def read(self, size = -1):
+            assert size > 0
+            return io.BytesIO.read(self, size)
+
+    source = TrackedBytesIO(b'[' + b','.join([b'{"key": 1}'] * 10000) + b']')
+    elements = iter(JSONArrayReader(source, 64))
+    next(elements)
+    assert source.tell() <= 64
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_json_syntax
+***********************************
+
+Tests for checking the syntax of JSON documents without deserializing them.
+
+"""
+
+import json
+
+import pytest
+
+from validator_collection._json_syntax import check_json_syntax, _get_syntax, _RUN_LENGTH
+from validator_collection import checkers, errors, validators
+
+
+VALID = [
+    u'[]',
+    u' {}\n',
+    u'[1, -0.5, 2e10, 3E-2, true, false, null, "", "a\\"]\\u00e9\\n"]',
+    u'{"a": {"b": [{}, []]}, "c": [[1], {"d": null}], "\xe9": "\xe9"}',
+    u'[[[[]]], [[], {}], {"a": [{"b": {}}]}]',
+    u'[%s]' % ', '.join(['1'] * (_RUN_LENGTH * 3 + 1)),
+    u'{%s}' % ', '.join('"k%s": [%s]' % (x, x) for x in range(_RUN_LENGTH * 2)),
+]
+
+INVALID = [
+    u'',
+    u'1',
+    u'"a"',
+    u'null',
+    u'[',
+    u'{"a": 1',
+    u'[1,]',
+    u'[,1]',
+    u'[1 2]',
+    u'[[1], 2 3]',
+    u'[[1],]',
+    u'{"a"}',
+    u'{"a": 1,}',
+    u'{"a": 1 "b": 2}',
+    u'{1: 2}',
+    u'{"a": [1],}',
+    u'[01]',
+    u'[1.]',
+    u'[.5]',
+    u'[+1]',
+    u'[tru]',
+    u'[truex]',
+    u'[NaN]',
+    u'["a\x01"]',
+    u'["\\x"]',
+    u'[{]}',
+    u'[]]',
+    u'[] []',
+    u'{} x',
+]
+
+
+@pytest.mark.parametrize('value', VALID)
+@pytest.mark.parametrize('convert', [
+    lambda x: x,
+    lambda x: x.encode('utf-8'),
+    lambda x: bytearray(x.encode('utf-8')),
+    lambda x: memoryview(x.encode('utf-8')),
+], ids = ['str', 'bytes', 'bytearray', 'memoryview'])
+def test_check_json_syntax(value, convert):
+    json.loads(value)
+    check_json_syntax(convert(value))
+
+
+@pytest.mark.parametrize('value', INVALID)
+@pytest.mark.parametrize('encode', [False, True])
+def test_check_json_syntax_invalid(value, encode):
+    with pytest.raises(errors.NotJSONError):
+        check_json_syntax(value.encode('utf-8') if encode else value)
+
+
+def test_check_json_syntax_max_depth():
+    value = u'[1, {"a": [[]]}]'
+    check_json_syntax(value, max_depth = 4)
+    with pytest.raises(errors.JSONLimitError) as error:
+        check_json_syntax(value, max_depth = 3)
+
+    assert 'more than 3 levels deep at offset 11' in str(error.value)
+
+    deep = u'[' * 10000 + u']' * 10000
+    check_json_syntax(deep)
+    with pytest.raises(errors.JSONLimitError):
+        check_json_syntax(deep, max_depth = 100)
+
+
+@pytest.mark.parametrize('value, max_items, max_string_length, valid', [
+    (u'[1, 2, 3]', 3, None, True),
+    (u'[1, 2, 3]', 2, None, False),
+    (u'{"a": 1, "b": [1, 2]}', 2, None, True),
+    (u'{"a": 1, "b": [1, 2], "c": 3}', 2, None, False),
+    (u'[[1, 2, 3], [4]]', 2, None, False),
+    (u'[[[1, 2, 3]], 4]', 2, None, False),
+    (u'[[[[1, 2, 3]]], 4]', 3, None, True),
+    (u'["a,b", "c,d", "e,f"]', 3, None, True),
+    (u'[{"a": [1, 2]}, [3, 4], 5]', 3, None, True),
+    (u'[%s]' % ', '.join(['1'] * _RUN_LENGTH), _RUN_LENGTH, None, True),
+    (u'[%s]' % ', '.join(['1'] * (_RUN_LENGTH + 1)), _RUN_LENGTH, None, False),
+    (u'[%s]' % ', '.join(['[]'] * 1000), 1000, None, True),
+    (u'[%s]' % ', '.join(['[]'] * 1000), 999, None, False),
+    (u'[1, [2, [3, [4, 5, 6]], 7], 8, 9]', 3, None, False),
+    (u'[1, [2, [3, [4, 5, 6]], 7], 8]', 3, None, True),
+    (u'[[], {}]', 2, None, True),
+    (u'[]', 0, None, True),
+    (u'[1]', 0, None, False),
+    (u'["abc", {"de": "f"}]', None, 3, True),
+    (u'["abcd", {"de": "f"}]', None, 3, False),
+    (u'["abc", {"def": "ghij"}]', None, 3, False),
+    (u'["abc", {"defg": "h"}]', None, 3, False),
+    (u'["\\n\\u0041\\""]', None, 3, True),
+    (u'["", []]', None, 0, True),
+    (u'["a", []]', None, 0, False),
+    (u'[[[[["abcd"]]]]]', None, 3, False),
+])
+def test_check_json_syntax_limits(value, max_items, max_string_length, valid):
+    if valid:
+        check_json_syntax(value,
+                          max_items = max_items,
+                          max_string_length = max_string_length)
+    else:
+        with pytest.raises(errors.JSONLimitError):
+            check_json_syntax(value,
+                              max_items = max_items,
+                              max_string_length = max_string_length)
+
+    check_json_syntax(value)
+    check_json_syntax(value.encode('utf-8'),
+                      max_items = max_items if valid else None,
+                      max_string_length = max_string_length if valid else None)
+
+
+@pytest.mark.parametrize('value, length, length_in_bytes', [
+    (u'"a\\u0041"', 2, 2),
+    (u'"\\u00e9"', 1, 2),
+    (u'"\u00e9"', 1, 2),
+    (u'"\\u07FF\\u0800"', 2, 5),
+    (u'"\\u4e00"', 1, 3),
+    (u'"\\ud83d\\ude00"', 1, 4),
+    (u'"\\uD83D\\uDE00\\ud83d"', 2, 7),
+    (u'"\\udc00\\ud83d"', 2, 6),
+])
+def test_check_json_syntax_string_length(value, length, length_in_bytes):
+    # Strings are measured as they are decoded, so that a document is within
+    # the same limits when it is deserialized before it is checked.
+    document = u'[%s, {%s: 1}]' % (value, value)
+    deserialized = json.loads(document)
+    for item, expected in ((document, length),
+                           (document.encode('utf-8'), length_in_bytes)):
+        is_bytes = isinstance(item, bytes)
+
+        check_json_syntax(item, max_string_length = expected)
+        validators._check_deserialized_json_limits(deserialized, None, None, expected,
+                                                   is_bytes = is_bytes)
+
+        with pytest.raises(errors.JSONLimitError):
+            check_json_syntax(item, max_string_length = expected - 1)
+        with pytest.raises(errors.JSONLimitError):
+            validators._check_deserialized_json_limits(deserialized, None, None,
+                                                       expected - 1,
+                                                       is_bytes = is_bytes)
+
+
+def test_check_json_syntax_limits_fail_fast():
+    # The document is not well-formed, but only after the part that exceeds
+    # the limit.
+    value = u'[1, "abcdef", [%s], ' % ', '.join(['1'] * 1000)
+    with pytest.raises(errors.JSONLimitError) as error:
+        check_json_syntax(value, max_string_length = 5)
+
+    assert 'at offset 4' in str(error.value)
+
+    with pytest.raises(errors.JSONLimitError) as error:
+        check_json_syntax(value, max_items = 100)
+
+    with pytest.raises(errors.NotJSONError):
+        check_json_syntax(value, max_items = 1000, max_string_length = 6)
+
+
+def test_get_syntax_large_max_items():
+    unlimited = _get_syntax(False)
+
+    assert _get_syntax(False, max_items = _RUN_LENGTH + 1) is unlimited
+    assert _get_syntax(False, max_items = 100000) is unlimited
+    assert _get_syntax(False, max_items = _RUN_LENGTH) is not unlimited
+    assert _get_syntax(False, 100000, 5) is _get_syntax(False, None, 5)
+
+    value = u'[%s]' % ', '.join(['1'] * 1000)
+    assert check_json_syntax(value, max_items = 1000) is None
+    with pytest.raises(errors.JSONLimitError):
+        check_json_syntax(value, max_items = 999)
+
+
+def test_json_syntax_only():
+    value = b'{"a": [1, 2]}'
+    assert validators.json(value, syntax_only = True) is value
+    assert validators.json(u'[[]]', syntax_only = True, max_depth = 2) == u'[[]]'
+    assert validators.json([1], syntax_only = True) == [1]
+    assert validators.json(b'', syntax_only = True, allow_empty = True) is None
+
+    with pytest.raises(errors.JSONLimitError):
+        validators.json(u'[[]]', syntax_only = True, max_depth = 1)
+    with pytest.raises(errors.NotJSONError):
+        validators.json(123, syntax_only = True)
+    with pytest.raises(errors.ValidatorUsageError):
+        validators.json(u'{}', {'type': 'object'}, syntax_only = True)
+
+    assert checkers.is_json(memoryview(b'[1]'), syntax_only = True)
+    assert not checkers.is_json(u'[1,]', syntax_only = True)
+    assert not checkers.is_json(u'[[]]', syntax_only = True, max_depth = 1)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_public_suffix
+***********************************
+
+Tests for the public suffix trie.
+
+"""
+
+import pytest
+
+from validator_collection import _public_suffix
+
+
+SOURCE = u"""// ===BEGIN ICANN DOMAINS===
+com
+uk
+co.uk
+*.ck
+!www.ck
+рф
+// ===END ICANN DOMAINS===
+// ===BEGIN PRIVATE DOMAINS===
+github.io
+// ===END PRIVATE DOMAINS===
+"""
+
+
+@pytest.mark.parametrize('include_private, expects', [
+    (False, {u'com': 1,
+             u'uk': {u'.': 1, u'co': 1},
+             u'ck': {u'*': 1, u'!www': 1},
+             u'рф': 1,
+             u'xn--p1ai': 1}),
+    (True, {u'com': 1,
+            u'uk': {u'.': 1, u'co': 1},
+            u'ck': {u'*': 1, u'!www': 1},
+            u'рф': 1,
+            u'xn--p1ai': 1,
+            u'io': {u'github': 1}}),
+])
+def test_build_trie(include_private, expects):
+    result = _public_suffix.build_trie(SOURCE.splitlines(),
+                                       include_private = include_private)
+    assert result == expects
+
+
+@pytest.mark.parametrize('value, expects', [
+    ('example.com', 1),
+    ('www.example.co.uk', 2),
+    ('co.uk', 2),
+    ('www.ck', 1),
+    ('example.ck', 2),
+    ('www.example.ck', 2),
+    ('example.notatld', 0),
+    ('notatld', 0),
+])
+def test_public_suffix_length(value, expects):
+    result = _public_suffix.public_suffix_length(value.split('.'))
+    assert result == expects
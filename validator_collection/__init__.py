@@ -21,14 +21,18 @@ __version__ = version_dict.get('__version__')
 from validator_collection.validators import bytesIO, date, dict, decimal, \
     directory_exists, datetime, email, float, fraction, file_exists, ip_address, \
     ipv4, ipv6, integer, iterable, mac_address, none, numeric, not_empty, path, \
-    path_exists, string, stringIO, time, timezone, url, uuid, variable_name, domain
+    path_exists, string, stringIO, time, timezone, url, uuid, variable_name, domain, \
+    email_batch, ip_network, ipv4_batch, ipv6_batch, \
+    mac_address_batch, uuid_batch, json_lines, json_lines_parallel, \
+    json_array_elements
 
 from validator_collection.checkers import is_between, has_length, is_uuid, is_email,\
     is_url, is_string, is_iterable, is_datetime, is_date, is_time, is_timezone, \
     is_not_empty, is_none, is_numeric, is_decimal, is_float, is_integer, is_fraction,\
     is_variable_name, is_ipv4, is_ipv6, is_ip_address, is_mac_address, is_dict, \
     is_stringIO, is_bytesIO, is_pathlike, is_on_filesystem, is_file, is_directory, \
-    is_type, are_dicts_equivalent, are_equivalent, is_domain
+    is_type, are_dicts_equivalent, are_equivalent, is_domain, is_email_batch, \
+    is_ip_network
 
 __all__ = [
     'bytesIO',
@@ -38,16 +42,24 @@ __all__ = [
     'directory_exists',
     'datetime',
     'email',
+    'email_batch',
     'float',
     'fraction',
     'file_exists',
     'ip_address',
+    'ip_network',
     'ipv4',
+    'ipv4_batch',
     'ipv6',
+    'ipv6_batch',
     'integer',
     'iterable',
+    'json_lines',
+    'json_lines_parallel',
+    'json_array_elements',
     'domain',
     'mac_address',
+    'mac_address_batch',
     'none',
     'not_empty',
     'path',
@@ -58,12 +70,14 @@ __all__ = [
     'timezone',
     'url',
     'uuid',
+    'uuid_batch',
     'variable_name',
 
     'is_between',
     'has_length',
     'is_uuid',
     'is_email',
+    'is_email_batch',
     'is_url',
     'is_string',
     'is_iterable',
@@ -82,6 +96,7 @@ __all__ = [
     'is_ipv4',
     'is_ipv6',
     'is_ip_address',
+    'is_ip_network',
     'is_mac_address',
     'is_domain',
     'is_dict',
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._batch
+****************************************
+
+Vectorized parsing of values held in `NumPy <https://numpy.org/>`_ arrays,
+used by the batch validators such as
+:func:`ipv4_batch() <validator_collection.validators.ipv4_batch>`.
+
+Values are parsed from a two-dimensional array of character codes (one row
+per value, padded on the right with zeros), one column at a time, so that
+each step operates on every value at once.
+
+"""
+
+from validator_collection._compat import numpy_
+
+UUID_HYPHEN_COLUMNS = [8, 13, 18, 23]
+UUID_HEX_COLUMNS = [x for x in range(36) if x not in UUID_HYPHEN_COLUMNS]
+
+
+def character_codes(values):
+    """Return the character codes of the one-dimensional
+    :class:`bytes <python:bytes>` or :class:`str <python:str>` array
+    ``values``.
+
+    :rtype: two-dimensional :class:`numpy.ndarray` of ``uint8`` (for bytes)
+      or ``uint32`` (for strings), with one row per item in ``values``
+    """
+    values = numpy_.ascontiguousarray(values)
+    if values.dtype.kind == 'S':
+        code_type = numpy_.uint8
+    else:
+        code_type = numpy_.uint32
+
+    width = values.dtype.itemsize // numpy_.dtype(code_type).itemsize
+
+    return values.view(code_type).reshape(len(values), width)
+
+
+def ipv4_to_int(codes):
+    """Parse the IP version 4 addresses whose character codes are ``codes``.
+
+    Applies the same rules as
+    :func:`ipv4() <validator_collection.validators.ipv4>` to addresses made up
+    of ASCII characters. Addresses that contain other characters are reported
+    separately, so that the caller can check them individually.
+
+    :param codes: The character codes, as returned by :func:`character_codes`.
+    :type codes: :class:`numpy.ndarray`
+
+    :returns: A ``uint32`` array of the parsed addresses (``0`` where not
+      valid), a boolean array indicating which addresses are valid, and a
+      boolean array indicating which addresses contain non-ASCII characters.
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+    """
+    count, width = codes.shape
+    rows = numpy_.arange(count)
+
+    is_digit = (codes >= 48) & (codes <= 57)
+    is_dot = codes == 46
+    is_padding = codes == 0
+    is_non_ascii = (codes > 127).any(axis = 1)
+
+    length = width - is_padding.sum(axis = 1)
+    first_padding = numpy_.where(is_padding.any(axis = 1),
+                                 is_padding.argmax(axis = 1),
+                                 width)
+
+    is_valid = (length > 0) & (first_padding == length)
+    is_valid &= (is_digit | is_dot).sum(axis = 1) == length
+    is_valid &= is_dot.sum(axis = 1) == 3
+    if width:
+        is_valid &= ~is_dot[:, 0]
+        is_valid &= ~is_dot[rows, numpy_.maximum(length - 1, 0)]
+    if width > 1:
+        is_valid &= ~(is_dot[:, 1:] & is_dot[:, :-1]).any(axis = 1)
+
+    # Octets are accumulated one column (i.e. one digit) at a time, and capped at
+    # 256 so that long runs of digits cannot overflow.
+    component = numpy_.minimum(numpy_.cumsum(is_dot, axis = 1), 3)
+    octets = numpy_.zeros((count, 4), dtype = numpy_.int32)
+    for column in range(width):
+        position = component[:, column]
+        current = octets[rows, position]
+        digit = codes[:, column].astype(numpy_.int32) - 48
+        octets[rows, position] = numpy_.where(is_digit[:, column],
+                                              numpy_.minimum(current * 10 + digit,
+                                                             256),
+                                              current)
+
+    is_valid &= (octets <= 255).all(axis = 1)
+    octets[~is_valid] = 0
+    octets = octets.astype(numpy_.uint32)
+
+    packed = (octets[:, 0] << 24) | (octets[:, 1] << 16) | \
+        (octets[:, 2] << 8) | octets[:, 3]
+
+    return packed, is_valid, is_non_ascii
+
+
+def uuid_to_bytes(codes):
+    """Parse the UUIDs in their canonical, hyphenated form (e.g.
+    ``123e4567-e89b-12d3-a456-426655440000``) whose character codes are
+    ``codes``.
+
+    UUIDs in any other form are reported as not valid, so that the caller can
+    check them individually.
+
+    :param codes: The character codes, as returned by :func:`character_codes`.
+    :type codes: :class:`numpy.ndarray`
+
+    :returns: A ``uint8`` array with the 16 bytes of each parsed UUID (``0``
+      where not valid), and a boolean array indicating which UUIDs are valid.
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+    """
+    count, width = codes.shape
+    packed = numpy_.zeros((count, 16), dtype = numpy_.uint8)
+    if width < 36:
+        return packed, numpy_.zeros(count, dtype = numpy_.bool_)
+
+    is_canonical = (codes[:, UUID_HYPHEN_COLUMNS] == 45).all(axis = 1)
+    if width > 36:
+        is_canonical &= (codes[:, 36:] == 0).all(axis = 1)
+
+    digits = codes[:, UUID_HEX_COLUMNS].astype(numpy_.int32)
+    lowercase = digits | 32
+    is_decimal = (digits >= 48) & (digits <= 57)
+    is_letter = (lowercase >= 97) & (lowercase <= 102)
+
+    is_valid = is_canonical & (is_decimal | is_letter).all(axis = 1)
+
+    nibbles = numpy_.where(is_decimal, digits - 48, lowercase - 87)
+    nibbles[~is_valid] = 0
+    packed[:] = (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+
+    return packed, is_valid
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._cache
+****************************************
+
+Defines the bounded least-recently-used cache used to memoize the results of
+expensive validation steps.
+
+"""
+
+from collections import namedtuple, OrderedDict
+
+
+class CacheInfo(namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])):
+    """The statistics of a :class:`LRUCache`."""
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """The share of lookups that found a cached value, between ``0.0`` and
+        ``1.0``.
+
+        :rtype: :class:`float <python:float>`
+        """
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+
+        return self.hits / float(lookups)
+
+
+class LRUCache(object):
+    """A bounded mapping that discards its least-recently-used entry when full.
+
+    .. note::
+
+      The cache does not lock on access. Concurrent access from multiple threads
+      is safe in the sense that it will never corrupt the cache, but it may
+      occasionally record a miss for a key that another thread just evicted.
+
+    """
+
+    def __init__(self, maxsize = 128):
+        """Create an instance of a :class:`LRUCache`.
+
+        :param maxsize: The maximum number of entries to hold.
+        :type maxsize: :class:`int <python:int>`
+
+        """
+        if not maxsize or maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default = None):
+        """Return the value cached for ``key``, or ``default`` if it is not cached.
+
+        Marks ``key`` as the most-recently-used entry.
+        """
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._data[key] = value
+        self.hits += 1
+
+        return value
+
+    def set(self, key, value):
+        """Cache ``value`` for ``key``, evicting the least-recently-used entry if
+        the cache is full."""
+        data = self._data
+        data.pop(key, None)
+        data[key] = value
+        while len(data) > self.maxsize:
+            try:
+                data.popitem(last = False)
+            except KeyError:
+                break
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """The share of lookups that found a cached value, between ``0.0`` and
+        ``1.0``.
+
+        :rtype: :class:`float <python:float>`
+        """
+        return self.info().hit_rate
+
+    def info(self):
+        """Return the cache's statistics.
+
+        :rtype: :class:`CacheInfo` named tuple of ``hits``, ``misses``,
+          ``maxsize``, and ``currsize``
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -35,6 +35,21 @@ try:
 except ImportError:
     import json as json_
 
+try:
+    import idna as idna_
+except ImportError:
+    idna_ = None
+
+try:
+    import ipaddress as ipaddress_
+except ImportError:
+    ipaddress_ = None
+
+try:
+    import numpy as numpy_
+except ImportError:
+    numpy_ = None
+
 uses_float_infinity = (is_py2 or is_py34 or is_py33 or is_py32 or is_py31 or is_py30)
 
 if uses_float_infinity:
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._ip_index
+****************************************
+
+Defines the index used to test whether an IP address falls within any of a
+(potentially large) collection of IP networks.
+
+"""
+
+from bisect import bisect_right
+
+# The range of IP version 6 addresses (``::ffff:0:0/96``) that map IP version 4
+# addresses.
+_IPV4_MAPPED_FIRST = 0xffff << 32
+_IPV4_MAPPED_LAST = _IPV4_MAPPED_FIRST | 0xffffffff
+
+
+class IPNetworkIndex(object):
+    """A collection of IP networks, compiled for fast membership tests.
+
+    Each IP version's networks are held as a sorted list of non-overlapping
+    integer intervals, so that testing whether an address falls within any of
+    them is a binary search rather than a comparison against every network.
+
+    .. hint::
+
+      Instances are created by
+      :func:`compile_ip_networks() <validator_collection.validators.compile_ip_networks>`,
+      and can be reused across any number of calls to
+      :func:`ip_address() <validator_collection.validators.ip_address>`.
+
+    """
+
+    def __init__(self, ipv4_intervals = (), ipv6_intervals = ()):
+        """Create an instance of a :class:`IPNetworkIndex`.
+
+        :param ipv4_intervals: The ``(first, last)`` integer addresses of each
+          IP version 4 network.
+        :type ipv4_intervals: iterable of :class:`tuple <python:tuple>`
+
+        :param ipv6_intervals: The ``(first, last)`` integer addresses of each
+          IP version 6 network.
+        :type ipv6_intervals: iterable of :class:`tuple <python:tuple>`
+
+        """
+        self._starts = {}
+        self._ends = {}
+        for version, intervals in ((4, ipv4_intervals), (6, ipv6_intervals)):
+            starts = []
+            ends = []
+            for first, last in sorted(intervals):
+                if ends and first <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], last)
+                else:
+                    starts.append(first)
+                    ends.append(last)
+
+            self._starts[version] = starts
+            self._ends[version] = ends
+
+    def __len__(self):
+        return len(self._starts[4]) + len(self._starts[6])
+
+    def __repr__(self):
+        return '<IPNetworkIndex: %s IPv4 / %s IPv6 intervals>' % (len(self._starts[4]),
+                                                               len(self._starts[6]))
+
+    def contains(self, version, address):
+        """Indicate whether ``address`` falls within any of the indexed networks.
+
+        An IPv4-mapped IP version 6 address (e.g. ``::ffff:10.0.0.1``) falls
+        within a network if either it or the IP version 4 address it maps does.
+
+        :param version: The IP version of ``address`` (``4`` or ``6``).
+        :type version: :class:`int <python:int>`
+
+        :param address: The address, as an integer.
+        :type address: :class:`int <python:int>`
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        if version == 6 and _IPV4_MAPPED_FIRST <= address <= _IPV4_MAPPED_LAST and \
+           self._contains(4, address & 0xffffffff):
+            return True
+
+        return self._contains(version, address)
+
+    def _contains(self, version, address):
+        position = bisect_right(self._starts[version], address) - 1
+
+        return position >= 0 and address <= self._ends[version][position]
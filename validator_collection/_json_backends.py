@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._json_backends
+****************************************
+
+Defines the registry of JSON decoders that validators use to deserialize JSON.
+
+The registry is opt-in only. Unless another backend is selected, validators use
+the same decoder they always have: ``simplejson`` if it is installed, and
+otherwise the standard library's :mod:`json <python:json>`. Other decoders
+accept and reject different documents (e.g. ``orjson`` rejects ``NaN`` and
+unpaired surrogates, which :mod:`json <python:json>` accepts), so selecting one
+automatically would make validation depend on which packages happen to be
+installed.
+
+"""
+
+import codecs
+import timeit
+from collections import OrderedDict
+from importlib import import_module
+
+from validator_collection._compat import is_py2, is_py36, json_
+
+
+class JSONBackend(object):
+    """A JSON decoder registered with
+    :func:`register_json_backend() <validator_collection.validators.register_json_backend>`.
+
+    A backend can be supplied as the ``json_serializer`` argument of any validator
+    that accepts one.
+
+    """
+
+    def __init__(self, name, loads, bytes_types = (), priority = 0):
+        """Create an instance of a :class:`JSONBackend`.
+
+        :param name: The name of the backend.
+        :type name: :class:`str <python:str>`
+
+        :param loads: A callable that deserializes a JSON document.
+        :type loads: callable
+
+        :param bytes_types: The bytes-like types that ``loads`` accepts without
+          them being decoded first.
+        :type bytes_types: :class:`tuple <python:tuple>` of types
+
+        :param priority: The rank of the backend in
+          :func:`json_backends() <validator_collection.validators.json_backends>`.
+        :type priority: :class:`int <python:int>`
+
+        """
+        self.name = name
+        self.bytes_types = tuple(bytes_types)
+        self.priority = priority
+        self._loads = loads
+
+    def __repr__(self):
+        return '<JSONBackend %s>' % self.name
+
+    def loads(self, value):
+        """Deserialize the JSON document in ``value``.
+
+        A bytes-like ``value`` is passed to the backend as it is if the backend
+        accepts its type, and is otherwise decoded as UTF-8 first.
+
+        :param value: The JSON document.
+        :type value: :class:`str <python:str>` / :class:`bytes <python:bytes>` /
+          :class:`bytearray <python:bytearray>` /
+          :class:`memoryview <python:memoryview>`
+
+        :returns: The deserialized value.
+        """
+        if isinstance(value, (bytes, bytearray, memoryview)) and \
+           not isinstance(value, self.bytes_types):
+            value = codecs.decode(value, 'utf-8')
+
+        return self._loads(value)
+
+
+_BACKENDS = {}
+_DEFAULT = json_.__name__
+_SELECTED = None
+
+
+def register_json_backend(name, loads, bytes_types = (), priority = 0):
+    """Register a JSON decoder, so that it can be selected with
+    :func:`set_json_backend() <validator_collection.validators.set_json_backend>`.
+
+    Registering a backend with the name of one already registered replaces it.
+
+    :param name: The name of the backend.
+    :type name: :class:`str <python:str>`
+
+    :param loads: A callable that deserializes a JSON document, raising an
+      exception if it is not valid JSON.
+    :type loads: callable
+
+    :param bytes_types: The bytes-like types (e.g. :class:`bytes <python:bytes>`)
+      that ``loads`` accepts without them being decoded first. Defaults to none.
+    :type bytes_types: :class:`tuple <python:tuple>` of types
+
+    :param priority: The rank of the backend in
+      :func:`json_backends() <validator_collection.validators.json_backends>`,
+      where higher ranks are listed first. The built-in backends are ranked by
+      their throughput in published benchmarks, between ``0`` (the standard
+      library's :mod:`json <python:json>`) and ``40`` (``orjson``). The rank
+      does not affect which backend validators use. Defaults to ``0``.
+    :type priority: :class:`int <python:int>`
+
+    :returns: The registered backend.
+    :rtype: :class:`JSONBackend`
+
+    :raises ValueError: if ``loads`` is not callable
+    """
+    if not callable(loads):
+        raise ValueError('loads (%s) is not callable' % loads)
+
+    backend = JSONBackend(name, loads, bytes_types = bytes_types, priority = priority)
+    _BACKENDS[name] = backend
+
+    return backend
+
+
+def _register_module(name, bytes_types, priority):
+    """Register the ``loads()`` of the module ``name`` as a backend, if the
+    module is installed."""
+    try:
+        module = import_module(name)
+    except ImportError:
+        return
+
+    register_json_backend(name, module.loads, bytes_types = bytes_types, priority = priority)
+
+
+def json_backends():
+    """Return the names of the registered JSON backends, highest ``priority``
+    first.
+
+    The built-in backends are ranked by a fixed table of their throughput in
+    published benchmarks, not by timing them on this machine (see
+    :func:`benchmark_json_backends() <validator_collection.validators.benchmark_json_backends>`
+    for that). So the first is the fastest installed backend in the usual case.
+
+    :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+    """
+    return [x.name for x in sorted(_BACKENDS.values(),
+                                   key = lambda x: x.priority,
+                                   reverse = True)]
+
+
+def get_json_backend(name = None):
+    """Return a registered JSON backend.
+
+    :param name: The name of the backend to return. If not supplied, returns the
+      backend set with
+      :func:`set_json_backend() <validator_collection.validators.set_json_backend>`,
+      or (if none has been set) ``simplejson`` if it is installed, and otherwise
+      the standard library's :mod:`json <python:json>`.
+    :type name: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :rtype: :class:`JSONBackend`
+
+    :raises ValueError: if no backend named ``name`` has been registered
+    """
+    if name is None:
+        if _SELECTED is not None:
+            return _SELECTED
+
+        name = _DEFAULT
+
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError('no JSON backend named %s is registered' % name)
+
+
+def set_json_backend(name = None):
+    """Set the JSON backend that validators use when they are not supplied a
+    ``json_serializer``.
+
+    .. caution::
+
+      Backends differ in which documents they accept, as well as in how quickly
+      they deserialize them. For example, ``orjson`` rejects ``NaN``,
+      ``Infinity``, and unpaired surrogates (``"\\ud800"``), which the standard
+      library's :mod:`json <python:json>` accepts.
+
+    :param name: The name of a registered backend. If
+      :obj:`None <python:None>`, ``simplejson`` will be used if it is installed,
+      and otherwise the standard library's :mod:`json <python:json>`. Defaults
+      to :obj:`None <python:None>`.
+
+      .. hint::
+
+        To use the fastest installed backend, supply
+        ``json_backends()[0]``.
+    :type name: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :returns: The backend that will be used.
+    :rtype: :class:`JSONBackend`
+
+    :raises ValueError: if no backend named ``name`` has been registered
+    """
+    global _SELECTED                                                            # pylint: disable=W0603
+
+    _SELECTED = None
+    if name is not None:
+        _SELECTED = get_json_backend(name)
+
+    return get_json_backend()
+
+
+_BENCHMARK_DOCUMENT = (
+    '[%s]' % ', '.join('{"id": %s, "name": "name %s", "score": %s.5, '
+                       '"tags": ["a", "b"], "active": true, "parent": null}' % (x, x, x)
+                       for x in range(100))
+)
+
+
+def benchmark_json_backends(value = None, number = 100):
+    """Time how long each registered JSON backend takes to deserialize a
+    document.
+
+    :param value: The JSON document to deserialize. If not supplied, uses an
+      array of 100 small objects.
+    :type value: :class:`str <python:str>` / :class:`bytes <python:bytes>`
+
+    :param number: The number of times each backend deserializes ``value``.
+      Defaults to ``100``.
+    :type number: :class:`int <python:int>`
+
+    :returns: The total number of seconds each backend took, keyed by its name,
+      fastest first. A backend that cannot deserialize ``value`` is omitted.
+    :rtype: :class:`OrderedDict <python:collections.OrderedDict>`
+
+    .. note::
+
+      The timings are only reported, and do not affect which backend
+      validators use.
+
+    """
+    if value is None:
+        value = _BENCHMARK_DOCUMENT
+
+    timings = []
+    for backend in _BACKENDS.values():
+        try:
+            backend.loads(value)
+        except Exception:
+            continue
+
+        timings.append((backend.name,
+                        timeit.timeit(lambda: backend.loads(value), number = number)))
+
+    return OrderedDict(sorted(timings, key = lambda x: x[1]))
+
+
+# The built-in backends are ranked by their relative throughput in published
+# benchmarks.
+_register_module('json',
+                 bytes_types = (bytes, bytearray) if is_py36 else (bytes,) if is_py2 else (),
+                 priority = 0)
+_register_module('simplejson', bytes_types = (bytes,), priority = 10)
+_register_module('ujson', bytes_types = (bytes,), priority = 20)
+_register_module('rapidjson', bytes_types = (bytes, bytearray), priority = 30)
+_register_module('orjson', bytes_types = (bytes, bytearray, memoryview), priority = 40)
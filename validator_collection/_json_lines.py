@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._json_lines
+****************************************
+
+Reads the lines of a `newline-delimited JSON <https://github.com/ndjson/ndjson-spec>`_
+(a.k.a. `JSON Lines <https://jsonlines.org/>`_) source one at a time, keeping
+track of the number and byte offset of each.
+
+"""
+
+import io
+from collections import namedtuple
+
+from validator_collection._compat import basestring, bytes
+
+
+class JSONLineResult(namedtuple('JSONLineResult', ['line_number',
+                                                   'offset',
+                                                   'value',
+                                                   'error'])):
+    """The result of validating one line of a newline-delimited JSON source.
+
+    * ``line_number`` is the (1-based) number of the line.
+    * ``offset`` is the position of the start of the line, in bytes from the
+      start of the source.
+    * ``value`` is the line's deserialized value, or :obj:`None <python:None>`
+      if it could not be deserialized.
+    * ``error`` is the :class:`ValueError <python:ValueError>` or
+      :class:`TypeError <python:TypeError>` the line failed validation with, or
+      :obj:`None <python:None>` if the line is valid.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        """``True`` if the line is valid, ``False`` if not.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return self.error is None
+
+
+def iter_lines(source, encoding = 'utf-8'):
+    """Yield a ``(line_number, offset, line)`` :class:`tuple <python:tuple>` for
+    each line of ``source`` that is not blank.
+
+    Only one line is held in memory at a time.
+
+    :param source: The path of a file to read, a file object, or an iterable of
+      lines. If ``source`` is a path, the file is opened (in binary mode) when
+      the first line is requested, and closed once the last has been read or
+      the iterator is closed.
+    :type source: :class:`str <python:str>` / file object / iterable of
+      :class:`bytes <python:bytes>` or :class:`str <python:str>`
+
+    :param encoding: The encoding used to measure the offset of text lines,
+      if ``source`` does not declare its own. Defaults to ``'utf-8'``.
+    :type encoding: :class:`str <python:str>`
+
+    :rtype: iterator of :class:`tuple <python:tuple>`
+    """
+    if isinstance(source, basestring) or hasattr(source, '__fspath__'):
+        with io.open(source, 'rb') as source_file:
+            for result in iter_lines(source_file):
+                yield result
+
+        return
+
+    encoding = getattr(source, 'encoding', None) or encoding
+    offset = 0
+    for line_number, line in enumerate(source, 1):
+        if isinstance(line, bytes):
+            length = len(line)
+            is_terminated = line.endswith(b'\n')
+        else:
+            length = len(line.encode(encoding))
+            is_terminated = line.endswith(u'\n')
+
+        if line.strip():
+            yield line_number, offset, line
+
+        # Items of an iterable need not end with a newline, but are read as if
+        # they did.
+        offset += length + (0 if is_terminated else 1)
+
+
+def newline_ranges(buffer, size, range_size):
+    """Split the first ``size`` bytes of ``buffer`` into ``(start, end)`` byte
+    ranges of (roughly) ``range_size`` bytes, each of which ends just after a
+    newline (or at the end of ``buffer``).
+
+    :param buffer: The buffer to split, e.g. a memory-mapped file.
+    :type buffer: :class:`mmap <python:mmap.mmap>` / :class:`bytes <python:bytes>`
+
+    :param size: The number of bytes in ``buffer``.
+    :type size: :class:`int <python:int>`
+
+    :param range_size: The minimum size of each range but the last.
+    :type range_size: :class:`int <python:int>`
+
+    :rtype: :class:`list <python:list>` of :class:`tuple <python:tuple>`
+    """
+    ranges = []
+    start = 0
+    while start < size:
+        end = start + range_size
+        if end < size:
+            newline = buffer.find(b'\n', end - 1)
+            end = size if newline < 0 else newline + 1
+        else:
+            end = size
+
+        ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def iter_range_lines(buffer, start, end):
+    """Yield a ``(line_number, offset, line)`` :class:`tuple <python:tuple>` for
+    each line (including blank lines) in the byte range ``start`` to ``end`` of
+    ``buffer``, numbering the lines from ``1`` at ``start``.
+
+    :param buffer: The buffer to read, e.g. a memory-mapped file.
+    :type buffer: :class:`mmap <python:mmap.mmap>` / :class:`bytes <python:bytes>`
+
+    :rtype: iterator of :class:`tuple <python:tuple>`
+    """
+    line_number = 0
+    position = start
+    while position < end:
+        newline = buffer.find(b'\n', position, end)
+        line_end = end if newline < 0 else newline + 1
+        line_number += 1
+
+        yield line_number, position, buffer[position:line_end]
+
+        position = line_end
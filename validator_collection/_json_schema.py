@@ -0,0 +1,505 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._json_schema
+****************************************
+
+Defines the compiled form of a JSON Schema, which can be reused to validate any
+number of values without checking the schema itself again.
+
+Schemas that only use the keywords in :data:`NATIVE_KEYWORDS` (and the
+annotations in :data:`ANNOTATION_KEYWORDS`) are compiled into a tree of
+closures, each of which checks a single keyword directly against the
+deserialized value. Any other schema is validated by a ``jsonschema`` validator
+instead.
+
+"""
+
+import numbers
+import re
+
+import jsonschema
+
+from validator_collection._cache import LRUCache
+from validator_collection._compat import str as text_type, builtin_str, dict_, \
+    integer_types
+from validator_collection import errors
+
+#: The keywords that can be compiled into native checks.
+NATIVE_KEYWORDS = frozenset([
+    'type',
+    'properties',
+    'required',
+    'items',
+    'minimum',
+    'maximum',
+    'minLength',
+    'maxLength',
+    'enum',
+    'pattern',
+    'format',
+])
+
+#: Keywords that do not affect validation, and so can be ignored by native
+#: checks.
+ANNOTATION_KEYWORDS = frozenset([
+    '$schema',
+    '$id',
+    'id',
+    '$comment',
+    'title',
+    'description',
+    'default',
+    'examples',
+    'example',
+    'readOnly',
+    'writeOnly',
+    'deprecated',
+])
+
+TEXT_TYPES = tuple(set([text_type, builtin_str]))
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised internally when a schema cannot be compiled into native checks."""
+    pass
+
+
+class FormatChecker(jsonschema.FormatChecker):
+    """A ``jsonschema`` format checker that checks each format using a
+    validator function, and caches its verdicts.
+
+    .. hint::
+
+      :func:`json() <validator_collection.validators.json>` uses a shared
+      instance that checks the ``email``, ``uri``, ``ipv4``, ``ipv6``,
+      ``date-time``, ``date``, ``time``, and ``uuid`` formats using the
+      corresponding validators in this library.
+
+    As with ``jsonschema``, formats only apply to strings: any other value
+    conforms to every format.
+
+    """
+
+    def __init__(self, formats = None, maxsize = 4096):
+        """Create an instance of a :class:`FormatChecker`.
+
+        :param formats: A mapping of format names to the validators that check
+          them. A validator is passed the string to check, and should raise a
+          :class:`ValueError <python:ValueError>` or
+          :class:`TypeError <python:TypeError>` if it does not conform.
+        :type formats: :class:`dict <python:dict>` / :obj:`None <python:None>`
+
+        :param maxsize: The maximum number of verdicts to cache. Defaults to
+          ``4096``.
+        :type maxsize: :class:`int <python:int>`
+
+        """
+        super(FormatChecker, self).__init__(formats = ())
+        self.cache = LRUCache(maxsize = maxsize)
+        for format_, validator in (formats or {}).items():
+            self.checks(format_, raises = (ValueError, TypeError))(_conforms_to(validator))
+
+    def check(self, instance, format):                                          # pylint: disable=W0622
+        """Check that ``instance`` conforms to ``format``.
+
+        :raises FormatError: if ``instance`` does not conform to ``format``
+        """
+        if format not in self.checkers or not isinstance(instance, TEXT_TYPES):
+            return
+
+        key = (format, instance)
+        verdict = self.cache.get(key)
+        cause = None
+        if verdict is None:
+            func, raises = self.checkers[format]
+            try:
+                verdict = bool(func(instance))
+            except raises as error:
+                verdict = False
+                cause = error
+
+            self.cache.set(key, verdict)
+
+        if not verdict:
+            raise jsonschema.exceptions.FormatError('%r is not a %r' % (instance, format),
+                                                    cause = cause)
+
+
+def _conforms_to(validator):
+    """Return a format check that passes if ``validator`` does not raise."""
+    def check(value):
+        validator(value)
+        return True
+
+    return check
+
+
+class CompiledJSONSchema(object):
+    """A JSON Schema that has been checked against its meta-schema and compiled
+    into a validator, ready to validate any number of values.
+
+    .. hint::
+
+      Instances are created by
+      :func:`compile_json_schema() <validator_collection.validators.compile_json_schema>`,
+      and can be supplied as the ``schema`` argument to
+      :func:`json() <validator_collection.validators.json>`.
+
+    .. note::
+
+      If ``schema`` only uses the keywords ``type``, ``properties``,
+      ``required``, ``items``, ``minimum``, ``maximum``, ``minLength``,
+      ``maxLength``, ``enum``, ``pattern``, and ``format`` (plus annotations
+      such as ``title`` or ``description``), it is compiled into native checks
+      that stop at the first error found. Otherwise, it is validated using
+      ``jsonschema``, which reports the most relevant of all the errors found.
+      Either way, the same values are accepted.
+
+    .. caution::
+
+      The compiled validator holds a reference to ``schema``. Changing
+      ``schema`` after it has been compiled leaves the compiled validator in an
+      undefined state: compile it again instead.
+
+    """
+
+    def __init__(self, schema, native = True, format_checker = None):
+        """Create an instance of a :class:`CompiledJSONSchema`.
+
+        :param schema: The JSON Schema to compile.
+        :type schema: :class:`dict <python:dict>`
+
+        :param native: If ``True``, will compile ``schema`` into native checks
+          if it only uses supported keywords. If ``False``, will always validate
+          using ``jsonschema``. Defaults to ``True``.
+        :type native: :class:`bool <python:bool>`
+
+        :param format_checker: The format checker used to check the ``format``
+          keyword. If :obj:`None <python:None>`, ``format`` is treated as an
+          annotation and not checked. Defaults to :obj:`None <python:None>`.
+        :type format_checker: :class:`FormatChecker` / :obj:`None <python:None>`
+
+        :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema
+        """
+        validator_class = jsonschema.validators.validator_for(schema)
+        try:
+            validator_class.check_schema(schema)
+        except jsonschema.exceptions.SchemaError as error:
+            raise errors.NotJSONSchemaError(error.message)
+
+        self.schema = schema
+        self._validator = validator_class(schema, format_checker = format_checker)
+        self._check = None
+        if native and validator_class is not getattr(jsonschema, 'Draft3Validator', None):
+            try:
+                self._check = _compile(schema, _Options(self._validator)) or _no_check
+            except UnsupportedSchemaError:
+                pass
+
+    def __repr__(self):
+        return '<%s %r>' % (self.__class__.__name__, self.schema)
+
+    @property
+    def is_native(self):
+        """``True`` if the schema has been compiled into native checks, ``False``
+        if it is validated using ``jsonschema``.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return self._check is not None
+
+    def is_valid(self, value):
+        """Indicate whether ``value`` conforms to the schema.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        if self._check is None:
+            return self._validator.is_valid(value)
+
+        try:
+            self._check(value)
+        except errors.JSONValidationError:
+            return False
+
+        return True
+
+    def validate(self, value):
+        """Validate that ``value`` conforms to the schema.
+
+        :param value: The (deserialized) value to validate.
+
+        :returns: ``value``
+
+        :raises JSONValidationError: if ``value`` does not conform to the schema
+        """
+        if self._check is not None:
+            self._check(value)
+            return value
+
+        error = jsonschema.exceptions.best_match(self._validator.iter_errors(value))
+        if error is not None:
+            raise errors.JSONValidationError(error.message)
+
+        return value
+
+
+class _Options(object):
+    """The draft-specific behavior that native checks need to reproduce."""
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.integral_floats = validator.is_type(1.0, 'integer')
+        self.format_checker = getattr(validator, 'format_checker', None)
+
+
+def _no_check(value):
+    """A check that accepts any value."""
+    pass
+
+
+def _fail(message, *args):
+    raise errors.JSONValidationError(message % args)
+
+
+def _compile(schema, options):
+    """Compile ``schema`` into a single check.
+
+    :returns: A callable that raises a
+      :class:`JSONValidationError <validator_collection.errors.JSONValidationError>`
+      if the value passed to it does not conform to ``schema``, or
+      :obj:`None <python:None>` if ``schema`` accepts any value.
+
+    :raises UnsupportedSchemaError: if ``schema`` uses a keyword that cannot be
+      compiled into a native check
+    """
+    if schema is True:
+        return None
+    elif schema is False:
+        return lambda value: _fail('False schema does not allow %r', value)
+    elif not isinstance(schema, dict_):
+        raise UnsupportedSchemaError(schema)
+
+    for keyword in schema:
+        if keyword not in NATIVE_KEYWORDS and keyword not in ANNOTATION_KEYWORDS:
+            raise UnsupportedSchemaError(keyword)
+
+    checks = []
+    if 'type' in schema:
+        checks.append(_compile_type(schema['type'], options))
+    if 'enum' in schema:
+        checks.append(_compile_enum(schema['enum']))
+    if 'minimum' in schema or 'maximum' in schema:
+        checks.append(_compile_range(schema.get('minimum'), schema.get('maximum')))
+    if 'minLength' in schema or 'maxLength' in schema:
+        checks.append(_compile_length(schema.get('minLength'), schema.get('maxLength')))
+    if 'pattern' in schema:
+        checks.append(_compile_pattern(schema['pattern']))
+    if 'format' in schema and options.format_checker is not None:
+        checks.append(_compile_format(schema['format'], options.format_checker))
+    if 'required' in schema:
+        checks.append(_compile_required(schema['required']))
+    if 'properties' in schema:
+        checks.append(_compile_properties(schema['properties'], options))
+    if 'items' in schema:
+        checks.append(_compile_items(schema['items'], options))
+
+    checks = [x for x in checks if x is not None]
+    if not checks:
+        return None
+    elif len(checks) == 1:
+        return checks[0]
+
+    checks = tuple(checks)
+
+    def check_all(value):
+        for check in checks:
+            check(value)
+
+    return check_all
+
+
+def _compile_type(types, options):
+    if not isinstance(types, list):
+        types = [types]
+
+    classes = []
+    allow_integral_floats = False
+    for type_ in types:
+        if type_ == 'object':
+            classes.append(dict_)
+        elif type_ == 'array':
+            classes.append(list)
+        elif type_ == 'string':
+            classes.extend(TEXT_TYPES)
+        elif type_ == 'number':
+            classes.append(numbers.Number)
+        elif type_ == 'integer':
+            classes.extend(integer_types)
+            allow_integral_floats = options.integral_floats
+        elif type_ == 'boolean':
+            classes.append(bool)
+        elif type_ == 'null':
+            classes.append(type(None))
+        else:
+            raise UnsupportedSchemaError(type_)
+
+    classes = tuple(classes)
+    allows_bool = 'boolean' in types
+    message = '%%r is not of type %s' % ', '.join(repr(x) for x in types)
+
+    def check_type(value):
+        if isinstance(value, classes):
+            if value.__class__ is not bool or allows_bool:
+                return
+        elif allow_integral_floats and isinstance(value, float) and value.is_integer():
+            return
+
+        _fail(message, value)
+
+    return check_type
+
+
+def _unbool(value):
+    """Return a key for ``value`` that does not compare equal to ``0`` or ``1``
+    if ``value`` is a :class:`bool <python:bool>`."""
+    if value is True or value is False:
+        return (bool, value)
+
+    return value
+
+
+def _equal(first, second):
+    """Indicate whether two JSON values are equal, without treating
+    ``True``/``False`` as equal to ``1``/``0``."""
+    if isinstance(first, list) and isinstance(second, list):
+        return len(first) == len(second) and \
+            all(_equal(x, y) for x, y in zip(first, second))
+    elif isinstance(first, dict_) and isinstance(second, dict_):
+        return len(first) == len(second) and \
+            all(key in second and _equal(first[key], second[key]) for key in first)
+
+    return _unbool(first) == _unbool(second)
+
+
+def _compile_enum(members):
+    scalars = set()
+    containers = []
+    for member in members:
+        if isinstance(member, (list, dict_)):
+            containers.append(member)
+        else:
+            scalars.add(_unbool(member))
+
+    scalars = frozenset(scalars)
+
+    def check_enum(value):
+        if isinstance(value, (list, dict_)):
+            if any(_equal(value, x) for x in containers):
+                return
+        else:
+            try:
+                if _unbool(value) in scalars:
+                    return
+            except TypeError:
+                pass
+
+        _fail('%r is not one of %r', value, members)
+
+    return check_enum
+
+
+def _compile_range(minimum, maximum):
+    def check_range(value):
+        if not isinstance(value, numbers.Number) or value.__class__ is bool:
+            return
+        if minimum is not None and value < minimum:
+            _fail('%r is less than the minimum of %r', value, minimum)
+        if maximum is not None and value > maximum:
+            _fail('%r is greater than the maximum of %r', value, maximum)
+
+    return check_range
+
+
+def _compile_length(minimum, maximum):
+    def check_length(value):
+        if not isinstance(value, TEXT_TYPES):
+            return
+
+        length = len(value)
+        if minimum is not None and length < minimum:
+            _fail('%r is too short', value)
+        if maximum is not None and length > maximum:
+            _fail('%r is too long', value)
+
+    return check_length
+
+
+def _compile_pattern(pattern):
+    search = re.compile(pattern).search
+
+    def check_pattern(value):
+        if isinstance(value, TEXT_TYPES) and not search(value):
+            _fail('%r does not match %r', value, pattern)
+
+    return check_pattern
+
+
+def _compile_format(format_, format_checker):
+    conforms = format_checker.conforms
+
+    def check_format(value):
+        if not conforms(value, format_):
+            _fail('%r is not a %r', value, format_)
+
+    return check_format
+
+
+def _compile_required(names):
+    names = tuple(names)
+
+    def check_required(value):
+        if isinstance(value, dict_):
+            for name in names:
+                if name not in value:
+                    _fail('%r is a required property', name)
+
+    return check_required
+
+
+def _compile_properties(properties, options):
+    checks = []
+    for name, subschema in properties.items():
+        check = _compile(subschema, options)
+        if check is not None:
+            checks.append((name, check))
+
+    if not checks:
+        return None
+
+    checks = tuple(checks)
+
+    def check_properties(value):
+        if isinstance(value, dict_):
+            for name, check in checks:
+                if name in value:
+                    check(value[name])
+
+    return check_properties
+
+
+def _compile_items(items, options):
+    if isinstance(items, list):
+        raise UnsupportedSchemaError('items')
+
+    check = _compile(items, options)
+    if check is None:
+        return None
+
+    def check_items(value):
+        if isinstance(value, list):
+            for item in value:
+                check(item)
+
+    return check_items
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._json_stream
+****************************************
+
+Reads the elements of a (potentially very large) top-level JSON array from a
+file object one at a time, without deserializing the array as a whole.
+
+The extent of each element is found by scanning for brackets, braces, and
+complete strings using regular expressions, so that only one element is ever
+deserialized at a time.
+
+"""
+
+from collections import namedtuple
+
+from validator_collection._compat import re, bytes
+from validator_collection import errors
+
+
+class JSONElementResult(namedtuple('JSONElementResult', ['index',
+                                                         'offset',
+                                                         'value',
+                                                         'error'])):
+    """The result of validating one element of a streamed JSON array.
+
+    * ``index`` is the (0-based) index of the element in the array.
+    * ``offset`` is the position of the start of the element, in bytes (or
+      characters, for a text source) from the start of the source.
+    * ``value`` is the element's deserialized value, or
+      :obj:`None <python:None>` if it could not be deserialized.
+    * ``error`` is the :class:`ValueError <python:ValueError>` or
+      :class:`TypeError <python:TypeError>` the element failed validation with.
+
+    """
+
+    __slots__ = ()
+
+
+class _Syntax(object):
+    """The patterns and characters used to scan a source of one type."""
+
+    def __init__(self, convert):
+        self.non_whitespace = re.compile(convert(r'[^ \t\n\r]'))
+        self.string = re.compile(convert(r'"[^"\\]*(?:\\.[^"\\]*)*"'), re.DOTALL)
+        # Matches a complete string (group 1), an opening (group 2) or closing
+        # (group 3) bracket or brace, or the quote of an unterminated string
+        # (group 4).
+        self.token = re.compile(
+            convert(r'"[^"\\]*(?:\\.[^"\\]*)*"()|[\[{]()|[\]}]()|"()'),
+            re.DOTALL
+        )
+        self.scalar_end = re.compile(convert(r'[,\]\s]'))
+        self.quote, self.comma, self.open_array, self.close_array, self.open_object = (
+            convert(x) for x in ('"', ',', '[', ']', '{')
+        )
+
+
+_TEXT_SYNTAX = _Syntax(lambda x: x)
+_BYTES_SYNTAX = _Syntax(lambda x: x.encode('ascii'))
+
+
+class JSONArrayReader(object):
+    """Reads the elements of a top-level JSON array from a file object.
+
+    Iterating over a reader yields an ``(index, offset, text)``
+    :class:`tuple <python:tuple>` for each element of the array, where ``text``
+    is the element's (serialized) JSON. Only the element being read, and at most
+    one unread chunk, are held in memory.
+
+    Iterating raises a :class:`NotJSONError <validator_collection.errors.NotJSONError>`
+    as soon as the source is found not to be a well-formed JSON array. The
+    elements themselves are not checked for well-formedness.
+
+    """
+
+    def __init__(self, source, chunk_size = 65536):
+        """Create an instance of a :class:`JSONArrayReader`.
+
+        :param source: The file object to read. May be opened in binary or text
+          mode.
+        :type source: file object
+
+        :param chunk_size: The number of bytes (or characters) to read at a time.
+          Defaults to ``65536``.
+        :type chunk_size: :class:`int <python:int>`
+
+        """
+        self._read = source.read
+        self.chunk_size = chunk_size
+        self._buffer = self._read(chunk_size)
+        self._base = 0
+        self._eof = not self._buffer
+        if isinstance(self._buffer, bytes):
+            self._syntax = _BYTES_SYNTAX
+        else:
+            self._syntax = _TEXT_SYNTAX
+
+    def _fill(self):
+        """Append the next chunk of the source to the buffer.
+
+        Reads at least as much as the buffer already holds, so that reading one
+        very large element takes time proportional to its size.
+
+        :returns: ``False`` if the source is exhausted, ``True`` otherwise.
+        """
+        if self._eof:
+            return False
+
+        chunk = self._read(max(self.chunk_size, len(self._buffer)))
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer += chunk
+        return True
+
+    def _fail(self, message, position):
+        raise errors.NotJSONError('value is not a JSON array: %s at offset %s' % (
+            message,
+            self._base + position
+        ))
+
+    def _skip_whitespace(self, position):
+        """Return the position of the next non-whitespace character at or after
+        ``position``, or ``-1`` if there is none before the end of the source."""
+        while True:
+            match = self._syntax.non_whitespace.search(self._buffer, position)
+            if match is not None:
+                return match.start()
+            if not self._fill():
+                return -1
+
+    def _element_end(self, start):
+        """Return the position just after the end of the element that starts at
+        ``start``."""
+        syntax = self._syntax
+        first = self._buffer[start:start + 1]
+        if first in (syntax.open_array, syntax.open_object):
+            depth = 0
+            position = start
+            search = syntax.token.search
+            while True:
+                match = search(self._buffer, position)
+                group = match.lastindex if match is not None else 4
+                if group == 4:
+                    # An unterminated string may be completed by the next chunk.
+                    if not self._fill():
+                        self._fail('unexpected end of data', start)
+                    if match is not None:
+                        position = match.start()
+                    continue
+
+                position = match.end()
+                if group == 2:
+                    depth += 1
+                elif group == 3:
+                    depth -= 1
+                    if not depth:
+                        return position
+
+        elif first == syntax.quote:
+            while True:
+                match = syntax.string.match(self._buffer, start)
+                if match is not None:
+                    return match.end()
+                if not self._fill():
+                    self._fail('unexpected end of data', start)
+
+        while True:
+            match = syntax.scalar_end.search(self._buffer, start)
+            if match is not None:
+                return match.start()
+            if not self._fill():
+                return len(self._buffer)
+
+    def __iter__(self):
+        syntax = self._syntax
+        position = self._skip_whitespace(0)
+        if position < 0 or self._buffer[position:position + 1] != syntax.open_array:
+            self._fail('expected [', max(position, 0))
+
+        position = self._skip_whitespace(position + 1)
+        if self._buffer[position:position + 1] == syntax.close_array:
+            position += 1
+        else:
+            index = 0
+            while True:
+                # Discard the elements that have already been read.
+                if position >= self.chunk_size:
+                    self._buffer = self._buffer[position:]
+                    self._base += position
+                    position = 0
+
+                if position < 0 or \
+                   self._buffer[position:position + 1] in (syntax.comma,
+                                                           syntax.close_array):
+                    self._fail('expected a value', max(position, 0))
+
+                end = self._element_end(position)
+                yield index, self._base + position, self._buffer[position:end]
+
+                index += 1
+                position = self._skip_whitespace(end)
+                if position < 0:
+                    self._fail('unexpected end of data', end)
+
+                separator = self._buffer[position:position + 1]
+                if separator == syntax.close_array:
+                    position += 1
+                    break
+                elif separator != syntax.comma:
+                    self._fail('expected , or ]', position)
+
+                position = self._skip_whitespace(position + 1)
+
+        position = self._skip_whitespace(position)
+        if position >= 0:
+            self._fail('unexpected data after the array', position)
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._json_syntax
+****************************************
+
+Checks that a JSON document is well-formed, and within limits on its nesting,
+the number of items in its containers, and the length of its strings, without
+deserializing it.
+
+The document is matched using regular expressions that each consume a run of
+members of a container (scalars, and small containers nested a few levels
+deep), so that Python code only runs when a larger container is opened or
+closed. Open containers are tracked in an explicit stack, held in the bits of an
+integer, so that no Python containers are allocated however large or deeply
+nested the document is.
+
+"""
+
+from validator_collection._cache import LRUCache
+from validator_collection._compat import re
+from validator_collection import errors
+
+
+_WHITESPACE = r'[ \t\n\r]*'
+_CHARACTER = r'(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))'
+
+_OTHER_SCALAR = (r'|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?(?![0-9a-zA-Z.+-])'
+                 r'|(?:true|false|null)(?![0-9a-zA-Z])')
+
+# Follows the ``\u`` of an escaped high surrogate, through the first hex digit of
+# the low surrogate escaped after it, which together decode to one character.
+# The low surrogate's remaining hex digits match ``_LOW_SURROGATE_END``.
+_SURROGATE_PAIR = r'[dD][89abAB][0-9a-fA-F]{2}\\u[dD]'
+_LOW_SURROGATE_END = r'[c-fC-F][0-9a-fA-F]{2}'
+
+# Matches one character of a string, as decoded, when measuring its length.
+_COUNTED_CHARACTER = (r'(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]'
+                      r'|u' + _SURROGATE_PAIR + _LOW_SURROGATE_END +
+                      r'|u(?!' + _SURROGATE_PAIR + _LOW_SURROGATE_END + r')[0-9a-fA-F]{4}))')
+
+# Matches one byte of a string, as decoded and encoded as UTF-8, when measuring
+# its length. An escaped character that encodes to more than one byte is
+# matched without its last hex digits, which are each matched as one more byte.
+_COUNTED_BYTE = (r'(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]'
+                 r'|u00[0-7][0-9a-fA-F]'
+                 r'|u0(?:0[89a-fA-F]|[1-7][0-9a-fA-F])(?=[0-9a-fA-F])'
+                 r'|u' + _SURROGATE_PAIR + r'(?=' + _LOW_SURROGATE_END + r')'
+                 r'|u(?!' + _SURROGATE_PAIR + _LOW_SURROGATE_END + r')'
+                 r'(?:0[89a-fA-F]|[1-9a-fA-F][0-9a-fA-F])'
+                 r'(?=[0-9a-fA-F]{2})))')
+
+# Matches a string, or one of the characters that open or close a container
+# (group 1 or 2) or separate its members (group 3), without checking the
+# string's contents.
+_TOKEN = r'"[^"\\]*(?:\\.[^"\\]*)*"|([\[{])|([\]}])|(,)'
+
+_RUN_LENGTH = 256
+
+# The number of levels of small containers that are matched within a run of
+# members, rather than being opened on the stack.
+_INLINE_DEPTH = 2
+
+
+class _Syntax(object):
+    """The patterns used to check a value of one type, within limits on the
+    number of members of a container that is matched inline and the length of a
+    string, measured in units each matched by ``unit``."""
+
+    def __init__(self, convert, max_items = None, max_string_length = None,
+                 unit = _COUNTED_CHARACTER):
+        def compile_(pattern):
+            return re.compile(convert(pattern))
+
+        self.long_string = None
+        if max_string_length is None:
+            string = r'"' + _CHARACTER + r'*"'
+        else:
+            string = r'"' + unit + r'{0,%s}"' % max_string_length
+            self.long_string = compile_(r'"' + unit + r'{%s}' % (max_string_length + 1))
+
+        scalar = r'(?:' + string + _OTHER_SCALAR + r')'
+        member = string + _WHITESPACE + ':' + _WHITESPACE
+
+        inline_count = _RUN_LENGTH
+        if max_items is not None:
+            inline_count = max(min(_RUN_LENGTH, max_items - 1), 0)
+
+        def run(value):
+            # Matches between one and ``inline_count`` + 1 items, each matching
+            # ``value``, separated by commas.
+            return (value + _WHITESPACE + r'(?:,' + _WHITESPACE + value + _WHITESPACE +
+                    r'){0,%s}' % inline_count)
+
+        def inline_value(depth):
+            # Matches a scalar, or a container of no more than ``inline_count``
+            # + 1 members nested no more than ``depth`` levels deep.
+            if not depth:
+                return scalar
+
+            value = inline_value(depth - 1)
+            return (r'(?:' + scalar +
+                    r'|\[' + _WHITESPACE + r'(?:' + run(value) + r')?\]' +
+                    r'|\{' + _WHITESPACE + r'(?:' + run(member + value) + r')?\})')
+
+        self.root = compile_(_WHITESPACE + r'(?:(\[)|(\{))')
+        self.end = compile_(_WHITESPACE + r'\Z')
+        self.token = compile_(_TOKEN)
+
+        # ``array_items[n]`` and ``object_members[n]`` each match up to
+        # ``_RUN_LENGTH`` members of a container, including any containers
+        # nested no more than ``n`` levels within them, followed by either its
+        # end (group 1), the opening of a nested array (group 2) or object
+        # (group 3), or nothing (group 4). The length of a run is limited
+        # because the regular expression engine holds state for each
+        # repetition it matches.
+        self.array_items = []
+        self.object_members = []
+
+        # ``array_item[n]`` and ``object_value[n]`` each match one member of a
+        # container, as matched within a run, and the comma or end that follows
+        # it.
+        self.array_item = []
+        self.object_value = []
+        for depth in range(_INLINE_DEPTH + 1):
+            value = inline_value(depth)
+            self.array_item.append(compile_(value + _WHITESPACE + r'[,\]]'))
+            self.object_value.append(compile_(value + _WHITESPACE + r'[,}]'))
+            self.array_items.append(compile_(
+                _WHITESPACE + r'(?:' + value + _WHITESPACE + ',' + _WHITESPACE +
+                r'){0,%s}' % _RUN_LENGTH +
+                r'(?:' + value + _WHITESPACE + r'(\])|(\[)|(\{)|())'
+            ))
+            self.object_members.append(compile_(
+                _WHITESPACE + r'(?:' + member + value + _WHITESPACE + ',' +
+                _WHITESPACE + r'){0,%s}' % _RUN_LENGTH +
+                r'(?:' + member + r'(?:' + value + _WHITESPACE +
+                r'(\})|(\[)|(\{))|())'
+            ))
+
+        self.empty_array = compile_(_WHITESPACE + r'\]')
+        self.empty_object = compile_(_WHITESPACE + r'\}')
+
+        # Matches what follows a nested container: either the end of its parent
+        # (group 1), or a comma.
+        self.after_array_item = compile_(_WHITESPACE + r'(?:(\])|,)')
+        self.after_object_member = compile_(_WHITESPACE + r'(?:(\})|,)')
+
+
+# Patterns are compiled on first use, which takes some 70 ms for each set. Those
+# without limits are kept, along with the most recently used of those with
+# limits.
+_SYNTAX = {}
+_LIMITED_SYNTAX_CACHE = LRUCache(maxsize = 16)
+
+
+def _get_syntax(is_bytes, max_items = None, max_string_length = None):
+    """Return the patterns used to check a value.
+
+    A ``max_items`` of more than ``_RUN_LENGTH`` does not change the patterns,
+    so all such limits share the patterns compiled without one.
+
+    :rtype: :class:`_Syntax`
+    """
+    if max_items is not None and max_items > _RUN_LENGTH:
+        max_items = None
+
+    key = (is_bytes, max_items, max_string_length)
+    if max_items is None and max_string_length is None:
+        cache = _SYNTAX
+    else:
+        cache = _LIMITED_SYNTAX_CACHE
+
+    syntax = cache.get(key)
+    if syntax is None:
+        if is_bytes:
+            syntax = _Syntax(lambda x: x.encode('ascii'), max_items, max_string_length,
+                             unit = _COUNTED_BYTE)
+        else:
+            syntax = _Syntax(lambda x: x, max_items, max_string_length)
+
+        if cache is _SYNTAX:
+            _SYNTAX[key] = syntax
+        else:
+            _LIMITED_SYNTAX_CACHE.set(key, syntax)
+
+    return syntax
+
+
+def _count_separators(syntax, value, start, end):
+    """Return the number of commas in ``value`` between ``start`` and ``end``
+    that are not within a string or a nested container."""
+    count = 0
+    depth = 0
+    for token in syntax.token.finditer(value, start, end):
+        if token.lastindex == 1:
+            depth += 1
+        elif token.lastindex == 2:
+            depth -= 1
+        elif token.lastindex == 3 and not depth:
+            count += 1
+
+    return count
+
+
+def _count_run(syntax, value, match, count, max_items, is_object, inline_depth):
+    """Return the number of members of a container, once the terminated run of
+    its members in ``match`` has been added to the ``count`` before it.
+
+    Counting the members of a run means scanning it again, so is avoided where
+    possible. If the run ends with the container, the number of commas in the
+    run is used instead where that alone shows the container to be within
+    ``max_items``, as the count is no longer needed. If the run ends with a
+    nested container that could have been matched within the run, the run must
+    have held as many members as it can.
+
+    :raises JSONLimitError: if the container has more than ``max_items`` members
+    """
+    start, end = match.span()
+    if match.lastindex == 1:
+        try:
+            commas = value.count(b',' if isinstance(value, (bytes, bytearray)) else ',',
+                                 start,
+                                 end)
+        except AttributeError:
+            commas = _RUN_LENGTH
+
+        if count + min(commas, _RUN_LENGTH) < max_items:
+            return count + commas + 1
+
+        count += _count_separators(syntax, value, start, end) + 1
+    else:
+        pattern = (syntax.object_value if is_object else syntax.array_item)[inline_depth]
+        if pattern.match(value, match.start(match.lastindex)):
+            count += _RUN_LENGTH + 1
+        else:
+            count += _count_separators(syntax, value, start, end) + 1
+
+    if count > max_items:
+        raise errors.JSONLimitError(
+            'value has an array or object with more than %s items at offset %s' % (
+                max_items,
+                end - 1
+            )
+        )
+
+    return count
+
+
+def _raise_syntax_error(syntax, value, is_bytes, position, is_object, inline_depth):
+    """Raise the error for a document whose members cannot be matched from
+    ``position``.
+
+    :raises JSONLimitError: if the members would have matched but for a string
+      longer than the limit
+    :raises NotJSONError: otherwise
+    """
+    if syntax.long_string is not None:
+        unlimited = _get_syntax(is_bytes)
+        pattern = (unlimited.object_members if is_object else
+                   unlimited.array_items)[inline_depth]
+        match = pattern.match(value, position)
+        end = match.end() if match else position
+        for token in syntax.token.finditer(value, position, end):
+            if syntax.long_string.match(value, token.start()):
+                raise errors.JSONLimitError(
+                    'value has a string longer than the limit at offset %s' % (
+                        token.start()
+                    )
+                )
+
+    raise errors.NotJSONError(
+        'value is not well-formed JSON after offset %s' % position
+    )
+
+
+def check_json_syntax(value,
+                      max_depth = None,
+                      max_items = None,
+                      max_string_length = None):
+    """Check that ``value`` is a well-formed JSON document whose root is an
+    object or array, and that it is within the limits supplied.
+
+    Limits are checked as the document is matched, so a document that exceeds
+    one is rejected once the part that exceeds it has been read.
+
+    .. note::
+
+      A bytes-like ``value`` is assumed to be encoded in UTF-8 (or ASCII), and
+      is not checked for invalid UTF-8 sequences.
+
+    :param value: The JSON document to check.
+    :type value: :class:`str <python:str>` / :class:`bytes <python:bytes>` /
+      :class:`bytearray <python:bytearray>` /
+      :class:`memoryview <python:memoryview>`
+
+    :param max_depth: If supplied, the maximum number of containers that may be
+      nested within one another (counting the root). Defaults to
+      :obj:`None <python:None>`.
+    :type max_depth: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_items: If supplied, the maximum number of items of any one array,
+      or members of any one object. Defaults to :obj:`None <python:None>`.
+    :type max_items: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_string_length: If supplied, the maximum length of any string
+      (including the names of members), once escape sequences are decoded. The
+      strings of a bytes-like ``value`` are measured in bytes, as encoded in
+      UTF-8, so that an escaped ``\\u00e9`` counts as two. An escaped surrogate
+      pair counts as one character, or four bytes. Defaults to
+      :obj:`None <python:None>`.
+    :type max_string_length: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    .. caution::
+
+      The regular expressions used to check ``value`` are compiled for each
+      distinct ``max_string_length``, and each ``max_items`` of ``256`` or
+      fewer, which takes some 70 ms the first time they are used. The 16 most
+      recently used sets are kept, so use a small, fixed set of limits rather
+      than varying them from one call to the next.
+
+    :raises NotJSONError: if ``value`` is not a well-formed JSON object or array
+    :raises JSONLimitError: if ``value`` exceeds ``max_depth``, ``max_items``, or
+      ``max_string_length``
+    """
+    is_bytes = isinstance(value, (bytes, bytearray, memoryview))
+    syntax = _get_syntax(is_bytes, max_items, max_string_length)
+
+    match = syntax.root.match(value)
+    if not match:
+        raise errors.NotJSONError('value is not a JSON object or array')
+
+    if max_depth is None:
+        inline_depth = lambda depth: _INLINE_DEPTH
+    else:
+        inline_depth = lambda depth: max(min(_INLINE_DEPTH, max_depth - depth), 0)
+
+    # ``stack`` holds one bit for each open container: 1 for an object, 0 for
+    # an array, with the innermost in the lowest bit. If ``max_items`` is
+    # supplied, ``counts`` likewise holds the number of members of each open
+    # container but the innermost (whose members are counted in ``count``) in
+    # ``count_width`` bits each, as no count exceeds ``max_items``.
+    stack = 0
+    depth = 0
+    counts = 0
+    count = 0
+    count_width = max(max_items or 0, 1).bit_length()
+    is_object = match.lastindex == 2
+    opened = True
+    position = match.end()
+    while True:
+        if opened:
+            depth += 1
+            if max_depth is not None and depth > max_depth:
+                raise errors.JSONLimitError(
+                    'value is nested more than %s levels deep at offset %s' % (
+                        max_depth,
+                        position - 1
+                    )
+                )
+
+            stack = (stack << 1) | is_object
+            if max_items is not None:
+                counts = (counts << count_width) | count
+                count = 0
+
+            empty = (syntax.empty_object if is_object else syntax.empty_array).match(
+                value, position
+            )
+            start = position
+            if empty:
+                match = empty
+            else:
+                pattern = (syntax.object_members if is_object else
+                           syntax.array_items)[inline_depth(depth)]
+                match = pattern.match(value, start)
+        else:
+            empty = None
+            pattern = syntax.after_object_member if is_object else syntax.after_array_item
+            match = pattern.match(value, position)
+            start = None
+            if match and match.lastindex is None:
+                start = match.end()
+                pattern = (syntax.object_members if is_object else
+                           syntax.array_items)[inline_depth(depth)]
+                match = pattern.match(value, start)
+
+        while match and match.lastindex == 4 and match.end() > position:
+            # A run of members has been matched, and more may follow. If the
+            # members that follow match, the run held ``_RUN_LENGTH`` members.
+            position = match.end()
+            match = pattern.match(value, position)
+            if max_items is not None and match and \
+               (match.lastindex != 4 or match.end() > position):
+                count += _RUN_LENGTH
+                if count > max_items:
+                    raise errors.JSONLimitError(
+                        'value has an array or object with more than %s items at '
+                        'offset %s' % (max_items, position)
+                    )
+
+        if not match or match.lastindex == 4:
+            if start is None:
+                raise errors.NotJSONError(
+                    'value is not well-formed JSON after offset %s' % position
+                )
+
+            _raise_syntax_error(syntax,
+                                value,
+                                is_bytes,
+                                match.end() if match else start,
+                                is_object,
+                                inline_depth(depth))
+
+        # ``start`` is None where ``match`` is the end of a container that
+        # followed a nested container, and so holds no members.
+        if max_items is not None and not empty and start is not None:
+            count = _count_run(syntax,
+                               value,
+                               match,
+                               count,
+                               max_items,
+                               is_object,
+                               inline_depth(depth))
+
+        position = match.end()
+        if empty or match.lastindex == 1:
+            # The innermost container has ended.
+            stack >>= 1
+            depth -= 1
+            if not depth:
+                break
+
+            is_object = stack & 1
+            opened = False
+            if max_items is not None:
+                count = counts & ((1 << count_width) - 1)
+                counts >>= count_width
+        else:
+            is_object = match.lastindex == 3
+            opened = True
+
+    if not syntax.end.match(value, position):
+        raise errors.NotJSONError(
+            'value has unexpected data after offset %s' % position
+        )
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._public_suffix
+****************************************
+
+Lookups against a vendored copy of the
+`Public Suffix List <https://publicsuffix.org/>`_.
+
+The list is stored in ``_data/public_suffixes.json`` as a trie keyed by
+*reversed* labels (``co.uk`` is stored as ``uk`` -> ``co``), which lets a
+lookup walk the labels of a domain from right to left and finish in
+O(labels). Each trie node is either:
+
+  * ``1``, indicating a rule that has no more specific rules beneath it, or
+  * a :class:`dict <python:dict>` mapping child labels to their nodes, with the
+    key ``"."`` set to ``1`` if the node itself is a rule.
+
+Wildcard rules are stored with a ``*`` label, and exception rules with their
+label prefixed by ``!``, as in the source list.
+
+The data file is only read the first time a lookup is performed.
+
+To refresh the data file from a (previously downloaded) copy of
+``public_suffix_list.dat``, run::
+
+  $ python -m validator_collection._public_suffix path/to/public_suffix_list.dat
+
+"""
+
+import codecs
+import io
+import os
+import sys
+
+from validator_collection._compat import json_
+
+DATA_PATH = os.path.join(os.path.dirname(__file__),
+                         '_data',
+                         'public_suffixes.json')
+
+_RULE_KEY = '.'
+
+_TRIE = None
+
+
+def load_trie(path = None):
+    """Return the public suffix trie, reading it from disk on first use.
+
+    :param path: The path to read the trie from. If not supplied, will read the
+      data file vendored with the library.
+    :type path: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    global _TRIE                                                                # pylint: disable=W0603
+
+    if _TRIE is None or path is not None:
+        with io.open(path or DATA_PATH, 'r', encoding = 'utf-8') as data_file:
+            trie = json_.load(data_file)
+
+        if path is not None:
+            return trie
+
+        _TRIE = trie
+
+    return _TRIE
+
+
+def public_suffix_length(labels):
+    """Return the number of trailing ``labels`` that form a listed public suffix.
+
+    Follows the `Public Suffix List algorithm <https://publicsuffix.org/list/>`_,
+    except that the implicit ``*`` rule is **not** applied: a domain whose
+    top-level label is not listed at all has a public suffix length of ``0``.
+
+    :param labels: The (lowercase) labels of a domain name, in their natural
+      left-to-right order.
+    :type labels: :class:`list <python:list>` of :class:`str <python:str>`
+
+    :rtype: :class:`int <python:int>`
+    """
+    node = load_trie()
+    matched = 0
+    depth = 0
+    for label in reversed(labels):
+        if not isinstance(node, dict):
+            break
+
+        if '!' + label in node:
+            return depth
+
+        child = node.get(label)
+        if child is None:
+            child = node.get('*')
+        if child is None:
+            break
+
+        depth += 1
+        if depth == 1 or child == 1 or child.get(_RULE_KEY):
+            matched = depth
+
+        node = child
+
+    return matched
+
+
+def has_public_suffix(value):
+    """Indicate whether the domain name ``value`` ends in a listed public suffix
+    and has at least one label in front of it.
+
+    :param value: The (lowercase) domain name to check.
+    :type value: :class:`str <python:str>`
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    labels = value.rstrip('.').split('.')
+    suffix_length = public_suffix_length(labels)
+
+    return 0 < suffix_length < len(labels)
+
+
+def _to_ascii(label):
+    """Return the A-label form of ``label``, or :obj:`None <python:None>` if it
+    is already ASCII or cannot be converted."""
+    try:
+        label.encode('ascii')
+        return None
+    except UnicodeError:
+        pass
+
+    try:
+        return codecs.encode(label, 'idna').decode('ascii')
+    except UnicodeError:
+        return None
+
+
+def build_trie(lines, include_private = False):
+    """Build a public suffix trie from the lines of ``public_suffix_list.dat``.
+
+    Rules with non-ASCII labels are also added in their IDNA (``xn--``) form.
+
+    :param lines: The lines of the public suffix list.
+    :type lines: iterable of :class:`str <python:str>`
+
+    :param include_private: If ``True``, will include the rules from the list's
+      ``PRIVATE DOMAINS`` section. Defaults to ``False``, which keeps only the
+      ICANN-managed suffixes.
+    :type include_private: :class:`bool <python:bool>`
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    rules = set()
+    for line in lines:
+        line = line.strip()
+        if line.startswith('// ===BEGIN PRIVATE DOMAINS===') and not include_private:
+            break
+        if not line or line.startswith('//'):
+            continue
+
+        rule = line.split()[0].lower()
+        rules.add(rule)
+
+        labels = rule.split('.')
+        ascii_labels = [_to_ascii(x.lstrip('!')) for x in labels]
+        if any(ascii_labels):
+            rules.add('.'.join(
+                (x[0] == '!' and '!' or '') + (ascii_label or x.lstrip('!'))
+                for x, ascii_label in zip(labels, ascii_labels)
+            ))
+
+    trie = {}
+    for rule in rules:
+        node = trie
+        labels = rule.split('.')[::-1]
+        for index, label in enumerate(labels):
+            is_last = index == len(labels) - 1
+            child = node.get(label)
+            if child is None and is_last:
+                node[label] = 1
+            elif child is None:
+                child = node[label] = {}
+            elif child == 1 and not is_last:
+                child = node[label] = {_RULE_KEY: 1}
+            elif is_last and isinstance(child, dict):
+                child[_RULE_KEY] = 1
+
+            node = child
+
+    return trie
+
+
+def main(argv = None):
+    """Rebuild the vendored data file from a local copy of the public suffix list."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        sys.stderr.write('usage: python -m validator_collection._public_suffix '
+                         'public_suffix_list.dat [--include-private]\n')
+        return 2
+
+    with io.open(argv[0], 'r', encoding = 'utf-8') as source:
+        trie = build_trie(source, include_private = '--include-private' in argv)
+
+    serialized = json_.dumps(trie,
+                             ensure_ascii = False,
+                             sort_keys = True,
+                             separators = (',', ':'))
+    with io.open(DATA_PATH, 'w', encoding = 'utf-8') as data_file:
+        data_file.write(u'%s\n' % serialized)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -340,6 +340,11 @@ def is_dict(value, **kwargs):
 def is_json(value,
             schema = None,
             json_serializer = None,
+            syntax_only = False,
+            max_depth = None,
+            max_bytes = None,
+            max_items = None,
+            max_string_length = None,
             **kwargs):
     """Indicate whether ``value`` is a valid JSON object.
 
@@ -353,7 +358,33 @@ def is_json(value,
 
     :param schema: An optional JSON schema against which ``value`` will be validated.
     :type schema: :class:`dict <python:dict>` / :class:`str <python:str>` /
-      :obj:`None <python:None>`
+      :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
+
+    :param syntax_only: If ``True``, will only check whether a string (or
+      bytes-like) ``value`` is a well-formed JSON object or array, without
+      deserializing it. Cannot be combined with ``schema``. Defaults to
+      ``False``.
+    :type syntax_only: :class:`bool <python:bool>`
+
+    :param max_depth: If supplied, the maximum number of objects and arrays that
+      may be nested within one another in a string or bytes-like ``value``.
+      Defaults to :obj:`None <python:None>`.
+    :type max_depth: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_bytes: If supplied, the maximum size of a string or bytes-like
+      ``value``, checked before it is deserialized. Defaults to
+      :obj:`None <python:None>`.
+    :type max_bytes: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_items: If supplied, the maximum number of items of any one array,
+      or members of any one object, in a string or bytes-like ``value``.
+      Defaults to :obj:`None <python:None>`.
+    :type max_items: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_string_length: If supplied, the maximum length of any string in
+      a string or bytes-like ``value``. Defaults to :obj:`None <python:None>`.
+    :type max_string_length: :class:`int <python:int>` / :obj:`None <python:None>`
 
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
@@ -366,6 +397,11 @@ def is_json(value,
         value = validators.json(value,
                                 schema = schema,
                                 json_serializer = json_serializer,
+                                syntax_only = syntax_only,
+                                max_depth = max_depth,
+                                max_bytes = max_bytes,
+                                max_items = max_items,
+                                max_string_length = max_string_length,
                                 **kwargs)
     except SyntaxError as error:
         raise error
@@ -381,6 +417,10 @@ def is_string(value,
               minimum_length = None,
               maximum_length = None,
               whitespace_padding = False,
+              pattern = None,
+              flags = 0,
+              fullmatch = False,
+              encoding = None,
               **kwargs):
     """Indicate whether ``value`` is a string.
 
@@ -402,6 +442,27 @@ def is_string(value,
       ``minimum_length``, pad the value with spaces. Defaults to ``False``.
     :type whitespace_padding: :class:`bool <python:bool>`
 
+    :param pattern: If supplied, a regular expression that ``value`` must match.
+      The ``maximum_length`` is checked before the ``pattern``.
+    :type pattern: :class:`str <python:str>` / compiled regular expression /
+      :obj:`None <python:None>`
+
+    :param flags: The flags to compile ``pattern`` with. Defaults to ``0``.
+    :type flags: :class:`int <python:int>`
+
+    :param fullmatch: If ``True``, the whole of ``value`` must match ``pattern``.
+      If ``False``, ``value`` need only begin with a match for ``pattern``.
+      Defaults to ``False``.
+    :type fullmatch: :class:`bool <python:bool>`
+
+    :param encoding: If supplied, the name of an encoding that ``value`` must
+      conform to. :class:`bytes <python:bytes>`,
+      :class:`bytearray <python:bytearray>`, and
+      :class:`memoryview <python:memoryview>` values must decode without error,
+      and text values must encode without error. Defaults to
+      :obj:`None <python:None>`.
+    :type encoding: :class:`str <python:str>` / :obj:`None <python:None>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -418,6 +479,15 @@ def is_string(value,
     if isinstance(value, basestring) and not value:
         if minimum_length and minimum_length > 0 and not whitespace_padding:
             return False
+        elif pattern is not None:
+            try:
+                compiled = validators._compile_pattern(pattern, flags)          # pylint: disable=W0212
+                if fullmatch:
+                    return compiled.fullmatch(value) is not None
+
+                return compiled.match(value) is not None
+            except (TypeError, ValueError):
+                return False
 
         return True
 
@@ -427,6 +497,10 @@ def is_string(value,
                                   minimum_length = minimum_length,
                                   maximum_length = maximum_length,
                                   whitespace_padding = whitespace_padding,
+                                  pattern = pattern,
+                                  flags = flags,
+                                  fullmatch = fullmatch,
+                                  encoding = encoding,
                                   **kwargs)
     except SyntaxError as error:
         raise error
@@ -1000,7 +1074,11 @@ def is_decimal(value,
 ## FILE-RELATED
 
 @disable_checker_on_env
-def is_bytesIO(value, **kwargs):
+def is_bytesIO(value,
+               minimum_length = None,
+               maximum_length = None,
+               encoding = None,
+               **kwargs):
     """Indicate whether ``value`` is a :class:`BytesIO <python:io.BytesIO>` object.
 
     .. note::
@@ -1010,6 +1088,18 @@ def is_bytesIO(value, **kwargs):
 
     :param value: The value to evaluate.
 
+    :param minimum_length: If supplied, indicates the minimum number of bytes
+      that must remain to be read from ``value`` for it to be valid.
+    :type minimum_length: :class:`int <python:int>`
+
+    :param maximum_length: If supplied, indicates the maximum number of bytes
+      that may remain to be read from ``value`` for it to be valid.
+    :type maximum_length: :class:`int <python:int>`
+
+    :param encoding: If supplied, the name of an encoding that the remaining
+      contents of ``value`` must decode from without error.
+    :type encoding: :class:`str <python:str>` / :obj:`None <python:None>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1017,11 +1107,31 @@ def is_bytesIO(value, **kwargs):
       keyword parameters passed to the underlying validator
 
     """
-    return isinstance(value, io.BytesIO)
+    if not isinstance(value, io.BytesIO):
+        return False
+    elif minimum_length is None and maximum_length is None and encoding is None:
+        return True
+
+    try:
+        value = validators.bytesIO(value,
+                                   minimum_length = minimum_length,
+                                   maximum_length = maximum_length,
+                                   encoding = encoding,
+                                   **kwargs)
+    except SyntaxError as error:
+        raise error
+    except Exception:
+        return False
+
+    return True
 
 
 @disable_checker_on_env
-def is_stringIO(value, **kwargs):
+def is_stringIO(value,
+                minimum_length = None,
+                maximum_length = None,
+                encoding = None,
+                **kwargs):
     """Indicate whether ``value`` is a :class:`StringIO <python:io.StringIO>` object.
 
     .. note::
@@ -1031,6 +1141,18 @@ def is_stringIO(value, **kwargs):
 
     :param value: The value to evaluate.
 
+    :param minimum_length: If supplied, indicates the minimum number of characters
+      that must remain to be read from ``value`` for it to be valid.
+    :type minimum_length: :class:`int <python:int>`
+
+    :param maximum_length: If supplied, indicates the maximum number of characters
+      that may remain to be read from ``value`` for it to be valid.
+    :type maximum_length: :class:`int <python:int>`
+
+    :param encoding: If supplied, the name of an encoding that the remaining
+      contents of ``value`` must encode to without error.
+    :type encoding: :class:`str <python:str>` / :obj:`None <python:None>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1038,7 +1160,23 @@ def is_stringIO(value, **kwargs):
       keyword parameters passed to the underlying validator
 
     """
-    return isinstance(value, io.StringIO)
+    if not isinstance(value, io.StringIO):
+        return False
+    elif minimum_length is None and maximum_length is None and encoding is None:
+        return True
+
+    try:
+        value = validators.stringIO(value,
+                                    minimum_length = minimum_length,
+                                    maximum_length = maximum_length,
+                                    encoding = encoding,
+                                    **kwargs)
+    except SyntaxError as error:
+        raise error
+    except Exception:
+        return False
+
+    return True
 
 
 @disable_checker_on_env
@@ -1345,6 +1483,11 @@ def is_email(value, **kwargs):
 
     :param value: The value to evaluate.
 
+    :param strict_tld: If ``True``, will fail if the domain part of ``value`` does
+      not end in a suffix listed on the `Public Suffix List
+      <https://publicsuffix.org/>`_. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1362,6 +1505,42 @@ def is_email(value, **kwargs):
     return True
 
 
+@disable_checker_on_env
+def is_email_batch(values, **kwargs):
+    """Indicate whether each of ``values`` is an email address, lazily and in
+    order.
+
+    See :func:`email_batch() <validator_collection.validators.email_batch>`,
+    which accepts the same keyword parameters.
+
+    :param values: The values to evaluate.
+    :type values: iterable
+
+    :param strict_tld: If ``True``, will treat an address whose domain part
+      does not end in a suffix listed on the `Public Suffix List
+      <https://publicsuffix.org/>`_ as invalid. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
+    :param cache_size: The number of distinct addresses (and distinct domains)
+      whose results are remembered. Defaults to ``4096``.
+    :type cache_size: :class:`int <python:int>`
+
+    :returns: An iterator that yields ``True`` for each item in ``values`` that
+      is an email address, and ``False`` for each that is not.
+    :rtype: iterator of :class:`bool <python:bool>`
+
+    :raises SyntaxError: if ``kwargs`` contains duplicate keyword parameters or duplicates
+      keyword parameters passed to the underlying validator
+    :raises CannotCoerceError: if ``values`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``values`` is not iterable
+    :raises ValueError: if ``cache_size`` is not a positive integer
+
+    """
+    results = validators.email_batch(values, **kwargs)
+
+    return (result is not None for result in results)
+
+
 @disable_checker_on_env
 def is_url(value, **kwargs):
     """Indicate whether ``value`` is a URL.
@@ -1385,6 +1564,12 @@ def is_url(value, **kwargs):
       will fail if ``value`` is a special IP address. Defaults to ``False``.
     :type allow_special_ips: :class:`bool <python:bool>`
 
+    :param strict_tld: If ``True``, will fail if the host name in ``value`` does
+      not end in a suffix listed on the `Public Suffix List
+      <https://publicsuffix.org/>`_. IP addresses and special-use names (e.g.
+      ``localhost``) are not affected. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1433,6 +1618,17 @@ def is_domain(value, **kwargs):
       If ``False``, will fail if ``value`` is an IP address. Defaults to ``False``.
     :type allow_ips: :class:`bool <python:bool>`
 
+    :param strict_tld: If ``True``, will fail if ``value`` does not end in a
+      suffix listed on the `Public Suffix List <https://publicsuffix.org/>`_, or
+      if ``value`` *is* such a suffix (e.g. ``co.uk``). Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
+    :param strict_idna: If ``True``, will fail if any internationalized label
+      (one containing non-ASCII characters or prefixed with ``xn--``) is not valid
+      under `IDNA 2008 <https://tools.ietf.org/html/rfc5891>`_. Defaults to
+      ``False``.
+    :type strict_idna: :class:`bool <python:bool>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1456,6 +1652,16 @@ def is_ip_address(value, **kwargs):
 
     :param value: The value to evaluate.
 
+    :param allowed: If supplied, will return ``False`` if ``value`` is not
+      within any of these networks. Defaults to :obj:`None <python:None>`.
+    :type allowed: :class:`IPNetworkIndex <validator_collection._ip_index.IPNetworkIndex>`
+      / iterable of :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :param denied: If supplied, will return ``False`` if ``value`` is within any
+      of these networks. Defaults to :obj:`None <python:None>`.
+    :type denied: :class:`IPNetworkIndex <validator_collection._ip_index.IPNetworkIndex>`
+      / iterable of :class:`str <python:str>` / :obj:`None <python:None>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1473,6 +1679,34 @@ def is_ip_address(value, **kwargs):
     return True
 
 
+@disable_checker_on_env
+def is_ip_network(value, **kwargs):
+    """Indicate whether ``value`` is a valid IP network, in CIDR notation
+    (version 4 or version 6).
+
+    :param value: The value to evaluate.
+
+    :param strict: If ``True``, will return ``False`` if ``value`` has any host
+      bits set (e.g. ``192.168.1.1/16``). Defaults to ``True``.
+    :type strict: :class:`bool <python:bool>`
+
+    :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
+    :rtype: :class:`bool <python:bool>`
+
+    :raises SyntaxError: if ``kwargs`` contains duplicate keyword parameters or duplicates
+      keyword parameters passed to the underlying validator
+
+    """
+    try:
+        value = validators.ip_network(value, **kwargs)
+    except SyntaxError as error:
+        raise error
+    except Exception:
+        return False
+
+    return True
+
+
 @disable_checker_on_env
 def is_ipv4(value, **kwargs):
     """Indicate whether ``value`` is a valid IP version 4 address.
@@ -40,6 +40,15 @@ class InvalidVariableNameError(ValueError):
     """
     pass
 
+class InvalidUUIDVersionError(ValueError):
+    """Exception raised when a value is a UUID of a version other than the one
+    expected.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>`
+
+    """
+    pass
+
 class NotADictError(ValueError):
     """Exception raised when a value is not a :class:`dict <python:dict>`.
 
@@ -132,6 +141,25 @@ class WhitespaceInDomainError(InvalidDomainError):
     """
     pass
 
+class UnknownTLDError(InvalidDomainError):
+    """Exception raised when a domain value does not end in a known public suffix.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>` ->
+    :class:`InvalidDomainError`
+
+    """
+    pass
+
+class InvalidIDNAError(InvalidDomainError):
+    """Exception raised when a domain value contains an invalid internationalized
+    (IDNA) label.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>` ->
+    :class:`InvalidDomainError`
+
+    """
+    pass
+
 class InvalidIPAddressError(ValueError):
     """Exception raised when a value is not a valid IP address.
 
@@ -140,6 +168,23 @@ class InvalidIPAddressError(ValueError):
     """
     pass
 
+class DisallowedIPAddressError(InvalidIPAddressError):
+    """Exception raised when a value is an IP address that is not within the
+    allowed networks, or that is within the denied networks.
+
+    **INHERITS FROM:** :class:`InvalidIPAddressError`
+
+    """
+    pass
+
+class InvalidIPNetworkError(ValueError):
+    """Exception raised when a value is not a valid IP network.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>`
+
+    """
+    pass
+
 class InvalidMACAddressError(ValueError):
     """Exception raised when a value is not a valid MAC address.
 
@@ -174,6 +219,17 @@ class MaximumLengthError(ValueError):
     """
     pass
 
+class JSONLimitError(MaximumLengthError):
+    """Exception raised when a JSON document exceeds a limit on its size, its
+    nesting, the number of items in one of its arrays or objects, or the length
+    of one of its strings.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>` ->
+    :class:`MaximumLengthError`
+
+    """
+    pass
+
 class MinimumLengthError(ValueError):
     """Exception raised when a value has a lower length than the minimum allowed.
 
@@ -182,6 +238,24 @@ class MinimumLengthError(ValueError):
     """
     pass
 
+class PatternMismatchError(ValueError):
+    """Exception raised when a value does not match the pattern it is expected
+    to match.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>`
+
+    """
+    pass
+
+class InvalidEncodingError(ValueError):
+    """Exception raised when a value does not conform to the encoding it is
+    expected to have.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>`
+
+    """
+    pass
+
 class MaximumValueError(ValueError):
     """Exception raised when a value exceeds a maximum allowed value.
 
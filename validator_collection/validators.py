@@ -5,25 +5,39 @@
 # extension, and its member function documentation is automatically incorporated
 # there as needed.
 
+import codecs
 import decimal as decimal_
+import encodings.idna
 import fractions
 import io
+import keyword
 import math
+import mmap
+import multiprocessing
 import os
 import uuid as uuid_
 import datetime as datetime_
 import string as string_
 import sys
-
-from ast import parse
-
-import jsonschema
+import types
 
 from validator_collection._compat import numeric_types, integer_types, datetime_types,\
     date_types, time_types, timestamp_types, tzinfo_types, POSITIVE_INFINITY, \
-    NEGATIVE_INFINITY, TimeZone, json_, is_py2, is_py3, dict_, float_, basestring, re
+    NEGATIVE_INFINITY, TimeZone, is_py2, is_py3, dict_, float_, basestring, re, \
+    idna_, ipaddress_, numpy_
+from validator_collection._cache import LRUCache
 from validator_collection._decorators import disable_on_env
-from validator_collection import errors
+from validator_collection._ip_index import IPNetworkIndex
+from validator_collection._json_backends import JSONBackend, register_json_backend, \
+    get_json_backend, set_json_backend, json_backends, benchmark_json_backends
+from validator_collection._json_lines import JSONLineResult, iter_lines, \
+    iter_range_lines, newline_ranges
+from validator_collection._json_schema import CompiledJSONSchema, FormatChecker, \
+    ANNOTATION_KEYWORDS
+from validator_collection._json_stream import JSONArrayReader, JSONElementResult
+from validator_collection._json_syntax import check_json_syntax
+from validator_collection._public_suffix import has_public_suffix
+from validator_collection import _batch, errors
 
 
 URL_REGEX = re.compile(
@@ -119,17 +133,85 @@ EMAIL_REGEX = re.compile(
     r"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])"
 )
 
+# Matches the common ``dot-atom@host.name`` form in a single pass, capturing the
+# local part and the domain.
+EMAIL_SIMPLE_REGEX = re.compile(
+    r"([a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*)"
+    r"@((?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?)\Z"
+)
+
+# Finds the characters that give an email address its structure: ``@``,
+# quotes, angle brackets, and parentheses.
+EMAIL_TOKEN_REGEX = re.compile(r'[@"<>()]')
+
 VARIABLE_NAME_REGEX = re.compile(
     r"(^[a-zA-Z_])([a-zA-Z0-9_]*)"
 )
 
+PYTHON_KEYWORDS = frozenset(keyword.kwlist)
+
+PYTHON_SOFT_KEYWORDS = frozenset(['_', 'case', 'match', 'type']) | \
+    frozenset(getattr(keyword, 'softkwlist', []))
+
+
+JSON_TIME_REGEX = re.compile(
+    r'^(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:[zZ]|([+-]\d{2}:\d{2}))?$'
+)
 
 MAC_ADDRESS_REGEX = re.compile(r'^(?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$')
 
+HEX_DIGITS = frozenset('0123456789abcdef')
+
 IPV6_REGEX = re.compile(
     '^(?:(?:[0-9A-Fa-f]{1,4}:){6}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|::(?:[0-9A-Fa-f]{1,4}:){5}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){4}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){3}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,2}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){2}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,3}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}:(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,4}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,5}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}|(?:(?:[0-9A-Fa-f]{1,4}:){,6}[0-9A-Fa-f]{1,4})?::)(?:%25(?:[A-Za-z0-9\\-._~]|%[0-9A-Fa-f]{2})+)?$'
 )
 
+# Matches the zone ID of an IPv6 address, in its URI form (RFC 6874).
+IPV6_ZONE_REGEX = re.compile(r'%25(?:[a-z0-9\-._~]|%[0-9a-f]{2})+\Z')
+
+IPV6_CHARACTERS = frozenset('0123456789abcdef:.')
+
+# Maps each valid network prefix length (as written) to its value.
+IP_PREFIX_LENGTHS = dict((str(x), x) for x in range(129))
+
+# Matches the IPv4 address that may end an IPv6 address, whose octets may not
+# have leading zeros.
+IPV6_EMBEDDED_IPV4_REGEX = re.compile(
+    r'(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.'
+    r'(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.'
+    r'(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.'
+    r'(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\Z'
+)
+
+#: Holds the IDNA A-label (or ``False`` if invalid) for recently-seen domain labels.
+_IDNA_LABEL_CACHE = LRUCache(maxsize = 4096)
+
+#: Holds recent domain verdicts, once enabled by :func:`enable_domain_cache`.
+_DOMAIN_CACHE = None
+
+#: Holds recently-used patterns passed to :func:`string`, compiled.
+_PATTERN_CACHE = LRUCache(maxsize = 256)
+
+#: Holds recently-used schemas passed to :func:`json`, compiled. Dictionaries
+#: are keyed by identity and strings by their contents.
+_JSON_SCHEMA_CACHE = LRUCache(maxsize = 128)
+
+#: The format checker used by :func:`json`, created on first use by
+#: :func:`_json_format_checker`.
+_JSON_FORMAT_CHECKER = None
+
+#: Holds the memory-mapped file and compiled schema of a worker process started
+#: by :func:`json_lines_parallel`.
+_JSON_LINES_WORKER = None
+
+#: The number of bytes (or characters) checked at a time when validating an
+#: encoding.
+ENCODING_CHUNK_SIZE = 65536
+
+#: The (normalized) names of encodings in which any ASCII text is encoded as the
+#: same bytes as in ASCII.
+ASCII_COMPATIBLE_ENCODINGS = frozenset(['ascii', 'utf-8', 'iso8859-1', 'cp1252'])
+
 # pylint: disable=W0613
 
 ## CORE
@@ -137,10 +219,15 @@ IPV6_REGEX = re.compile(
 @disable_on_env
 def uuid(value,
          allow_empty = False,
+         version = None,
          **kwargs):
     """Validate that ``value`` is a valid :class:`UUID <python:uuid.UUID>`.
 
-    :param value: The value to validate.
+    :param value: The value to validate. A :class:`bytes <python:bytes>`,
+      :class:`bytearray <python:bytearray>`, or
+      :class:`memoryview <python:memoryview>` value of 16 bytes is treated as
+      the bytes of a UUID in big-endian order, and one of any other length as
+      ASCII text (e.g. ``b'123e4567-e89b-12d3-a456-426655440000'``).
 
     :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
       ``value`` is empty. If ``False``, raises a
@@ -148,6 +235,10 @@ def uuid(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
+    :param version: If supplied, the `RFC 4122 <https://tools.ietf.org/html/rfc4122>`_
+      version that the UUID must have. Defaults to :obj:`None <python:None>`.
+    :type version: :class:`int <python:int>` / :obj:`None <python:None>`
+
     :returns: ``value`` coerced to a :class:`UUID <python:uuid.UUID>` object /
       :obj:`None <python:None>`
     :rtype: :class:`UUID <python:uuid.UUID>` / :obj:`None <python:None>`
@@ -155,6 +246,8 @@ def uuid(value,
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises CannotCoerceError: if ``value`` cannot be coerced to a
       :class:`UUID <python:uuid.UUID>`
+    :raises InvalidUUIDVersionError: if ``version`` is supplied and ``value`` is
+      not a UUID of that version
 
     """
     if not value and not allow_empty:
@@ -162,17 +255,176 @@ def uuid(value,
     elif not value:
         return None
 
-    if isinstance(value, uuid_.UUID):
-        return value
+    if isinstance(value, (bytearray, memoryview)) or \
+       (isinstance(value, bytes) and not is_py2):
+        packed = _uuid_bytes_to_int(value)
+        if packed is not None:
+            value = uuid_.UUID(int = packed)
+        else:
+            try:
+                value = uuid_.UUID(_byte_view(value).tobytes().decode('ascii'))
+            except (TypeError, ValueError):
+                raise errors.CannotCoerceError('value (%s) cannot be coerced to a '
+                                               'valid UUID' % value)
+    elif not isinstance(value, uuid_.UUID):
+        try:
+            value = uuid_.UUID(value)
+        except (AttributeError, TypeError, ValueError):
+            raise errors.CannotCoerceError('value (%s) cannot be coerced to a '
+                                           'valid UUID' % value)
 
-    try:
-        value = uuid_.UUID(value)
-    except ValueError:
-        raise errors.CannotCoerceError('value (%s) cannot be coerced to a valid UUID')
+    if version is not None and value.version != version:
+        raise errors.InvalidUUIDVersionError('value (%s) is not a version %s '
+                                             'UUID' % (value, version))
 
     return value
 
 
+def _uuid_bytes_to_int(value):
+    """Return the 16 bytes in the buffer ``value`` as a 128-bit integer, or
+    :obj:`None <python:None>` if ``value`` does not hold exactly 16 bytes.
+
+    :rtype: :class:`int <python:int>` / :obj:`None <python:None>`
+    """
+    view = memoryview(value)
+    if is_py2:
+        data = view.tobytes()
+        if len(data) != 16:
+            return None
+        return int(data.encode('hex'), 16)
+
+    if view.nbytes != 16:
+        return None
+    elif not view.contiguous:
+        view = view.tobytes()
+
+    return int.from_bytes(view, 'big')
+
+
+@disable_on_env
+def uuid_batch(values,
+               version = None,
+               chunk_size = 65536,
+               **kwargs):
+    """Validate each of ``values`` as a :class:`UUID <python:uuid.UUID>`,
+    returning them as a `NumPy <https://numpy.org/>`_ array of their bytes.
+
+    UUIDs in the canonical, hyphenated form (e.g.
+    ``123e4567-e89b-12d3-a456-426655440000``) are parsed ``chunk_size`` at a
+    time by vectorized NumPy operations. Any other value is accepted or
+    rejected individually, by the same rules as
+    :func:`uuid() <validator_collection.validators.uuid>`.
+
+    .. note::
+
+      Requires `NumPy <https://numpy.org/>`_.
+
+    :param values: The values to validate. As in
+      :func:`uuid() <validator_collection.validators.uuid>`, a
+      :class:`bytes <python:bytes>`, :class:`bytearray <python:bytearray>`, or
+      :class:`memoryview <python:memoryview>` value of 16 bytes is treated as
+      the bytes of a UUID in big-endian order, and one of any other length as
+      ASCII text. So is each item of a NumPy bytes array: the items of an
+      ``S16`` array are the bytes of UUIDs, and those of any other ``S`` array
+      are text.
+    :type values: :class:`numpy.ndarray` of :class:`str <python:str>` or
+      :class:`bytes <python:bytes>` / iterable
+
+    :param version: If supplied, the `RFC 4122 <https://tools.ietf.org/html/rfc4122>`_
+      version that each UUID must have. Defaults to :obj:`None <python:None>`.
+    :type version: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param chunk_size: The number of values to parse at once, which bounds the
+      memory used by intermediate arrays. Defaults to ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
+    :returns: A ``uint8`` array with one row of 16 bytes (in big-endian order)
+      for each valid UUID (and zeros for each invalid value), and a boolean
+      array indicating which values are valid.
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``values`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``values`` is not iterable
+    """
+    values = _batch_values(values)
+    count = len(values)
+    packed = numpy_.zeros((count, 16), dtype = numpy_.uint8)
+    is_valid = numpy_.zeros(count, dtype = numpy_.bool_)
+
+    for start in range(0, count, chunk_size):
+        chunk = values[start:start + chunk_size]
+        if isinstance(chunk, numpy_.ndarray) and chunk.dtype.kind == 'S' and \
+           chunk.dtype.itemsize == 16:
+            packed[start:start + len(chunk)], is_valid[start:start + len(chunk)] = \
+                _uuid_array_bytes(chunk, version)
+            continue
+
+        if isinstance(chunk, numpy_.ndarray) and chunk.dtype.kind in 'SU':
+            texts = None
+        else:
+            # 16 bytes are checked individually, as the bytes of a UUID.
+            texts = [str(x) if isinstance(x, uuid_.UUID) else
+                     '' if isinstance(x, bytes) and not is_py2 and len(x) == 16 else
+                     _batch_text(x)
+                     for x in chunk]
+            chunk = numpy_.array(texts, dtype = numpy_.str_)
+
+        chunk_packed, chunk_is_valid = _batch.uuid_to_bytes(
+            _batch.character_codes(chunk)
+        )
+
+        needs_check = ~chunk_is_valid
+        if texts is not None:
+            # Trailing NUL characters are dropped when converting to an array.
+            lengths = numpy_.fromiter((len(x) for x in texts),
+                                      dtype = numpy_.intp,
+                                      count = len(texts))
+            needs_check |= numpy_.char.str_len(chunk) != lengths
+
+        for index in numpy_.flatnonzero(needs_check):
+            if texts is not None:
+                value = values[start + index]
+            else:
+                value = chunk[index]
+
+            try:
+                chunk_packed[index] = numpy_.frombuffer(uuid(value).bytes,
+                                                        dtype = numpy_.uint8)
+                chunk_is_valid[index] = True
+            except (AttributeError, TypeError, ValueError):
+                chunk_packed[index] = 0
+                chunk_is_valid[index] = False
+
+        if version is not None:
+            chunk_is_valid &= (chunk_packed[:, 6] >> 4) == version
+            chunk_is_valid &= (chunk_packed[:, 8] >> 6) == 2
+            chunk_packed[~chunk_is_valid] = 0
+
+        packed[start:start + len(chunk)] = chunk_packed
+        is_valid[start:start + len(chunk)] = chunk_is_valid
+
+    return packed, is_valid
+
+
+def _uuid_array_bytes(values, version = None):
+    """Return the UUIDs whose 16 bytes are the items of the ``S16`` NumPy array
+    ``values``, as returned by
+    :func:`uuid_batch() <validator_collection.validators.uuid_batch>`.
+
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+    """
+    count = len(values)
+    packed = numpy_.ascontiguousarray(values).view(numpy_.uint8).reshape(count, 16).copy()
+    is_valid = numpy_.ones(count, dtype = numpy_.bool_)
+    if version is not None:
+        is_valid &= (packed[:, 6] >> 4) == version
+        is_valid &= (packed[:, 8] >> 6) == 2
+        packed[~is_valid] = 0
+
+    return packed, is_valid
+
+
 @disable_on_env
 def string(value,
            allow_empty = False,
@@ -180,6 +432,10 @@ def string(value,
            minimum_length = None,
            maximum_length = None,
            whitespace_padding = False,
+           pattern = None,
+           flags = 0,
+           fullmatch = False,
+           encoding = None,
            **kwargs):
     """Validate that ``value`` is a valid string.
 
@@ -209,6 +465,46 @@ def string(value,
       ``minimum_length``, pad the value with spaces. Defaults to ``False``.
     :type whitespace_padding: :class:`bool <python:bool>`
 
+    :param pattern: If supplied, a regular expression that ``value`` must match.
+      Patterns supplied as strings are compiled once and kept in a bounded cache
+      of recently-used patterns.
+
+      .. hint::
+
+        The ``maximum_length`` is checked *before* the ``pattern``, so supplying
+        one prevents overly long values from ever reaching the regular
+        expression engine.
+
+    :type pattern: :class:`str <python:str>` / compiled regular expression /
+      :obj:`None <python:None>`
+
+    :param flags: The flags (e.g. :data:`re.IGNORECASE <python:re.IGNORECASE>`)
+      to compile ``pattern`` with. Defaults to ``0``.
+    :type flags: :class:`int <python:int>`
+
+    :param fullmatch: If ``True``, the whole of ``value`` must match ``pattern``.
+      If ``False``, ``value`` need only begin with a match for ``pattern`` (as
+      with :func:`re.match() <python:re.match>`). Defaults to ``False``.
+    :type fullmatch: :class:`bool <python:bool>`
+
+    :param encoding: If supplied, the name of an encoding (e.g. ``'utf-8'`` or
+      ``'ascii'``) that ``value`` must conform to. Binary values
+      (:class:`bytes <python:bytes>`, :class:`bytearray <python:bytearray>`, or
+      :class:`memoryview <python:memoryview>`) must decode without error, and
+      text values must encode without error. Binary values are checked in place,
+      without creating the decoded string, unless ``coerce_value`` or
+      ``whitespace_padding`` is ``True`` or a ``pattern`` is supplied, in which
+      case they are decoded and the decoded string is returned.
+      Defaults to :obj:`None <python:None>`.
+
+      .. hint::
+
+        When ``encoding`` is supplied, ``minimum_length`` and ``maximum_length``
+        are measured in bytes for binary values that are checked in place, and
+        in characters for those that are decoded.
+
+    :type encoding: :class:`str <python:str>` / :obj:`None <python:None>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
 
@@ -220,6 +516,14 @@ def string(value,
       ``False``
     :raises MaximumLengthError: if ``maximum_length`` is supplied and the length of
       ``value`` is more than the ``maximum_length``
+    :raises PatternMismatchError: if ``pattern`` is supplied and ``value`` does
+      not match it
+    :raises InvalidEncodingError: if ``encoding`` is supplied and ``value`` does
+      not conform to it
+    :raises ValidatorUsageError: if ``pattern`` is not a valid regular expression,
+      if ``flags`` are supplied with an already-compiled ``pattern``, if
+      ``pattern`` is a bytes pattern applied to text (or vice versa), or if
+      ``encoding`` is not the name of a known text encoding
     """
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
@@ -229,27 +533,184 @@ def string(value,
     minimum_length = integer(minimum_length, allow_empty = True)
     maximum_length = integer(maximum_length, allow_empty = True)
 
-    if coerce_value:
+    is_binary = encoding is not None and \
+        (isinstance(value, (bytearray, memoryview)) or
+         (isinstance(value, bytes) and not isinstance(value, str)))
+
+    if is_binary and (coerce_value or whitespace_padding or pattern is not None):
+        value = _decode(value, encoding)
+    elif encoding is not None and not is_binary and coerce_value:
+        value = str(value)
+        _check_encoding(value, encoding)
+    elif encoding is not None:
+        if not is_binary and not isinstance(value, basestring):
+            raise errors.CannotCoerceError('value (%s) was not coerced to a '
+                                           'string' % value)
+        _check_encoding(value, encoding)
+    elif coerce_value:
         value = str(value)
     elif not isinstance(value, basestring):
         raise errors.CannotCoerceError('value (%s) was not coerced to a string' % value)
 
-    if value and maximum_length and len(value) > maximum_length:
+    if isinstance(value, memoryview):
+        length = value.nbytes
+        shown = value.tobytes()
+    else:
+        length = len(value)
+        shown = value
+
+    if value and maximum_length and length > maximum_length:
         raise errors.MaximumLengthError(
-            'value (%s) exceeds maximum length %s' % (value, maximum_length)
+            'value (%s) exceeds maximum length %s' % (shown, maximum_length)
         )
 
-    if value and minimum_length and len(value) < minimum_length:
+    if value and minimum_length and length < minimum_length:
         if whitespace_padding:
             value = value.ljust(minimum_length, ' ')
         else:
             raise errors.MinimumLengthError(
-                'value (%s) is below the minimum length %s' % (value, minimum_length)
+                'value (%s) is below the minimum length %s' % (shown, minimum_length)
+            )
+
+    if pattern is not None:
+        compiled = _compile_pattern(pattern, flags)
+        try:
+            if fullmatch:
+                is_valid = compiled.fullmatch(value)
+            else:
+                is_valid = compiled.match(value)
+        except TypeError:
+            raise errors.ValidatorUsageError('pattern (%s) cannot be applied to a '
+                                             'value of type %s' % (compiled.pattern,
+                                                                   type(value)))
+
+        if not is_valid:
+            raise errors.PatternMismatchError(
+                'value (%s) does not match the pattern %s' % (value, compiled.pattern)
             )
 
     return value
 
 
+def _codec_info(encoding):
+    """Return the :class:`CodecInfo <python:codecs.CodecInfo>` for the text
+    encoding named ``encoding``.
+
+    :raises ValidatorUsageError: if ``encoding`` is not the name of a known text
+      encoding
+    """
+    try:
+        codec = codecs.lookup(encoding)
+    except (LookupError, TypeError):
+        raise errors.ValidatorUsageError('encoding (%s) is not a known '
+                                         'encoding' % encoding)
+
+    if not getattr(codec, '_is_text_encoding', True):
+        raise errors.ValidatorUsageError('encoding (%s) is not a text '
+                                         'encoding' % encoding)
+
+    return codec
+
+
+def _is_ascii(value):
+    """Indicate whether ``value`` (text, :class:`bytes <python:bytes>`, or
+    :class:`bytearray <python:bytearray>`) consists solely of ASCII characters,
+    or return :obj:`None <python:None>` if that cannot be determined cheaply.
+
+    :rtype: :class:`bool <python:bool>` / :obj:`None <python:None>`
+    """
+    try:
+        return value.isascii()
+    except AttributeError:
+        return None
+
+
+def _check_encoding(value, encoding):
+    """Check that ``value`` conforms to ``encoding``: binary values must decode,
+    and text values must encode, without error.
+
+    The value is checked ``ENCODING_CHUNK_SIZE`` bytes (or characters) at a
+    time, so that no more than one chunk is ever converted at once.
+
+    :raises InvalidEncodingError: if ``value`` does not conform to ``encoding``
+    :raises ValidatorUsageError: if ``encoding`` is not the name of a known text
+      encoding
+    """
+    codec = _codec_info(encoding)
+    if codec.name in ASCII_COMPATIBLE_ENCODINGS and _is_ascii(value):
+        return
+
+    is_text = isinstance(value, basestring) and not isinstance(value, bytes)
+    if is_text:
+        converter = codec.incrementalencoder('strict').encode
+    else:
+        converter = codec.incrementaldecoder('strict').decode
+        value = _byte_view(value)
+
+    try:
+        for start in range(0, len(value), ENCODING_CHUNK_SIZE):
+            converter(value[start:start + ENCODING_CHUNK_SIZE])
+        converter(value[:0], True)
+    except UnicodeError as error:
+        raise errors.InvalidEncodingError('value is not valid %s: %s' % (encoding, error))
+
+
+def _byte_view(value):
+    """Return a one-dimensional :class:`memoryview <python:memoryview>` of the
+    bytes in the buffer ``value``, copying them only if they are not contiguous.
+
+    :rtype: :class:`memoryview <python:memoryview>`
+    """
+    view = memoryview(value)
+    if not getattr(view, 'c_contiguous', True):
+        return memoryview(view.tobytes())
+    elif view.ndim == 1 and view.itemsize == 1:
+        return view
+
+    return view.cast('B')
+
+
+def _decode(value, encoding):
+    """Return the binary ``value`` decoded from ``encoding``.
+
+    :raises InvalidEncodingError: if ``value`` cannot be decoded
+    :raises ValidatorUsageError: if ``encoding`` is not the name of a known text
+      encoding
+    """
+    codec = _codec_info(encoding)
+    try:
+        return codec.decode(_byte_view(value), 'strict')[0]
+    except UnicodeError as error:
+        raise errors.InvalidEncodingError('value is not valid %s: %s' % (encoding, error))
+
+
+def _compile_pattern(pattern, flags = 0):
+    """Return the regular expression ``pattern`` compiled with ``flags``, using
+    a cache of recently-compiled patterns.
+
+    :raises ValidatorUsageError: if ``pattern`` is not a valid regular expression,
+      or if ``flags`` are supplied with an already-compiled ``pattern``
+    """
+    if hasattr(pattern, 'match'):
+        if flags:
+            raise errors.ValidatorUsageError('flags cannot be applied to an '
+                                             'already-compiled pattern')
+        return pattern
+
+    key = (type(pattern), pattern, flags)
+    compiled = _PATTERN_CACHE.get(key)
+    if compiled is None:
+        try:
+            compiled = re.compile(pattern, flags)
+        except (re.error, TypeError, ValueError) as error:
+            raise errors.ValidatorUsageError('pattern (%s) is not a valid regular '
+                                             'expression: %s' % (pattern, error))
+
+        _PATTERN_CACHE.set(key, compiled)
+
+    return compiled
+
+
 @disable_on_env
 def iterable(value,
              allow_empty = False,
@@ -373,6 +834,7 @@ def not_empty(value,
 @disable_on_env
 def variable_name(value,
                   allow_empty = False,
+                  allow_soft_keywords = True,
                   **kwargs):
     """Validate that the value is a valid Python variable name.
 
@@ -390,28 +852,34 @@ def variable_name(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
+    :param allow_soft_keywords: If ``False``, will also reject Python's soft
+      keywords (``_``, ``case``, ``match``, and ``type``), which are only
+      reserved in some contexts. Defaults to ``True``.
+    :type allow_soft_keywords: :class:`bool <python:bool>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``allow_empty`` is ``False`` and ``value``
       is empty
+    :raises InvalidVariableNameError: if ``value`` is not a valid variable name
     """
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
     elif not value:
         return None
 
-    is_valid = VARIABLE_NAME_REGEX.fullmatch(value)
-
-    print('is_valid: %s' % is_valid)
-    if not is_valid:
-        raise errors.InvalidVariableNameError(
-            'value (%s) is not a valid variable name' % value
-        )
-
     try:
-        parse('%s = None' % value)
-    except (SyntaxError, ValueError, TypeError):
+        if is_py2:
+            match = VARIABLE_NAME_REGEX.match(value)
+            is_valid = match is not None and match.end() == len(value)
+        else:
+            is_valid = value.isidentifier()
+    except (AttributeError, TypeError):
+        is_valid = False
+
+    if not is_valid or value in PYTHON_KEYWORDS or \
+       (not allow_soft_keywords and value in PYTHON_SOFT_KEYWORDS):
         raise errors.InvalidVariableNameError(
             'value (%s) is not a valid variable name' % value
         )
@@ -419,21 +887,61 @@ def variable_name(value,
     return value
 
 
+# The types of value that are deserialized as JSON documents.
+_JSON_TEXT_TYPES = (basestring, bytes, bytearray, memoryview)
+
+
+def _json_size(value):
+    """Return the size of the JSON document ``value``: in bytes if it is
+    bytes-like, and in characters if it is a string.
+
+    :rtype: :class:`int <python:int>`
+    """
+    if isinstance(value, memoryview):
+        return value.nbytes
+
+    return len(value)
+
+
+def _check_json_size(value, max_bytes):
+    """Check that the JSON document ``value`` is no larger than ``max_bytes``,
+    without copying it.
+
+    :raises JSONLimitError: if ``value`` is larger than ``max_bytes``
+    """
+    if max_bytes is None:
+        return
+
+    max_bytes = integer(max_bytes, minimum = 0)
+    size = _json_size(value)
+    if size > max_bytes:
+        unit = 'bytes' if isinstance(value, (bytes, bytearray, memoryview)) else 'characters'
+        raise errors.JSONLimitError(
+            'value (%s %s) exceeds max_bytes (%s)' % (size, unit, max_bytes)
+        )
+
+
 @disable_on_env
 def dict(value,
          allow_empty = False,
          json_serializer = None,
+         max_bytes = None,
          **kwargs):
     """Validate that ``value`` is a :class:`dict <python:dict>`.
 
     .. hint::
 
-      If ``value`` is a string, this validator will assume it is a JSON
-      object and try to convert it into a :class:`dict <python:dict>`
+      If ``value`` is a string (or a :class:`bytes <python:bytes>`,
+      :class:`bytearray <python:bytearray>`, or
+      :class:`memoryview <python:memoryview>` holding UTF-8), this validator will
+      assume it is a JSON object and try to convert it into a
+      :class:`dict <python:dict>`. Bytes-like values are passed to the JSON backend
+      without being decoded first, where the backend supports it.
 
       You can override the JSON serializer used by passing it to the
-      ``json_serializer`` property. By default, will utilize the Python
-      :class:`json <json>` encoder/decoder.
+      ``json_serializer`` property. By default, will utilize the JSON backend
+      returned by
+      :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
 
     :param value: The value to validate.
 
@@ -444,10 +952,16 @@ def dict(value,
     :type allow_empty: :class:`bool <python:bool>`
 
     :param json_serializer: The JSON encoder/decoder to use to deserialize a
-      string passed in ``value``. If not supplied, will default to the Python
-      :class:`json <python:json>` encoder/decoder.
+      string passed in ``value``. If not supplied, will default to the JSON backend
+      returned by :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
     :type json_serializer: callable
 
+    :param max_bytes: If supplied, the maximum size of a string or bytes-like
+      ``value``, checked before it is deserialized. Bytes-like values are
+      measured in bytes, and strings in characters. Defaults to
+      :obj:`None <python:None>`.
+    :type max_bytes: :class:`int <python:int>` / :obj:`None <python:None>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`dict <python:dict>` / :obj:`None <python:None>`
 
@@ -455,6 +969,7 @@ def dict(value,
     :raises CannotCoerceError: if ``value`` cannot be coerced to a
       :class:`dict <python:dict>`
     :raises NotADictError: if ``value`` is not a :class:`dict <python:dict>`
+    :raises JSONLimitError: if ``value`` is larger than ``max_bytes``
 
     """
     original_value = value
@@ -464,9 +979,10 @@ def dict(value,
         return None
 
     if json_serializer is None:
-        json_serializer = json_
+        json_serializer = get_json_backend()
 
-    if isinstance(value, str):
+    if isinstance(value, _JSON_TEXT_TYPES):
+        _check_json_size(value, max_bytes)
         try:
             value = json_serializer.loads(value)
         except Exception:
@@ -488,6 +1004,12 @@ def json(value,
          schema = None,
          allow_empty = False,
          json_serializer = None,
+         check_formats = True,
+         syntax_only = False,
+         max_depth = None,
+         max_bytes = None,
+         max_items = None,
+         max_string_length = None,
          **kwargs):
     """Validate that ``value`` conforms to the supplied JSON Schema.
 
@@ -500,15 +1022,27 @@ def json(value,
     .. hint::
 
       If either ``value`` or ``schema`` is a string, this validator will assume it is a
-      JSON object and try to convert it into a :class:`dict <python:dict>`.
+      JSON object and try to convert it into a :class:`dict <python:dict>`. A
+      :class:`bytes <python:bytes>`, :class:`bytearray <python:bytearray>`, or
+      :class:`memoryview <python:memoryview>` ``value`` holding UTF-8 is passed to
+      the JSON backend without being decoded first, where the backend supports it.
 
       You can override the JSON serializer used by passing it to the
-      ``json_serializer`` property. By default, will utilize the Python
-      :class:`json <json>` encoder/decoder.
+      ``json_serializer`` property. By default, will utilize the JSON backend
+      returned by
+      :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
 
     :param value: The value to validate.
 
-    :param schema: An optional JSON Schema against which ``value`` will be validated.
+    :param schema: An optional JSON Schema against which ``value`` will be
+      validated. Schemas are compiled on first use and cached, keyed by the
+      identity of a :class:`dict <python:dict>` or the contents of a
+      :class:`str <python:str>`, so a schema should not be changed once it has
+      been used. To hold onto a compiled schema yourself, pass the result of
+      :func:`compile_json_schema() <validator_collection.validators.compile_json_schema>`.
+    :type schema: :class:`dict <python:dict>` / :class:`str <python:str>` /
+      :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
 
     :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
       ``value`` is empty. If ``False``, raises a
@@ -517,153 +1051,1040 @@ def json(value,
     :type allow_empty: :class:`bool <python:bool>`
 
     :param json_serializer: The JSON encoder/decoder to use to deserialize a
-      string passed in ``value``. If not supplied, will default to the Python
-      :class:`json <python:json>` encoder/decoder.
+      string passed in ``value``. If not supplied, will default to the JSON backend
+      returned by :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
     :type json_serializer: callable
 
+    :param check_formats: If ``True``, will check the ``email``, ``uri``,
+      ``ipv4``, ``ipv6``, ``date-time``, ``date``, ``time``, and ``uuid`` formats
+      of strings in ``value`` using the corresponding validators in this
+      library. If ``False``, ``format`` is treated as an annotation and not
+      checked. Has no effect if ``schema`` is already compiled. Defaults to
+      ``True``.
+    :type check_formats: :class:`bool <python:bool>`
+
+    :param syntax_only: If ``True``, will only check that a string (or
+      bytes-like) ``value`` is a well-formed JSON object or array, without
+      deserializing it, and will return ``value`` unchanged. This is much
+      lighter on memory than deserializing ``value``, but cannot be combined
+      with ``schema``. Defaults to ``False``.
+    :type syntax_only: :class:`bool <python:bool>`
+
+    :param max_depth: If supplied, the maximum number of objects and arrays that
+      may be nested within one another in a string or bytes-like ``value``
+      (counting the outermost). Defaults to :obj:`None <python:None>`.
+    :type max_depth: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_bytes: If supplied, the maximum size of a string or bytes-like
+      ``value``, checked before it is deserialized. Bytes-like values are
+      measured in bytes, and strings in characters. Defaults to
+      :obj:`None <python:None>`.
+    :type max_bytes: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_items: If supplied, the maximum number of items of any one array,
+      or members of any one object, in a string or bytes-like ``value``.
+      Defaults to :obj:`None <python:None>`.
+    :type max_items: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param max_string_length: If supplied, the maximum length of any string
+      (including the names of members) in a string or bytes-like ``value``,
+      once escape sequences are decoded. The strings of a bytes-like ``value``
+      are measured in bytes, as encoded in UTF-8. Defaults to
+      :obj:`None <python:None>`.
+    :type max_string_length: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    .. caution::
+
+      Checking ``max_items`` or ``max_string_length`` uses regular expressions
+      compiled for each distinct ``max_string_length``, and each ``max_items``
+      of ``256`` or fewer, which takes some 70 ms the first time they are used.
+      Only the 16 most recently used sets are kept, so use a small, fixed set of
+      limits rather than varying them from one call to the next.
+
+    .. note::
+
+      ``max_depth``, ``max_items``, and ``max_string_length`` are not checked by
+      the JSON backend, which offers no way to limit what it deserializes.
+      Instead, ``value`` is first scanned by
+      :func:`check_json_syntax() <validator_collection._json_syntax.check_json_syntax>`,
+      without deserializing anything, so that a document that exceeds a limit
+      is rejected as soon as the part that exceeds it has been read. A document
+      within the limits is then read a second time, by the backend. The scan
+      can take several times as long as deserializing the document with a fast
+      JSON backend, so is skipped where the size of ``value`` alone shows that
+      it cannot exceed the limits.
+
+      If ``value`` is not strict JSON (e.g. it contains ``NaN``), it is left to
+      the JSON backend to accept or reject, as it would be without limits, and
+      the limits are then checked against the deserialized value.
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`dict <python:dict>` / :class:`list <python:list>` of
-      :class:`dict <python:dict>` / :obj:`None <python:None>`
+      :class:`dict <python:dict>` / :class:`str <python:str>` /
+      :class:`bytes <python:bytes>` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises CannotCoerceError: if ``value`` cannot be coerced to a
       :class:`dict <python:dict>`
-    :raises NotJSONError: if ``value`` cannot be deserialized from JSON
+    :raises NotJSONError: if ``value`` cannot be deserialized from JSON, or (if
+      ``syntax_only`` is ``True``) is not a well-formed JSON object or array
     :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema object
     :raises JSONValidationError: if ``value`` does not validate against the JSON Schema
+    :raises ValidatorUsageError: if ``syntax_only`` is ``True`` and ``schema`` is
+      supplied
+    :raises JSONLimitError: if ``value`` is larger than ``max_bytes``, or exceeds
+      ``max_depth``, ``max_items``, or ``max_string_length``
 
     """
     original_value = value
-    original_schema = schema
 
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
     elif not value:
         return None
 
+    if isinstance(value, _JSON_TEXT_TYPES):
+        _check_json_size(value, max_bytes)
+
+    if syntax_only:
+        return _json_syntax(value, schema, max_depth, max_items, max_string_length)
+
     if not json_serializer:
-        json_serializer = json_
+        json_serializer = get_json_backend()
+
+    if isinstance(value, _JSON_TEXT_TYPES):
+        limits = _json_limits(max_depth, max_items, max_string_length,
+                              size = _json_size(value))
+        is_within_limits = limits is None
+        if not is_within_limits:
+            try:
+                check_json_syntax(value, *limits)
+                is_within_limits = True
+            except errors.NotJSONError:
+                pass
 
-    if isinstance(value, str):
         try:
             value = json_serializer.loads(value)
         except Exception:
             raise errors.CannotCoerceError(
                 'value (%s) cannot be deserialized from JSON' % original_value
             )
-    if isinstance(schema, str):
-        try:
-            schema = dict(schema,
-                          allow_empty = allow_empty,
-                          json_serializer = json_serializer,
-                          **kwargs)
-        except Exception:
-            raise errors.CannotCoerceError(
-                'schema (%s) cannot be coerced to a dict' % original_schema
-            )
+
+        if not is_within_limits and isinstance(value, (list, dict_)):
+            _check_deserialized_json_limits(value,
+                                            *limits,
+                                            is_bytes = isinstance(original_value,
+                                                                  (bytes, bytearray,
+                                                                   memoryview)))
 
     if not isinstance(value, (list, dict_)):
         raise errors.NotJSONError('value (%s) is not a JSON object' % original_value)
 
-    if original_schema and not isinstance(schema, dict_):
-        raise errors.NotJSONError('schema (%s) is not a JSON object' % original_schema)
-
     if not schema:
         return value
 
-    try:
-        jsonschema.validate(value, schema)
-    except jsonschema.exceptions.ValidationError as error:
-        raise errors.JSONValidationError(error.message)
-    except jsonschema.exceptions.SchemaError as error:
-        raise errors.NotJSONSchemaError(error.message)
-
-    return value
-
+    compiled_schema = _compiled_json_schema(schema,
+                                            allow_empty = allow_empty,
+                                            json_serializer = json_serializer,
+                                            check_formats = check_formats,
+                                            **kwargs)
+    if compiled_schema is None:
+        return value
 
-## DATE / TIME
+    return compiled_schema.validate(value)
 
 
-@disable_on_env
-def date(value,
-         allow_empty = False,
-         minimum = None,
-         maximum = None,
-         coerce_value = True,
-         **kwargs):
-    """Validate that ``value`` is a valid date.
+def _json_syntax(value, schema, max_depth, max_items, max_string_length):
+    """Check that ``value`` is a well-formed JSON object or array, as
+    :func:`json() <validator_collection.validators.json>` does when
+    ``syntax_only`` is ``True``."""
+    if schema:
+        raise errors.ValidatorUsageError(
+            'schema cannot be checked when syntax_only is True'
+        )
 
-    :param value: The value to validate.
-    :type value: :class:`str <python:str>` / :class:`datetime <python:datetime.datetime>`
-      / :class:`date <python:datetime.date>` / :obj:`None <python:None>`
+    if isinstance(value, (list, dict_)):
+        return value
+    elif not isinstance(value, _JSON_TEXT_TYPES):
+        raise errors.NotJSONError('value (%s) is not a JSON object' % value)
 
-    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
-      ``value`` is empty. If ``False``, raises a
-      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
-      if ``value`` is empty. Defaults to ``False``.
-    :type allow_empty: :class:`bool <python:bool>`
+    check_json_syntax(value, *_json_limits(max_depth, max_items, max_string_length))
 
-    :param minimum: If supplied, will make sure that ``value`` is on or after this value.
-    :type minimum: :class:`datetime <python:datetime.datetime>` /
-      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>`
-      / :obj:`None <python:None>`
+    return value
 
-    :param maximum: If supplied, will make sure that ``value`` is on or before this
-      value.
-    :type maximum: :class:`datetime <python:datetime.datetime>` /
-      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>`
-      / :obj:`None <python:None>`
 
-    :param coerce_value: If ``True``, will attempt to coerce ``value`` to a
-      :class:`date <python:datetime.date>` if it is a timestamp value. If ``False``,
-      will not.
-    :type coerce_value: :class:`bool <python:bool>`
+def _json_limits(max_depth, max_items, max_string_length, size = None):
+    """Return the ``max_depth``, ``max_items``, and ``max_string_length`` to
+    check a JSON document against.
 
-    :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`date <python:datetime.date>` / :obj:`None <python:None>`
+    :param size: If supplied, the size of the document (as returned by
+      :func:`_json_size`). Limits that a document of that size cannot exceed
+      are then returned as :obj:`None <python:None>`, and if none remain,
+      returns :obj:`None <python:None>` instead.
+    :type size: :class:`int <python:int>` / :obj:`None <python:None>`
 
-    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
-    :raises CannotCoerceError: if ``value`` cannot be coerced to a
-      :class:`date <python:datetime.date>` and is not :obj:`None <python:None>`
-    :raises MinimumValueError: if ``minimum`` is supplied but ``value`` occurs before
-      ``minimum``
-    :raises MaximumValueError: if ``maximum`` is supplied but ``value`` occurs after
-      ``maximum``
+    :rtype: :class:`tuple <python:tuple>` / :obj:`None <python:None>`
 
+    :raises MinimumValueError: if a limit is less than its minimum
     """
-    # pylint: disable=too-many-branches
-    if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
-    elif not value:
+    max_depth = integer(max_depth, allow_empty = True, minimum = 1)
+    max_items = integer(max_items, allow_empty = True, minimum = 1)
+    max_string_length = integer(max_string_length, allow_empty = True, minimum = 0)
+    if size is None:
+        return max_depth, max_items, max_string_length
+
+    # Exceeding a limit takes at least: two characters per container nested
+    # ``max_depth + 1`` deep, two per item (bar the last) and two brackets for
+    # ``max_items + 1`` items, or two quotes around ``max_string_length + 1``
+    # characters.
+    if max_depth is not None and size < 2 * max_depth + 2:
+        max_depth = None
+    if max_items is not None and size < 2 * max_items + 3:
+        max_items = None
+    if max_string_length is not None and size < max_string_length + 3:
+        max_string_length = None
+
+    if max_depth is None and max_items is None and max_string_length is None:
         return None
 
-    minimum = date(minimum, allow_empty = True, force_run = True)               # pylint: disable=E1123
-    maximum = date(maximum, allow_empty = True, force_run = True)               # pylint: disable=E1123
+    return max_depth, max_items, max_string_length
 
-    if not isinstance(value, date_types):
-        raise errors.CannotCoerceError(
-            'value (%s) must be a date object, datetime object, '
-            'ISO 8601-formatted string, '
-            'or POSIX timestamp, but was %s' % (value, type(value))
-        )
-    elif isinstance(value, datetime_.datetime) and not coerce_value:
-        raise errors.CannotCoerceError(
-            'value (%s) must be a date object, or '
-            'ISO 8601-formatted string, '
-            'but was %s' % (value, type(value))
-        )
-    elif isinstance(value, datetime_.datetime) and coerce_value:
-        value = value.date()
-    elif isinstance(value, timestamp_types) and coerce_value:
-        try:
-            value = datetime_.date.fromtimestamp(value)
-        except ValueError:
-            raise errors.CannotCoerceError(
-                'value (%s) must be a date object, datetime object, '
-                'ISO 8601-formatted string, '
-                'or POSIX timestamp, but was %s' % (value, type(value))
+
+def _check_deserialized_json_limits(value,
+                                    max_depth,
+                                    max_items,
+                                    max_string_length,
+                                    is_bytes = False):
+    """Check that the deserialized JSON document ``value`` is within the limits
+    supplied, as :func:`check_json_syntax() <validator_collection._json_syntax.check_json_syntax>`
+    checks a serialized one.
+
+    :param is_bytes: If ``True``, strings are measured by the length of their
+      UTF-8 encoding, as they are in a bytes-like document.
+    :type is_bytes: :class:`bool <python:bool>`
+
+    :raises JSONLimitError: if ``value`` exceeds a limit
+    """
+    pending = [(value, 1)]
+    while pending:
+        item, depth = pending.pop()
+        if isinstance(item, basestring):
+            if max_string_length is None:
+                continue
+
+            length = len(item)
+            if is_bytes and not isinstance(item, bytes):
+                length = len(item.encode('utf-8', 'surrogatepass'))
+
+            if length > max_string_length:
+                raise errors.JSONLimitError('value has a string longer than the limit')
+
+            continue
+        elif isinstance(item, dict_):
+            children = [x for pair in item.items() for x in pair]
+        elif isinstance(item, list):
+            children = item
+        else:
+            continue
+
+        if max_depth is not None and depth > max_depth:
+            raise errors.JSONLimitError(
+                'value is nested more than %s levels deep' % max_depth
             )
-    elif isinstance(value, str):
+        if max_items is not None and len(item) > max_items:
+            raise errors.JSONLimitError(
+                'value has an array or object with more than %s items' % max_items
+            )
+
+        pending.extend((x, depth + 1) for x in children)
+
+
+def compile_json_schema(schema,
+                        json_serializer = None,
+                        native = True,
+                        check_formats = True,
+                        **kwargs):
+    """Compile ``schema`` into a validator that can be supplied as the
+    ``schema`` argument to :func:`json() <validator_collection.validators.json>`.
+
+    The schema is deserialized (if it is a string) and checked against its
+    meta-schema only once, rather than on every call. The compiled schema can be
+    reused across any number of calls.
+
+    .. hint::
+
+      :func:`json() <validator_collection.validators.json>` also keeps a small
+      cache of the schemas it has compiled, so repeatedly passing the same
+      :class:`dict <python:dict>` object or string is cheap. Compiling a schema
+      explicitly avoids the cache lookup, and does not depend on the schema
+      remaining in the cache.
+
+    :param schema: The JSON Schema to compile.
+    :type schema: :class:`dict <python:dict>` / :class:`str <python:str>`
+
+    :param json_serializer: The JSON encoder/decoder to use to deserialize a
+      string passed in ``schema``. If not supplied, will default to the JSON backend
+      returned by :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
+    :type json_serializer: callable
+
+    :param native: If ``True``, will compile ``schema`` into native checks
+      where it only uses the keywords that support them (see
+      :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`).
+      If ``False``, will always validate using ``jsonschema``. Defaults to
+      ``True``.
+    :type native: :class:`bool <python:bool>`
+
+    :param check_formats: If ``True``, will check formats using this library's
+      validators, as :func:`json() <validator_collection.validators.json>` does.
+      If ``False``, ``format`` is treated as an annotation and not checked.
+      Defaults to ``True``.
+    :type check_formats: :class:`bool <python:bool>`
+
+    :rtype: :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+
+    :raises CannotCoerceError: if ``schema`` is a string that cannot be
+      deserialized from JSON
+    :raises NotJSONError: if ``schema`` is not a JSON object
+    :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema object
+    """
+    if isinstance(schema, CompiledJSONSchema):
+        return schema
+
+    original_schema = schema
+    if isinstance(schema, basestring):
+        try:
+            schema = dict(schema,
+                          json_serializer = json_serializer or get_json_backend(),
+                          **kwargs)
+        except Exception:
+            raise errors.CannotCoerceError(
+                'schema (%s) cannot be coerced to a dict' % original_schema
+            )
+
+    if not isinstance(schema, dict_):
+        raise errors.NotJSONError('schema (%s) is not a JSON object' % original_schema)
+
+    return CompiledJSONSchema(schema,
+                              native = native,
+                              format_checker = _json_format_checker(check_formats))
+
+
+def _compiled_json_schema(schema,
+                          allow_empty = False,
+                          json_serializer = None,
+                          check_formats = True,
+                          **kwargs):
+    """Return ``schema`` compiled, using (and adding to) the cache of recently
+    compiled schemas.
+
+    :returns: The compiled schema, or :obj:`None <python:None>` if ``schema`` is
+      empty once deserialized.
+    :rtype: :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
+    """
+    if isinstance(schema, CompiledJSONSchema):
+        return schema
+
+    # Cached dictionaries are held alongside their compiled form, so that their
+    # identity cannot be reused while they are in the cache. Strings are keyed
+    # by the options they are deserialized with, and are not cached if those
+    # options cannot be hashed.
+    if isinstance(schema, basestring):
+        key = (schema, json_serializer, check_formats, allow_empty,
+               tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+    else:
+        key = (id(schema), check_formats)
+
+    cached = key is not None and _JSON_SCHEMA_CACHE.get(key)
+    if cached:
+        return cached[1]
+
+    original_schema = schema
+    if isinstance(schema, basestring):
+        try:
+            schema = dict(schema,
+                          allow_empty = allow_empty,
+                          json_serializer = json_serializer,
+                          **kwargs)
+        except Exception:
+            raise errors.CannotCoerceError(
+                'schema (%s) cannot be coerced to a dict' % original_schema
+            )
+
+    if not isinstance(schema, dict_):
+        raise errors.NotJSONError('schema (%s) is not a JSON object' % original_schema)
+
+    compiled_schema = None
+    if schema:
+        compiled_schema = CompiledJSONSchema(
+            schema,
+            format_checker = _json_format_checker(check_formats)
+        )
+
+    if key is not None:
+        _JSON_SCHEMA_CACHE.set(key, (original_schema, compiled_schema))
+
+    return compiled_schema
+
+
+def _json_format_checker(check_formats = True):
+    """Return the format checker used by
+    :func:`json() <validator_collection.validators.json>`, creating it on first
+    use.
+
+    :returns: The format checker, or :obj:`None <python:None>` if
+      ``check_formats`` is ``False``.
+    :rtype: :class:`FormatChecker <validator_collection._json_schema.FormatChecker>`
+      / :obj:`None <python:None>`
+    """
+    global _JSON_FORMAT_CHECKER                                                 # pylint: disable=W0603
+
+    if not check_formats:
+        return None
+
+    if _JSON_FORMAT_CHECKER is None:
+        _JSON_FORMAT_CHECKER = FormatChecker({
+            'email': email,
+            'uri': lambda value: url(value, allow_special_ips = True),
+            'ipv4': ipv4,
+            'ipv6': ipv6,
+            'date-time': datetime,
+            'date': date,
+            'time': _json_time,
+            'uuid': uuid,
+        })
+
+    return _JSON_FORMAT_CHECKER
+
+
+def _json_time(value):
+    """Validate that ``value`` is a time of day in the form used by the JSON
+    Schema ``time`` format (e.g. ``12:30:00Z`` or ``12:30:00.5+05:00``).
+
+    :raises CannotCoerceError: if ``value`` is not in that form
+    :raises ValueError: if ``value`` is not a valid time of day, or has an
+      invalid UTC offset
+    """
+    match = JSON_TIME_REGEX.match(value)
+    if not match:
+        raise errors.CannotCoerceError(
+            'value (%s) is not a time in the form HH:MM:SS' % value
+        )
+
+    hour, minute, second, utc_offset = match.groups()
+
+    # RFC 3339 allows for a leap second.
+    datetime_.time(int(hour), int(minute), min(int(second), 59))
+    if utc_offset:
+        timezone(utc_offset, force_run = True)                                  # pylint: disable=E1123
+
+    return value
+
+
+@disable_on_env
+def json_lines(source,
+               schema = None,
+               json_serializer = None,
+               check_formats = True,
+               errors_only = False,
+               **kwargs):
+    """Validate each line of the newline-delimited JSON (a.k.a.
+    `JSON Lines <https://jsonlines.org/>`_) ``source``, lazily and in order.
+
+    Each line must hold a JSON object or array (as with
+    :func:`json() <validator_collection.validators.json>`), which is validated
+    against ``schema`` if supplied. Blank lines are skipped.
+
+    ``source`` is read one line at a time, and ``schema`` is only compiled once,
+    so memory use does not depend on the size of ``source``.
+
+    :param source: The path of a file to validate, a file object, or an
+      iterable of lines.
+    :type source: :class:`str <python:str>` / file object / iterable of
+      :class:`bytes <python:bytes>` or :class:`str <python:str>`
+
+    :param schema: An optional JSON Schema against which each line will be
+      validated.
+    :type schema: :class:`dict <python:dict>` / :class:`str <python:str>` /
+      :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
+
+    :param json_serializer: The JSON encoder/decoder to use to deserialize each
+      line (and ``schema``, if it is a string). If not supplied, will default to
+      the JSON backend returned by
+      :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
+    :type json_serializer: callable
+
+    :param check_formats: If ``True``, will check the formats of strings as
+      :func:`json() <validator_collection.validators.json>` does. Defaults to
+      ``True``.
+    :type check_formats: :class:`bool <python:bool>`
+
+    :param errors_only: If ``True``, will only yield results for the lines that
+      are not valid. Defaults to ``False``.
+    :type errors_only: :class:`bool <python:bool>`
+
+    :returns: An iterator that yields a
+      :class:`JSONLineResult <validator_collection._json_lines.JSONLineResult>`
+      (with the line number, byte offset, deserialized value, and error, if any)
+      for each line.
+    :rtype: iterator
+
+    :raises PathExistsError: if ``source`` is a path that does not exist
+    :raises NotAFileError: if ``source`` is a path that is not a file
+    :raises NotAnIterableError: if ``source`` is not a path, file object, or
+      iterable
+    :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema object
+    """
+    if isinstance(source, basestring) or hasattr(source, '__fspath__'):
+        source = file_exists(source, force_run = True)                          # pylint: disable=E1123
+    elif not hasattr(source, 'read'):
+        try:
+            source = iter(source)
+        except TypeError:
+            raise errors.NotAnIterableError('value type (%s) not iterable' % type(source))
+
+    if not json_serializer:
+        json_serializer = get_json_backend()
+
+    compiled_schema = None
+    if schema:
+        compiled_schema = compile_json_schema(schema,
+                                              json_serializer = json_serializer,
+                                              check_formats = check_formats,
+                                              **kwargs)
+
+    return _iter_json_lines(iter_lines(source),
+                            compiled_schema,
+                            json_serializer,
+                            errors_only)
+
+
+def _iter_json_lines(lines, compiled_schema, json_serializer, errors_only):
+    """Yield the results of
+    :func:`json_lines() <validator_collection.validators.json_lines>` for each
+    ``(line_number, offset, line)`` in ``lines``."""
+    for line_number, offset, line in lines:
+        value, error = _check_json_line(line, compiled_schema, json_serializer)
+        if error is not None:
+            error = _locate_json_line_error(error, line_number, offset)
+        elif errors_only:
+            continue
+
+        yield JSONLineResult(line_number, offset, value, error)
+
+
+@disable_on_env
+def json_lines_parallel(value,
+                        schema = None,
+                        json_serializer = None,
+                        check_formats = True,
+                        processes = None,
+                        chunk_size = 16777216,
+                        **kwargs):
+    """Validate each line of the newline-delimited JSON file at ``value``, using
+    a pool of worker processes, and return the lines that are not valid.
+
+    This is intended for files too large to validate quickly on one core. The
+    file is memory-mapped and split into ranges of roughly ``chunk_size`` bytes
+    that each end on a newline. Each range is validated by a worker process,
+    which returns only the failures it finds.
+
+    The lines are validated as by
+    :func:`json_lines() <validator_collection.validators.json_lines>`, except
+    that the ``value`` of each result is :obj:`None <python:None>`, so that
+    deserialized values need not be sent back from the workers.
+
+    .. hint::
+
+      Failures are returned in order of line number, whatever the order in
+      which the workers finish.
+
+    :param value: The path of the file to validate.
+    :type value: :class:`str <python:str>` / path-like object
+
+    :param schema: An optional JSON Schema against which each line will be
+      validated.
+    :type schema: :class:`dict <python:dict>` / :class:`str <python:str>` /
+      :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
+
+    :param json_serializer: The JSON encoder/decoder to use to deserialize each
+      line. If not supplied, will default to the JSON backend returned by
+      :func:`get_json_backend() <validator_collection.validators.get_json_backend>`
+      in the calling process. It is sent to each worker process, so must be
+      picklable (a module is sent by the name of its ``loads()``).
+    :type json_serializer: callable
+
+    :param check_formats: If ``True``, will check the formats of strings as
+      :func:`json() <validator_collection.validators.json>` does. Defaults to
+      ``True``.
+    :type check_formats: :class:`bool <python:bool>`
+
+    :param processes: The number of worker processes to use. If
+      :obj:`None <python:None>`, uses one per CPU. If ``1``, or if the file fits
+      in a single range, validates the file in the current process. Defaults to
+      :obj:`None <python:None>`.
+    :type processes: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param chunk_size: The (approximate) number of bytes validated by each task
+      given to a worker. Defaults to ``16777216`` (16 MiB).
+    :type chunk_size: :class:`int <python:int>`
+
+    :returns: An iterator that yields a
+      :class:`JSONLineResult <validator_collection._json_lines.JSONLineResult>`
+      for each line that is not valid, in order of line number.
+    :rtype: iterator
+
+    :raises PathExistsError: if ``value`` does not exist
+    :raises NotAFileError: if ``value`` is not a file
+    :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema object
+    :raises MinimumValueError: if ``processes`` or ``chunk_size`` is less than
+      ``1``
+    """
+    value = file_exists(value, force_run = True)                                # pylint: disable=E1123
+    processes = integer(processes, allow_empty = True, minimum = 1)
+    chunk_size = integer(chunk_size, minimum = 1)
+
+    # The backend is resolved here, as one set or registered in this process
+    # may not be in a worker process.
+    if not json_serializer:
+        json_serializer = get_json_backend()
+    elif isinstance(json_serializer, types.ModuleType):
+        json_serializer = JSONBackend(json_serializer.__name__, json_serializer.loads)
+
+    # The schema is compiled here so that an invalid schema is reported before
+    # any worker starts, but is sent to the workers in its original form.
+    if schema:
+        schema = compile_json_schema(schema,
+                                     json_serializer = json_serializer,
+                                     check_formats = check_formats,
+                                     **kwargs).schema
+
+    return _iter_json_lines_parallel(value,
+                                     schema,
+                                     json_serializer,
+                                     check_formats,
+                                     processes,
+                                     chunk_size)
+
+
+def _iter_json_lines_parallel(path,
+                              schema,
+                              json_serializer,
+                              check_formats,
+                              processes,
+                              chunk_size):
+    """Yield the results of
+    :func:`json_lines_parallel() <validator_collection.validators.json_lines_parallel>`."""
+    size = os.path.getsize(path)
+    if not size:
+        return
+
+    with io.open(path, 'rb') as source_file:
+        mapped = mmap.mmap(source_file.fileno(), 0, access = mmap.ACCESS_READ)
+        try:
+            ranges = newline_ranges(mapped, size, chunk_size)
+        finally:
+            mapped.close()
+
+    pool = worker = None
+    if processes == 1 or len(ranges) == 1:
+        worker = _open_json_lines_worker(path, schema, json_serializer, check_formats)
+        results = (_validate_json_lines_range(x, worker) for x in ranges)
+    else:
+        pool = multiprocessing.Pool(processes,
+                                    initializer = _init_json_lines_worker,
+                                    initargs = (path, schema, json_serializer, check_formats))
+        results = pool.imap(_validate_json_lines_range, ranges)
+
+    try:
+        line_base = 0
+        for line_count, failures in results:
+            for line_number, offset, error in failures:
+                line_number += line_base
+                yield JSONLineResult(line_number,
+                                     offset,
+                                     None,
+                                     _locate_json_line_error(error, line_number, offset))
+
+            line_base += line_count
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        if worker is not None:
+            worker[0].close()
+
+
+def _open_json_lines_worker(path, schema, json_serializer, check_formats):
+    """Memory-map ``path`` and compile ``schema``.
+
+    :returns: The memory-mapped file, the compiled schema (or
+      :obj:`None <python:None>`), and ``json_serializer``.
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    compiled_schema = None
+    if schema:
+        compiled_schema = compile_json_schema(schema,
+                                              json_serializer = json_serializer,
+                                              check_formats = check_formats)
+
+    with io.open(path, 'rb') as source_file:
+        mapped = mmap.mmap(source_file.fileno(), 0, access = mmap.ACCESS_READ)
+
+    return mapped, compiled_schema, json_serializer
+
+
+def _init_json_lines_worker(path, schema, json_serializer, check_formats):
+    """Prepare a worker process for calls to :func:`_validate_json_lines_range`."""
+    global _JSON_LINES_WORKER                                                   # pylint: disable=W0603
+
+    _JSON_LINES_WORKER = _open_json_lines_worker(path,
+                                                 schema,
+                                                 json_serializer,
+                                                 check_formats)
+
+
+def _validate_json_lines_range(byte_range, worker = None):
+    """Validate the lines in the ``(start, end)`` ``byte_range`` of a file.
+
+    :param worker: The memory-mapped file, compiled schema, and JSON
+      serializer returned by
+      :func:`_open_json_lines_worker`. If not supplied, uses those prepared by
+      :func:`_init_json_lines_worker` for this process.
+    :type worker: :class:`tuple <python:tuple>` / :obj:`None <python:None>`
+
+    :returns: The number of lines in the range, and a
+      :class:`list <python:list>` of the ``(line_number, offset, error)`` of each
+      line that is not valid, numbering the lines from ``1`` at the start of the
+      range.
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    mapped, compiled_schema, json_serializer = worker or _JSON_LINES_WORKER
+    line_count = 0
+    failures = []
+    for line_count, offset, line in iter_range_lines(mapped, *byte_range):
+        if not line.strip():
+            continue
+
+        _, error = _check_json_line(line, compiled_schema, json_serializer)
+        if error is not None:
+            failures.append((line_count, offset, error))
+
+    return line_count, failures
+
+
+def _check_json_line(line, compiled_schema, json_serializer):
+    """Deserialize and validate one line of newline-delimited JSON.
+
+    :returns: The line's deserialized value (or :obj:`None <python:None>` if it
+      cannot be deserialized), and the error it fails validation with (or
+      :obj:`None <python:None>` if it is valid).
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    try:
+        value = json_serializer.loads(line)
+    except Exception:
+        return None, errors.CannotCoerceError('cannot be deserialized from JSON')
+
+    if not isinstance(value, (list, dict_)):
+        return value, errors.NotJSONError('is not a JSON object')
+
+    if compiled_schema is not None:
+        try:
+            compiled_schema.validate(value)
+        except errors.JSONValidationError as error:
+            return value, error
+
+    return value, None
+
+
+def _locate_json_line_error(error, line_number, offset):
+    """Return a copy of ``error`` whose message names the line it was raised
+    for."""
+    return error.__class__('line %s (at byte %s): %s' % (line_number, offset, error))
+
+
+# Keywords of an array schema that can be applied element by element.
+_JSON_ARRAY_STREAM_KEYWORDS = frozenset(['type', 'items']) | ANNOTATION_KEYWORDS
+
+
+@disable_on_env
+def json_array_elements(value,
+                        schema = None,
+                        max_errors = None,
+                        json_serializer = None,
+                        check_formats = True,
+                        chunk_size = 65536,
+                        **kwargs):
+    """Validate each element of the top-level JSON array in ``value``, lazily and
+    in order, and yield the elements that are not valid.
+
+    This is intended for documents too large to deserialize as a whole. The
+    array is read from ``value`` in chunks, and each element is deserialized
+    and validated against the ``items`` of ``schema`` on its own, so that memory
+    use depends only on the size of the largest element.
+
+    .. caution::
+
+      Only the ``type`` and ``items`` keywords of ``schema`` can be applied one
+      element at a time. Keywords that apply to the array as a whole (e.g.
+      ``maxItems`` or ``uniqueItems``) are not supported.
+
+    :param value: The path of the file to validate, or a file object open for
+      reading.
+    :type value: :class:`str <python:str>` / path-like object / file object
+
+    :param schema: An optional JSON Schema for the array, against whose
+      ``items`` each element will be validated.
+    :type schema: :class:`dict <python:dict>` / :class:`str <python:str>` /
+      :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
+
+    :param max_errors: If supplied, will stop reading ``value`` once this many
+      elements have been found not to be valid. Defaults to
+      :obj:`None <python:None>`.
+    :type max_errors: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param json_serializer: The JSON encoder/decoder to use to deserialize each
+      element (and ``schema``, if it is a string). If not supplied, will default
+      to the JSON backend returned by
+      :func:`get_json_backend() <validator_collection.validators.get_json_backend>`.
+    :type json_serializer: callable
+
+    :param check_formats: If ``True``, will check the formats of strings as
+      :func:`json() <validator_collection.validators.json>` does. Defaults to
+      ``True``.
+    :type check_formats: :class:`bool <python:bool>`
+
+    :param chunk_size: The number of bytes (or characters) to read from
+      ``value`` at a time. Defaults to ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
+    :returns: An iterator that yields a
+      :class:`JSONElementResult <validator_collection._json_stream.JSONElementResult>`
+      (with the index, offset, deserialized value, and error) for each element
+      that is not valid. Iterating raises a
+      :class:`NotJSONError <validator_collection.errors.NotJSONError>` once
+      ``value`` is found not to hold a well-formed JSON array.
+    :rtype: iterator
+
+    :raises PathExistsError: if ``value`` is a path that does not exist
+    :raises NotAFileError: if ``value`` is a path that is not a file
+    :raises ValidatorUsageError: if ``value`` is not a path or file object, or
+      if ``schema`` uses keywords that cannot be applied one element at a time
+    :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema object
+    :raises MinimumValueError: if ``max_errors`` or ``chunk_size`` is less than
+      ``1``
+    """
+    if isinstance(value, basestring) or hasattr(value, '__fspath__'):
+        value = file_exists(value, force_run = True)                            # pylint: disable=E1123
+    elif not hasattr(value, 'read'):
+        raise errors.ValidatorUsageError(
+            'value type (%s) is not a path or file object' % type(value)
+        )
+
+    max_errors = integer(max_errors, allow_empty = True, minimum = 1)
+    chunk_size = integer(chunk_size, minimum = 1)
+
+    if not json_serializer:
+        json_serializer = get_json_backend()
+
+    compiled_schema = None
+    if schema:
+        compiled_schema = compile_json_schema(schema,
+                                              json_serializer = json_serializer,
+                                              check_formats = check_formats,
+                                              **kwargs)
+        compiled_schema = _json_items_schema(compiled_schema, check_formats)
+
+    return _iter_json_array_elements(value,
+                                     compiled_schema,
+                                     max_errors,
+                                     json_serializer,
+                                     chunk_size)
+
+
+def _json_items_schema(compiled_schema, check_formats):
+    """Return the ``items`` of the (compiled) array schema ``compiled_schema``,
+    compiled.
+
+    :rtype: :class:`CompiledJSONSchema <validator_collection._json_schema.CompiledJSONSchema>`
+      / :obj:`None <python:None>`
+
+    :raises ValidatorUsageError: if the schema uses keywords that cannot be
+      applied one element at a time
+    """
+    schema = compiled_schema.schema
+    unsupported = set(schema) - _JSON_ARRAY_STREAM_KEYWORDS
+    types = schema.get('type', 'array')
+    if isinstance(types, basestring):
+        types = [types]
+    if 'array' not in types:
+        unsupported.add('type')
+
+    items = schema.get('items', True)
+    if isinstance(items, list):
+        unsupported.add('items')
+
+    if unsupported:
+        raise errors.ValidatorUsageError(
+            'schema keywords (%s) cannot be applied one element at a time' % (
+                ', '.join(sorted(unsupported))
+            )
+        )
+
+    if items is True or items == {}:
+        return None
+    elif items is False:
+        items = {'not': {}}
+
+    # The items are compiled on their own, so must keep the array's draft.
+    if '$schema' in schema and '$schema' not in items:
+        items = dict_(items, **{'$schema': schema['$schema']})
+
+    return CompiledJSONSchema(items,
+                              native = compiled_schema.is_native,
+                              format_checker = _json_format_checker(check_formats))
+
+
+def _iter_json_array_elements(source,
+                              compiled_schema,
+                              max_errors,
+                              json_serializer,
+                              chunk_size):
+    """Yield the results of
+    :func:`json_array_elements() <validator_collection.validators.json_array_elements>`."""
+    if isinstance(source, basestring):
+        with io.open(source, 'rb') as source_file:
+            for result in _iter_json_array_elements(source_file,
+                                                    compiled_schema,
+                                                    max_errors,
+                                                    json_serializer,
+                                                    chunk_size):
+                yield result
+
+        return
+
+    error_count = 0
+    for index, offset, element in JSONArrayReader(source, chunk_size):
+        try:
+            element_value = json_serializer.loads(element)
+        except Exception:
+            element_value = None
+            error = errors.CannotCoerceError('cannot be deserialized from JSON')
+        else:
+            if compiled_schema is None:
+                continue
+
+            try:
+                compiled_schema.validate(element_value)
+                continue
+            except errors.JSONValidationError as validation_error:
+                error = validation_error
+
+        yield JSONElementResult(index,
+                                offset,
+                                element_value,
+                                error.__class__('element %s (at offset %s): %s' % (
+                                    index,
+                                    offset,
+                                    error
+                                )))
+
+        error_count += 1
+        if error_count == max_errors:
+            return
+
+
+## DATE / TIME
+
+
+@disable_on_env
+def date(value,
+         allow_empty = False,
+         minimum = None,
+         maximum = None,
+         coerce_value = True,
+         **kwargs):
+    """Validate that ``value`` is a valid date.
+
+    :param value: The value to validate.
+    :type value: :class:`str <python:str>` / :class:`datetime <python:datetime.datetime>`
+      / :class:`date <python:datetime.date>` / :obj:`None <python:None>`
+
+    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
+      ``value`` is empty. If ``False``, raises a
+      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
+      if ``value`` is empty. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param minimum: If supplied, will make sure that ``value`` is on or after this value.
+    :type minimum: :class:`datetime <python:datetime.datetime>` /
+      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>`
+      / :obj:`None <python:None>`
+
+    :param maximum: If supplied, will make sure that ``value`` is on or before this
+      value.
+    :type maximum: :class:`datetime <python:datetime.datetime>` /
+      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>`
+      / :obj:`None <python:None>`
+
+    :param coerce_value: If ``True``, will attempt to coerce ``value`` to a
+      :class:`date <python:datetime.date>` if it is a timestamp value. If ``False``,
+      will not.
+    :type coerce_value: :class:`bool <python:bool>`
+
+    :returns: ``value`` / :obj:`None <python:None>`
+    :rtype: :class:`date <python:datetime.date>` / :obj:`None <python:None>`
+
+    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises CannotCoerceError: if ``value`` cannot be coerced to a
+      :class:`date <python:datetime.date>` and is not :obj:`None <python:None>`
+    :raises MinimumValueError: if ``minimum`` is supplied but ``value`` occurs before
+      ``minimum``
+    :raises MaximumValueError: if ``maximum`` is supplied but ``value`` occurs after
+      ``maximum``
+
+    """
+    # pylint: disable=too-many-branches
+    if not value and not allow_empty:
+        raise errors.EmptyValueError('value (%s) was empty' % value)
+    elif not value:
+        return None
+
+    minimum = date(minimum, allow_empty = True, force_run = True)               # pylint: disable=E1123
+    maximum = date(maximum, allow_empty = True, force_run = True)               # pylint: disable=E1123
+
+    if not isinstance(value, date_types):
+        raise errors.CannotCoerceError(
+            'value (%s) must be a date object, datetime object, '
+            'ISO 8601-formatted string, '
+            'or POSIX timestamp, but was %s' % (value, type(value))
+        )
+    elif isinstance(value, datetime_.datetime) and not coerce_value:
+        raise errors.CannotCoerceError(
+            'value (%s) must be a date object, or '
+            'ISO 8601-formatted string, '
+            'but was %s' % (value, type(value))
+        )
+    elif isinstance(value, datetime_.datetime) and coerce_value:
+        value = value.date()
+    elif isinstance(value, timestamp_types) and coerce_value:
+        try:
+            value = datetime_.date.fromtimestamp(value)
+        except ValueError:
+            raise errors.CannotCoerceError(
+                'value (%s) must be a date object, datetime object, '
+                'ISO 8601-formatted string, '
+                'or POSIX timestamp, but was %s' % (value, type(value))
+            )
+    elif isinstance(value, str):
         try:
             value = datetime_.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f')
             if coerce_value:
@@ -1612,9 +3033,21 @@ def _numeric_coercion(value,
 @disable_on_env
 def bytesIO(value,
             allow_empty = False,
+            minimum_length = None,
+            maximum_length = None,
+            encoding = None,
+            chunk_size = 65536,
             **kwargs):
     """Validate that ``value`` is a :class:`BytesIO <python:io.BytesIO>` object.
 
+    .. note::
+
+      If ``minimum_length``, ``maximum_length``, or ``encoding`` are supplied,
+      the contents of ``value`` are read from its current position in chunks of
+      ``chunk_size`` bytes (stopping as soon as ``maximum_length`` is
+      exceeded), and ``value`` is then returned to that position. At most one
+      chunk is held in memory at a time.
+
     :param value: The value to validate.
 
     :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
@@ -1623,12 +3056,36 @@ def bytesIO(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
+    :param minimum_length: If supplied, indicates the minimum number of bytes
+      that must remain to be read from ``value`` for it to be valid.
+    :type minimum_length: :class:`int <python:int>`
+
+    :param maximum_length: If supplied, indicates the maximum number of bytes
+      that may remain to be read from ``value`` for it to be valid.
+    :type maximum_length: :class:`int <python:int>`
+
+    :param encoding: If supplied, the name of an encoding (e.g. ``'utf-8'``)
+      that the remaining contents of ``value`` must decode from without error.
+      Defaults to :obj:`None <python:None>`.
+    :type encoding: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :param chunk_size: The number of bytes to read at a time when checking
+      ``minimum_length``, ``maximum_length``, or ``encoding``. Defaults to
+      ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`BytesIO <python:io.BytesIO>` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises NotBytesIOError: if ``value`` is not a :class:`BytesIO <python:io.BytesIO>`
       object.
+    :raises MinimumLengthError: if ``minimum_length`` is supplied and fewer bytes
+      remain to be read from ``value``
+    :raises MaximumLengthError: if ``maximum_length`` is supplied and more bytes
+      remain to be read from ``value``
+    :raises InvalidEncodingError: if ``encoding`` is supplied and the contents of
+      ``value`` cannot be decoded from it
     """
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
@@ -1639,15 +3096,29 @@ def bytesIO(value,
         raise errors.NotBytesIOError('value (%s) is not a BytesIO, '
                                      'is a %s' % (value, type(value)))
 
+    _check_stream(value, minimum_length, maximum_length, encoding, chunk_size)
+
     return value
 
 
 @disable_on_env
 def stringIO(value,
              allow_empty = False,
+             minimum_length = None,
+             maximum_length = None,
+             encoding = None,
+             chunk_size = 65536,
              **kwargs):
     """Validate that ``value`` is a :class:`StringIO <python:io.StringIO>` object.
 
+    .. note::
+
+      If ``minimum_length``, ``maximum_length``, or ``encoding`` are supplied,
+      the contents of ``value`` are read from its current position in chunks of
+      ``chunk_size`` characters (stopping as soon as ``maximum_length`` is
+      exceeded), and ``value`` is then returned to that position. At most one
+      chunk is held in memory at a time.
+
     :param value: The value to validate.
 
     :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
@@ -1656,12 +3127,36 @@ def stringIO(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
+    :param minimum_length: If supplied, indicates the minimum number of characters
+      that must remain to be read from ``value`` for it to be valid.
+    :type minimum_length: :class:`int <python:int>`
+
+    :param maximum_length: If supplied, indicates the maximum number of characters
+      that may remain to be read from ``value`` for it to be valid.
+    :type maximum_length: :class:`int <python:int>`
+
+    :param encoding: If supplied, the name of an encoding (e.g. ``'utf-8'``)
+      that the remaining contents of ``value`` must encode to without error.
+      Defaults to :obj:`None <python:None>`.
+    :type encoding: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :param chunk_size: The number of characters to read at a time when checking
+      ``minimum_length``, ``maximum_length``, or ``encoding``. Defaults to
+      ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`StringIO <python:io.StringIO>` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises NotStringIOError: if ``value`` is not a :class:`StringIO <python:io.StringIO>`
       object
+    :raises MinimumLengthError: if ``minimum_length`` is supplied and fewer
+      characters remain to be read from ``value``
+    :raises MaximumLengthError: if ``maximum_length`` is supplied and more
+      characters remain to be read from ``value``
+    :raises InvalidEncodingError: if ``encoding`` is supplied and the contents of
+      ``value`` cannot be encoded to it
     """
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
@@ -1672,9 +3167,98 @@ def stringIO(value,
         raise ValueError('value (%s) is not an io.StringIO object, '
                          'is a %s' % (value, type(value)))
 
+    _check_stream(value, minimum_length, maximum_length, encoding, chunk_size)
+
     return value
 
 
+def _check_stream(value,
+                  minimum_length = None,
+                  maximum_length = None,
+                  encoding = None,
+                  chunk_size = 65536):
+    """Check the length and encoding of the contents of the seekable file-like
+    object ``value``, reading them ``chunk_size`` at a time from its current
+    position and then returning it to that position.
+
+    Reading stops as soon as the result is known: once ``maximum_length`` is
+    exceeded, or once ``minimum_length`` is reached if that is all there is to
+    check.
+
+    Text contents must encode to ``encoding``, and binary contents must decode
+    from it.
+
+    :raises MinimumLengthError: if fewer than ``minimum_length`` bytes (or
+      characters) remain to be read from ``value``
+    :raises MaximumLengthError: if more than ``maximum_length`` bytes (or
+      characters) remain to be read from ``value``
+    :raises InvalidEncodingError: if the contents of ``value`` do not conform to
+      ``encoding``
+    :raises ValidatorUsageError: if ``encoding`` is not the name of a known text
+      encoding
+    """
+    minimum_length = integer(minimum_length, allow_empty = True)
+    maximum_length = integer(maximum_length, allow_empty = True)
+    if minimum_length is None and maximum_length is None and encoding is None:
+        return
+
+    chunk_size = integer(chunk_size, minimum = 1)
+
+    convert = None
+    is_ascii_compatible = False
+    decoder = None
+    if encoding is not None:
+        codec = _codec_info(encoding)
+        is_ascii_compatible = codec.name in ASCII_COMPATIBLE_ENCODINGS
+        if isinstance(value, io.TextIOBase):
+            convert = codec.incrementalencoder('strict').encode
+        else:
+            decoder = codec.incrementaldecoder('strict')
+            convert = decoder.decode
+
+    start = value.tell()
+    length = 0
+    try:
+        while True:
+            chunk = value.read(chunk_size)
+            if not chunk:
+                break
+
+            length += len(chunk)
+            if maximum_length is not None and length > maximum_length:
+                raise errors.MaximumLengthError(
+                    'value (%s) exceeds maximum length %s' % (value, maximum_length)
+                )
+
+            if convert is None:
+                if maximum_length is None and length >= minimum_length:
+                    break
+
+                continue
+
+            # A chunk of ASCII can be skipped, unless the decoder is part-way
+            # through a multi-byte character.
+            is_pending = decoder is not None and decoder.getstate()[0]
+            if is_ascii_compatible and not is_pending and _is_ascii(chunk):
+                continue
+
+            convert(chunk)
+
+        if convert is not None:
+            convert(chunk, True)
+    except UnicodeError as error:
+        raise errors.InvalidEncodingError('value (%s) is not valid %s: %s' % (value,
+                                                                              encoding,
+                                                                              error))
+    finally:
+        value.seek(start)
+
+    if minimum_length is not None and length < minimum_length:
+        raise errors.MinimumLengthError(
+            'value (%s) is below the minimum length %s' % (value, minimum_length)
+        )
+
+
 @disable_on_env
 def path(value,
          allow_empty = False,
@@ -2051,22 +3635,106 @@ def executable(value,
 
     value = file_exists(value, force_run = True)
 
-    if sys.platform in ['win32', 'cygwin']:
-        raise NotImplementedError('not supported on Windows')
+    if sys.platform in ['win32', 'cygwin']:
+        raise NotImplementedError('not supported on Windows')
+
+    is_valid = os.access(value, mode = os.X_OK)
+
+    if not is_valid:
+        raise errors.NotExecutableError('execution not allowed for file at %s' % value)
+
+    return value
+
+
+## INTERNET-RELATED
+
+def enable_domain_cache(maxsize = 4096):
+    """Start caching the verdicts that
+    :func:`email <validator_collection.validators.email>`,
+    :func:`url <validator_collection.validators.url>`, and
+    :func:`domain <validator_collection.validators.domain>` reach about domain
+    names.
+
+    Validating a domain name is the most expensive part of validating an email
+    address. When many values share a small number of domains (e.g. a mailing
+    list), caching means each distinct domain is only validated once.
+
+    The cache is disabled by default. Calling this function again replaces the
+    cache with a new, empty one.
+
+    :param maxsize: The maximum number of verdicts to hold. When full, the
+      least-recently-used verdict is discarded. Defaults to ``4096``.
+    :type maxsize: :class:`int <python:int>`
+
+    :raises ValueError: if ``maxsize`` is not a positive integer
+    """
+    global _DOMAIN_CACHE                                                        # pylint: disable=W0603
+
+    _DOMAIN_CACHE = LRUCache(maxsize = maxsize)
+
+
+def disable_domain_cache():
+    """Stop caching domain verdicts, and discard any that have been cached.
+
+    See :func:`enable_domain_cache`.
+    """
+    global _DOMAIN_CACHE                                                        # pylint: disable=W0603
+
+    _DOMAIN_CACHE = None
+
+
+def domain_cache_info():
+    """Return the statistics of the domain verdict cache.
+
+    :returns: A named tuple with ``hits``, ``misses``, ``maxsize``, ``currsize``,
+      and ``hit_rate``, or :obj:`None <python:None>` if the cache is disabled.
+    :rtype: :class:`CacheInfo <validator_collection._cache.CacheInfo>` /
+      :obj:`None <python:None>`
+    """
+    if _DOMAIN_CACHE is None:
+        return None
+
+    return _DOMAIN_CACHE.info()
+
+
+def _cached_verdict(cache, key, func, *args):
+    """Return ``func(*args)``, using the verdict held in ``cache`` for ``key``
+    if there is one.
+
+    A :class:`ValueError <python:ValueError>` raised by ``func`` is cached too,
+    as its class and arguments (so that its traceback, and the frames it
+    references, are not kept alive), and raised again as a new instance on
+    later lookups.
+
+    :param cache: The cache to use, or :obj:`None <python:None>` to always call
+      ``func``.
+    :type cache: :class:`LRUCache <validator_collection._cache.LRUCache>` /
+      :obj:`None <python:None>`
+    """
+    if cache is None:
+        return func(*args)
+
+    verdict = cache.get(key)
+    if verdict is None:
+        try:
+            verdict = (True, func(*args))
+        except ValueError as error:
+            verdict = (False, (error.__class__, error.args))
 
-    is_valid = os.access(value, mode = os.X_OK)
+        cache.set(key, verdict)
 
+    is_valid, result = verdict
     if not is_valid:
-        raise errors.NotExecutableError('execution not allowed for file at %s' % value)
-
-    return value
+        error_class, error_args = result
+        raise error_class(*error_args)
 
+    return result
 
-## INTERNET-RELATED
 
 @disable_on_env
 def email(value,
           allow_empty = False,
+          strict_tld = False,
           **kwargs):
     """Validate that ``value`` is a valid email address.
 
@@ -2093,6 +3761,11 @@ def email(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
+    :param strict_tld: If ``True``, will fail if the domain part of ``value`` does
+      not end in a suffix listed on the `Public Suffix List
+      <https://publicsuffix.org/>`_. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
 
@@ -2102,8 +3775,6 @@ def email(value,
     :raises InvalidEmailError: if ``value`` is not a valid email address or
       empty with ``allow_empty`` set to ``True``
     """
-    # pylint: disable=too-many-branches,too-many-statements,R0914
-
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
     elif not value:
@@ -2113,122 +3784,251 @@ def email(value,
         raise errors.CannotCoerceError('value must be a valid string, '
                                        'was %s' % type(value))
 
-    if '@' not in value:
+    validated = _validate_email(value, strict_tld = strict_tld)
+    if validated is None:
         raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
-    if '(' in value and ')' in value:
-        open_parentheses = value.find('(')
-        close_parentheses = value.find(')') + 1
 
-        if close_parentheses < open_parentheses:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
+    return validated
 
-        commented_value = value[open_parentheses:close_parentheses]
-        value = value.replace(commented_value, '')
-    elif '(' in value:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
-    elif ')' in value:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
 
-    if '<' in value or '>' in value:
-        lt_position = value.find('<')
-        gt_position = value.find('>')
-        first_quote_position = -1
-        second_quote_position = -1
-
-        if lt_position >= 0:
-            first_quote_position = value.find('"', 0, lt_position)
-        if gt_position >= 0:
-            second_quote_position = value.find('"', gt_position)
-
-        if first_quote_position < 0 or second_quote_position < 0:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
-
-    at_count = value.count('@')
-    if at_count > 1:
-        last_at_position = 0
-        last_quote_position = 0
-        for x in range(0, at_count):                                            # pylint: disable=W0612
-            at_position = value.find('@', last_at_position + 1)
-            if at_position >= 0:
-                first_quote_position = value.find('"',
-                                                  last_quote_position,
-                                                  at_position)
-                second_quote_position = value.find('"',
-                                                   first_quote_position)
-                if first_quote_position < 0 or second_quote_position < 0:
-                    raise errors.InvalidEmailError(
-                        'value (%s) is not a valid email address' % value
-                    )
-            last_at_position = at_position
-            last_quote_position = second_quote_position
+@disable_on_env
+def email_batch(values,
+                strict_tld = False,
+                cache_size = 4096,
+                **kwargs):
+    """Validate each of ``values`` as an email address, lazily and in order.
 
-    split_values = value.split('@')
-    if len(split_values) < 2:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+    This is intended for validating large collections of email addresses (e.g.
+    when importing a mailing list). Compared to calling
+    :func:`email <validator_collection.validators.email>` on each address:
+
+      * each distinct address, and each distinct domain, is only validated once
+        while it remains among the ``cache_size`` most recently seen, and
+      * ``values`` is consumed as it is iterated over, so memory use is bounded
+        by ``cache_size`` rather than by the size of ``values``.
+
+    .. hint::
+
+      To get a validity mask for ``values``, use
+      :func:`is_email_batch() <validator_collection.checkers.is_email_batch>`.
+
+    :param values: The values to validate.
+    :type values: iterable of :class:`str <python:str>`
+
+    :param strict_tld: If ``True``, will treat an address whose domain part
+      does not end in a suffix listed on the `Public Suffix List
+      <https://publicsuffix.org/>`_ as invalid. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
+    :param cache_size: The number of distinct addresses (and distinct domains)
+      whose results are remembered. Defaults to ``4096``.
+    :type cache_size: :class:`int <python:int>`
+
+    :returns: An iterator that yields, for each item in ``values``, a
+      ``(local, domain)`` :class:`tuple <python:tuple>` if the item is a valid
+      email address, or :obj:`None <python:None>` if it is not. ``local`` is the
+      address' local part (less any comment), and ``domain`` is its domain part
+      in lowercase.
+    :rtype: iterator
+
+    :raises CannotCoerceError: if ``values`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``values`` is not iterable
+    :raises ValueError: if ``cache_size`` is not a positive integer
+    """
+    if isinstance(values, basestring):
+        raise errors.CannotCoerceError('values must be an iterable of strings, '
+                                       'was %s' % type(values))
 
-    local_value = ''.join(split_values[:-1])
-    domain_value = split_values[-1]
-    is_domain = False
-    is_ip = False
     try:
-        if domain_value.startswith('[') and domain_value.endswith(']'):
-            domain_value = domain_value[1:-1]
-        domain(domain_value)
-        is_domain = True
-    except ValueError:
-        is_domain = False
+        values = iter(values)
+    except TypeError:
+        raise errors.NotAnIterableError('value type (%s) not iterable' % type(values))
 
-    if not is_domain:
-        try:
-            ip_address(domain_value, force_run = True)                          # pylint: disable=E1123
-            is_ip = True
-        except ValueError:
-            is_ip = False
+    address_cache = LRUCache(maxsize = cache_size)
+    if _DOMAIN_CACHE is not None:
+        domain_cache = _DOMAIN_CACHE
+    else:
+        domain_cache = LRUCache(maxsize = cache_size)
+
+    return _iter_email_batch(values, strict_tld, address_cache, domain_cache)
+
+
+def _iter_email_batch(values, strict_tld, address_cache, domain_cache):
+    """Yield the results of
+    :func:`email_batch <validator_collection.validators.email_batch>`, caching
+    them by address in ``address_cache`` and by domain in ``domain_cache``."""
+    for value in values:
+        if not value or not isinstance(value, basestring):
+            yield None
+            continue
+
+        result = address_cache.get(value)
+        if result is None:
+            validated = _validate_email(value,
+                                        strict_tld = strict_tld,
+                                        domain_cache = domain_cache)
+            if validated is None:
+                result = False
+            else:
+                local, _, domain_value = validated.rpartition('@')
+                result = (local, domain_value.lower())
 
-    if not is_domain and is_ip:
-        try:
-            email(local_value + '@test.com', force_run = True)                  # pylint: disable=E1123
-        except ValueError:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
+            address_cache.set(value, result)
+
+        yield result or None
+
+
+def _validate_email(value,
+                    strict_tld = False,
+                    strip_comment = True,
+                    domain_cache = None):
+    """Return ``value`` (less any comment it contains) if it is a valid email
+    address, or :obj:`None <python:None>` if it is not.
+
+    The common ``dot-atom@host.name`` form is recognized with a single anchored
+    match. Anything else is tokenized in a single pass (see
+    ``EMAIL_TOKEN_REGEX``) that records the position of each ``@``, quote, angle
+    bracket, and parenthesis. The rules that decide validity are then applied
+    to those positions, rather than by re-scanning ``value``.
+
+    :param value: The value to validate.
+    :type value: :class:`str <python:str>`
+
+    :param strict_tld: Passed to
+      :func:`domain <validator_collection.validators.domain>`.
+    :type strict_tld: :class:`bool <python:bool>`
+
+    :param strip_comment: If ``True``, will remove the first ``(comment)`` in
+      ``value`` before validating it. Defaults to ``True``.
+    :type strip_comment: :class:`bool <python:bool>`
+
+    :param domain_cache: The cache to hold domain verdicts in. If not supplied,
+      uses the cache enabled by :func:`enable_domain_cache` (if any).
+    :type domain_cache: :class:`LRUCache <validator_collection._cache.LRUCache>` /
+      :obj:`None <python:None>`
+
+    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    """
+    # pylint: disable=too-many-branches,too-many-statements,R0914
+    if domain_cache is None:
+        domain_cache = _DOMAIN_CACHE
+
+    match = EMAIL_SIMPLE_REGEX.match(value)
+    if match:
+        domain_value = match.group(2)
+        if _cached_verdict(domain_cache,
+                           ('email', domain_value, strict_tld),
+                           _email_domain_type,
+                           domain_value,
+                           strict_tld) is None:
+            return None
 
         return value
 
-    if not is_domain:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
-    else:
-        is_valid = EMAIL_REGEX.search(value)
+    at_positions = []
+    quote_positions = []
+    lt_position = gt_position = -1
+    open_parenthesis = close_parenthesis = -1
+    for token in EMAIL_TOKEN_REGEX.finditer(value):
+        index = token.start()
+        character = value[index]
+        if character == '@':
+            at_positions.append(index)
+        elif character == '"':
+            quote_positions.append(index)
+        elif character == '<' and lt_position < 0:
+            lt_position = index
+        elif character == '>' and gt_position < 0:
+            gt_position = index
+        elif character == '(' and open_parenthesis < 0:
+            open_parenthesis = index
+        elif character == ')' and close_parenthesis < 0:
+            close_parenthesis = index
+
+    if strip_comment and (open_parenthesis >= 0 or close_parenthesis >= 0):
+        if open_parenthesis < 0 or close_parenthesis < 0 or \
+           close_parenthesis + 1 < open_parenthesis:
+            return None
 
-        if not is_valid:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
-
-        matched_string = is_valid.group(0)
-        position = value.find(matched_string)
-        if position > 0:
-            prefix = value[:position]
-            if prefix[0] in string_.punctuation:
-                raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                               'address' % value)
-            if '..' in prefix:
-                raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                               'address' % value)
-
-        end_of_match = position + len(matched_string)
-        suffix = value[end_of_match:]
-        if suffix:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
+        commented_value = value[open_parenthesis:close_parenthesis + 1]
+        return _validate_email(value.replace(commented_value, ''),
+                               strict_tld,
+                               strip_comment = False,
+                               domain_cache = domain_cache)
+
+    if not at_positions:
+        return None
+
+    first_quote = quote_positions[0] if quote_positions else -1
+    last_quote = quote_positions[-1] if quote_positions else -1
+
+    if lt_position >= 0 or gt_position >= 0:
+        if not 0 <= first_quote < lt_position or \
+           not 0 <= gt_position <= last_quote:
+            return None
+
+    if len(at_positions) > 1:
+        first_at = at_positions[1] if at_positions[0] == 0 else at_positions[0]
+        if not 0 <= first_quote < first_at:
+            return None
+
+    last_at = at_positions[-1]
+    domain_value = value[last_at + 1:]
+    if domain_value.startswith('[') and domain_value.endswith(']'):
+        domain_value = domain_value[1:-1]
+
+    domain_type = _cached_verdict(domain_cache,
+                                  ('email', domain_value, strict_tld),
+                                  _email_domain_type,
+                                  domain_value,
+                                  strict_tld)
+    if domain_type is None:
+        return None
+    elif domain_type == 'ip':
+        local_value = value[:last_at].replace('@', '')
+        if _validate_email(local_value + '@test.com',
+                           domain_cache = domain_cache) is None:
+            return None
+
+        return value
+
+    match = EMAIL_REGEX.search(value)
+    if not match or match.end() != len(value):
+        return None
+
+    local_start = match.start()
+    if local_start > 0:
+        prefix = value[:local_start]
+        if prefix[0] in string_.punctuation or '..' in prefix:
+            return None
 
     return value
 
 
+def _email_domain_type(value, strict_tld = False):
+    """Indicate whether the domain part of an email address is a domain name
+    (``'domain'``), an IP address (``'ip'``), or neither (:obj:`None <python:None>`).
+
+    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    """
+    try:
+        domain(value, strict_tld = strict_tld)
+        return 'domain'
+    except ValueError:
+        pass
+
+    try:
+        ip_address(value, force_run = True)                                     # pylint: disable=E1123
+        return 'ip'
+    except ValueError:
+        return None
+
+
 @disable_on_env
 def url(value,
         allow_empty = False,
         allow_special_ips = False,
+        strict_tld = False,
         **kwargs):
     """Validate that ``value`` is a valid URL.
 
@@ -2259,6 +4059,12 @@ def url(value,
       to ``False``.
     :type allow_special_ips: :class:`bool <python:bool>`
 
+    :param strict_tld: If ``True``, will fail if the host name in ``value`` does
+      not end in a suffix listed on the `Public Suffix List
+      <https://publicsuffix.org/>`_. IP addresses and special-use names (e.g.
+      ``localhost``) are not affected. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
 
@@ -2327,13 +4133,46 @@ def url(value,
     if not is_valid:
         raise errors.InvalidURLError('value (%s) is not a valid URL' % value)
 
+    if strict_tld:
+        host = _url_host(value)
+        is_ip = host.replace('.', '').isdigit()
+        if not is_ip and host not in SPECIAL_USE_DOMAIN_NAMES and \
+           not _cached_verdict(_DOMAIN_CACHE,
+                               ('public_suffix', host),
+                               has_public_suffix,
+                               host):
+            raise errors.InvalidURLError(
+                'value (%s) does not have a known public suffix' % value
+            )
+
     return value
 
 
+def _url_host(value):
+    """Return the lowercase host name portion of the URL ``value``.
+
+    :param value: A URL that has already passed validation.
+    :type value: :class:`str <python:str>`
+
+    :rtype: :class:`str <python:str>`
+    """
+    host = value.split('://', 1)[-1]
+    for delimiter in ('/', '?', '#'):
+        host = host.split(delimiter, 1)[0]
+
+    host = host.rpartition('@')[2]
+    host = host.split(':', 1)[0]
+
+    return host.lower()
+
+
 @disable_on_env
 def domain(value,
            allow_empty = False,
            allow_ips = False,
+           strict_tld = False,
+           strict_idna = False,
+           to_ascii = False,
            **kwargs):
     """Validate that ``value`` is a valid domain name.
 
@@ -2355,15 +4194,329 @@ def domain(value,
         * Including a path (e.g. ``domain.dev/path/to/file``) will fail validation.
         * Including a port (e.g. ``domain.dev:8080``) will fail validation.
 
-      If you are hoping to validate a more complete URL, we recommend that you
-      see :func:`url <validator_collection.validators.url>`.
+      If you are hoping to validate a more complete URL, we recommend that you
+      see :func:`url <validator_collection.validators.url>`.
+
+    .. hint::
+
+      Leading and trailing whitespace will be automatically stripped.
+
+    :param value: The value to validate.
+    :type value: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
+      ``value`` is empty. If ``False``, raises a
+      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
+      if ``value`` is empty. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param allow_ips: If ``True``, will succeed when validating IP addresses,
+      If ``False``, will raise a :class:`InvalidDomainError` if ``value`` is an IP
+      address. Defaults to ``False``.
+    :type allow_ips: :class:`bool <python:bool>`
+
+    :param strict_tld: If ``True``, will fail if ``value`` does not end in a
+      suffix listed on the `Public Suffix List <https://publicsuffix.org/>`_, or
+      if ``value`` *is* such a suffix (e.g. ``co.uk``). Special-use names (e.g.
+      ``localhost``) are not affected. Defaults to ``False``.
+    :type strict_tld: :class:`bool <python:bool>`
+
+    :param strict_idna: If ``True``, will fail if any internationalized label
+      (one containing non-ASCII characters or prefixed with ``xn--``) is not valid
+      under `IDNA 2008 <https://tools.ietf.org/html/rfc5891>`_. Defaults to
+      ``False``.
+
+      .. note::
+
+        IDNA 2008 validation requires the `idna <https://pypi.org/project/idna/>`_
+        package. If it is not installed, labels will be checked against the
+        (older) IDNA 2003 rules implemented in the standard library.
+
+    :type strict_idna: :class:`bool <python:bool>`
+
+    :param to_ascii: If ``True``, will return the ASCII-compatible (``xn--``)
+      form of ``value``. Implies ``strict_idna``. Defaults to ``False``.
+    :type to_ascii: :class:`bool <python:bool>`
+
+    :returns: ``value`` / :obj:`None <python:None>`
+    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises CannotCoerceError: if ``value`` is not a :class:`str <python:str>` or
+      :obj:`None <python:None>`
+    :raises InvalidDomainError: if ``value`` is not a valid domain name or
+      empty with ``allow_empty`` set to ``True``
+    :raises SlashInDomainError: if ``value`` contains a slash or backslash
+    :raises AtInDomainError: if ``value`` contains an ``@`` symbol
+    :raises ColonInDomainError: if ``value`` contains a ``:`` symbol
+    :raises WhitespaceInDomainError: if ``value`` contains whitespace
+    :raises UnknownTLDError: if ``strict_tld`` is ``True`` and ``value`` does not
+      end in a known public suffix
+    :raises InvalidIDNAError: if ``strict_idna`` or ``to_ascii`` is ``True`` and
+      ``value`` contains an invalid internationalized label
+
+    """
+    is_recursive = kwargs.pop('is_recursive', False)
+
+    if not value and not allow_empty:
+        raise errors.EmptyValueError('value (%s) was empty' % value)
+    elif not value:
+        return None
+
+    if not isinstance(value, basestring):
+        raise errors.CannotCoerceError('value must be a valid string, '
+                                       'was %s' % type(value))
+
+    return _cached_verdict(
+        _DOMAIN_CACHE,
+        ('domain', value, allow_empty, allow_ips, strict_tld, strict_idna, to_ascii,
+         is_recursive),
+        _validate_domain,
+        value,
+        allow_empty,
+        allow_ips,
+        strict_tld,
+        strict_idna,
+        to_ascii,
+        is_recursive
+    )
+
+
+def _validate_domain(value,
+                     allow_empty,
+                     allow_ips,
+                     strict_tld,
+                     strict_idna,
+                     to_ascii,
+                     is_recursive):
+    """Validate the (non-empty) string ``value`` as a domain name, with the
+    options supported by :func:`domain <validator_collection.validators.domain>`.
+
+    :raises InvalidDomainError: if ``value`` is not a valid domain name
+    """
+    # pylint: disable=too-many-arguments,too-many-branches
+    if '/' in value:
+        raise errors.SlashInDomainError('valid domain name cannot contain "/"')
+    if '\\' in value:
+        raise errors.SlashInDomainError('valid domain name cannot contain "\\"')
+    if '@' in value:
+        raise errors.AtInDomainError('valid domain name cannot contain "@"')
+    if ':' in value:
+        raise errors.ColonInDomainError('valid domain name cannot contain ":"')
+
+    value = value.strip().lower()
+
+    for item in string_.whitespace:
+        if item in value:
+            raise errors.WhitespaceInDomainError('valid domain name cannot contain '
+                                                 'whitespace')
+
+    if value in SPECIAL_USE_DOMAIN_NAMES:
+        return value
+
+    if allow_ips:
+        try:
+            ip_address(value, allow_empty = allow_empty)
+            is_valid = True
+        except (ValueError, TypeError, AttributeError):
+            is_valid = False
+
+        if is_valid:
+            return value
+
+    is_valid = DOMAIN_REGEX.match(value)
+
+    if not is_valid and not is_recursive:
+        with_prefix = 'http://' + value
+        try:
+            url(with_prefix, force_run = True, is_recursive = True)                                  # pylint: disable=E1123
+        except ValueError:
+            raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
+    elif not is_valid:
+        raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
+
+    if strict_idna or to_ascii:
+        ascii_value = _domain_to_ascii(value)
+
+    if strict_tld and not has_public_suffix(value):
+        raise errors.UnknownTLDError('value (%s) does not end in a known public '
+                                     'suffix' % value)
+
+    if to_ascii:
+        return ascii_value
+
+    return value
+
+
+def _domain_to_ascii(value):
+    """Return the ASCII-compatible form of the (lowercase) domain name ``value``,
+    validating each internationalized label along the way.
+
+    Results are cached per label in ``_IDNA_LABEL_CACHE``, since the same labels
+    (and particularly the same top-level domains) recur across many domain names.
+
+    :param value: The domain name to convert.
+    :type value: :class:`str <python:str>`
+
+    :rtype: :class:`str <python:str>`
+
+    :raises InvalidIDNAError: if any label in ``value`` is not a valid
+      internationalized label
+    """
+    ascii_labels = []
+    for label in value.split('.'):
+        try:
+            label.encode('ascii')
+            is_ascii = True
+        except UnicodeError:
+            is_ascii = False
+
+        if is_ascii and not label.startswith('xn--'):
+            ascii_labels.append(label)
+            continue
+
+        a_label = _IDNA_LABEL_CACHE.get(label)
+        if a_label is None:
+            try:
+                if idna_ is not None:
+                    a_label = idna_.alabel(label).decode('ascii')
+                else:
+                    a_label = encodings.idna.ToASCII(
+                        encodings.idna.ToUnicode(label)
+                    ).decode('ascii')
+            except (UnicodeError, ValueError):
+                a_label = False
+
+            _IDNA_LABEL_CACHE.set(label, a_label)
+
+        if a_label is False:
+            raise errors.InvalidIDNAError('value (%s) contains an invalid '
+                                          'internationalized label (%s)' % (value,
+                                                                            label))
+
+        ascii_labels.append(a_label)
+
+    ascii_value = '.'.join(ascii_labels)
+    if len(ascii_value.rstrip('.')) > 253:
+        raise errors.InvalidIDNAError('value (%s) exceeds 253 characters in its '
+                                      'ASCII form' % value)
+
+    return ascii_value
+
+
+@disable_on_env
+def ip_address(value,
+               allow_empty = False,
+               allowed = None,
+               denied = None,
+               **kwargs):
+    """Validate that ``value`` is a valid IP address.
+
+    .. note::
+
+      If a colon (``:``) appears in ``value`` before any period (``.``), the
+      validator will check if the address is a valid IPv6 address. Otherwise,
+      it will check if the address is a valid IPv4 address.
+
+    :param value: The value to validate.
+
+    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
+      ``value`` is empty. If ``False``, raises a
+      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
+      if ``value`` is empty. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param allowed: If supplied, will fail if ``value`` is not within any of
+      these networks. Defaults to :obj:`None <python:None>`.
+    :type allowed: :class:`IPNetworkIndex <validator_collection._ip_index.IPNetworkIndex>`
+      / iterable of :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :param denied: If supplied, will fail if ``value`` is within any of these
+      networks. An IPv4-mapped IP version 6 address (e.g. ``::ffff:10.0.0.1``)
+      is within an IP version 4 network if the address it maps is. Defaults to
+      :obj:`None <python:None>`.
+    :type denied: :class:`IPNetworkIndex <validator_collection._ip_index.IPNetworkIndex>`
+      / iterable of :class:`str <python:str>` / :obj:`None <python:None>`
+
+    .. hint::
+
+      When checking many values against the same ``allowed`` or ``denied``
+      networks, compile them once using :func:`compile_ip_networks` and supply
+      the result, rather than supplying the networks themselves (which are then
+      compiled on every call).
+
+    :returns: ``value`` / :obj:`None <python:None>`
+
+    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises InvalidIPAddressError: if ``value`` is not a valid IP address or empty with
+      ``allow_empty`` set to ``True``
+    :raises DisallowedIPAddressError: if ``value`` is not within the ``allowed``
+      networks, or is within the ``denied`` networks
+    :raises InvalidIPNetworkError: if ``allowed`` or ``denied`` contains a value
+      that is not a valid IP network
+
+    """
+    if not value and not allow_empty:
+        raise errors.EmptyValueError('value (%s) was empty' % value)
+    elif not value:
+        return None
+
+    if is_py2 and value and isinstance(value, unicode):
+        value = value.encode('utf-8')
+
+    try:
+        colon_position = value.find(':')
+        dot_position = value.find('.')
+    except (AttributeError, TypeError):
+        colon_position = dot_position = -1
+
+    if colon_position >= 0 and not 0 <= dot_position < colon_position:
+        version = 6
+        if isinstance(value, str):
+            value = value.lower().strip()
+            groups = _ipv6_groups(value)
+        else:
+            groups = None
+        is_valid = groups is not None
+    else:
+        version = 4
+        packed = _ipv4_to_int(value)
+        is_valid = packed is not None
+
+    if not is_valid:
+        raise errors.InvalidIPAddressError('value (%s) is not a valid IPv6 or '
+                                           'IPv4 address' % value)
+
+    if allowed is not None or denied is not None:
+        if version == 6:
+            packed = _ipv6_to_int(groups)
+
+        if denied is not None and \
+           _ip_network_index(denied).contains(version, packed):
+            raise errors.DisallowedIPAddressError('value (%s) is within a denied '
+                                                  'network' % value)
+        if allowed is not None and \
+           not _ip_network_index(allowed).contains(version, packed):
+            raise errors.DisallowedIPAddressError('value (%s) is not within an '
+                                                  'allowed network' % value)
+
+    return value
+
 
-    .. hint::
+@disable_on_env
+def ip_network(value,
+               allow_empty = False,
+               strict = True,
+               **kwargs):
+    """Validate that ``value`` is a valid IP network, in CIDR notation (e.g.
+    ``192.168.0.0/16`` or ``2001:db8::/32``).
 
-      Leading and trailing whitespace will be automatically stripped.
+    .. note::
+
+      A single IP address (with no ``/prefix``) is a valid network containing
+      only that address.
 
     :param value: The value to validate.
-    :type value: :class:`str <python:str>` / :obj:`None <python:None>`
 
     :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
       ``value`` is empty. If ``False``, raises a
@@ -2371,134 +4524,138 @@ def domain(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
-    :param allow_ips: If ``True``, will succeed when validating IP addresses,
-      If ``False``, will raise a :class:`InvalidDomainError` if ``value`` is an IP
-      address. Defaults to ``False``.
-    :type allow_ips: :class:`bool <python:bool>`
+    :param strict: If ``True``, will fail if ``value`` has any host bits set
+      (e.g. ``192.168.1.1/16``). Defaults to ``True``.
+    :type strict: :class:`bool <python:bool>`
 
     :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
-    :raises CannotCoerceError: if ``value`` is not a :class:`str <python:str>` or
-      :obj:`None <python:None>`
-    :raises InvalidDomainError: if ``value`` is not a valid domain name or
+    :raises InvalidIPNetworkError: if ``value`` is not a valid IP network or
       empty with ``allow_empty`` set to ``True``
-    :raises SlashInDomainError: if ``value`` contains a slash or backslash
-    :raises AtInDomainError: if ``value`` contains an ``@`` symbol
-    :raises ColonInDomainError: if ``value`` contains a ``:`` symbol
-    :raises WhitespaceInDomainError: if ``value`` contains whitespace
 
     """
-    is_recursive = kwargs.pop('is_recursive', False)
-
     if not value and not allow_empty:
         raise errors.EmptyValueError('value (%s) was empty' % value)
     elif not value:
         return None
 
-    if not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value must be a valid string, '
-                                       'was %s' % type(value))
-
-    if '/' in value:
-        raise errors.SlashInDomainError('valid domain name cannot contain "/"')
-    if '\\' in value:
-        raise errors.SlashInDomainError('valid domain name cannot contain "\\"')
-    if '@' in value:
-        raise errors.AtInDomainError('valid domain name cannot contain "@"')
-    if ':' in value:
-        raise errors.ColonInDomainError('valid domain name cannot contain ":"')
+    interval = _ip_network_interval(value, strict)
+    if interval is None:
+        raise errors.InvalidIPNetworkError('value (%s) is not a valid IP '
+                                           'network' % value)
 
-    value = value.strip().lower()
+    return interval[3]
 
-    for item in string_.whitespace:
-        if item in value:
-            raise errors.WhitespaceInDomainError('valid domain name cannot contain '
-                                                 'whitespace')
 
-    if value in SPECIAL_USE_DOMAIN_NAMES:
-        return value
+def compile_ip_networks(networks, strict = False):
+    """Compile ``networks`` into an index that can be supplied as the
+    ``allowed`` or ``denied`` argument to
+    :func:`ip_address() <validator_collection.validators.ip_address>`.
 
-    if allow_ips:
-        try:
-            ip_address(value, allow_empty = allow_empty)
-            is_valid = True
-        except (ValueError, TypeError, AttributeError):
-            is_valid = False
+    Testing an address against the index takes a binary search, no matter how
+    many networks it contains. The index can be reused across any number of
+    calls.
 
-        if is_valid:
-            return value
+    :param networks: The IP networks (in CIDR notation) or IP addresses to
+      compile. May mix IP versions 4 and 6.
+    :type networks: iterable of :class:`str <python:str>`
 
-    is_valid = DOMAIN_REGEX.match(value)
+    :param strict: If ``True``, will fail if any network has host bits set.
+      If ``False``, such networks are treated as if their host bits were
+      zero. Defaults to ``False``.
+    :type strict: :class:`bool <python:bool>`
 
-    if not is_valid and not is_recursive:
-        with_prefix = 'http://' + value
-        try:
-            url(with_prefix, force_run = True, is_recursive = True)                                  # pylint: disable=E1123
-        except ValueError:
-            raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
-    elif not is_valid:
-        raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
+    :rtype: :class:`IPNetworkIndex <validator_collection._ip_index.IPNetworkIndex>`
 
-    return value
+    :raises CannotCoerceError: if ``networks`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``networks`` is not iterable
+    :raises InvalidIPNetworkError: if any of ``networks`` is not a valid IP
+      network
+    """
+    if isinstance(networks, basestring):
+        raise errors.CannotCoerceError('networks must be an iterable of strings, '
+                                       'was %s' % type(networks))
 
+    try:
+        networks = iter(networks)
+    except TypeError:
+        raise errors.NotAnIterableError('value type (%s) not iterable' % type(networks))
 
-@disable_on_env
-def ip_address(value,
-               allow_empty = False,
-               **kwargs):
-    """Validate that ``value`` is a valid IP address.
+    intervals = {4: [], 6: []}
+    for network in networks:
+        interval = _ip_network_interval(network, strict)
+        if interval is None:
+            raise errors.InvalidIPNetworkError('value (%s) is not a valid IP '
+                                               'network' % network)
 
-    .. note::
+        version, first, last, _ = interval
+        intervals[version].append((first, last))
 
-      First, the validator will check if the address is a valid IPv6 address.
-      If that doesn't work, the validator will check if the address is a valid
-      IPv4 address.
+    return IPNetworkIndex(intervals[4], intervals[6])
 
-      If neither works, the validator will raise an error (as always).
 
-    :param value: The value to validate.
+def _ip_network_index(networks):
+    """Return ``networks`` as an
+    :class:`IPNetworkIndex <validator_collection._ip_index.IPNetworkIndex>`,
+    compiling it if necessary."""
+    if isinstance(networks, IPNetworkIndex):
+        return networks
 
-    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
-      ``value`` is empty. If ``False``, raises a
-      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
-      if ``value`` is empty. Defaults to ``False``.
-    :type allow_empty: :class:`bool <python:bool>`
+    return compile_ip_networks(networks)
 
-    :returns: ``value`` / :obj:`None <python:None>`
 
-    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
-    :raises InvalidIPAddressError: if ``value`` is not a valid IP address or empty with
-      ``allow_empty`` set to ``True``
+def _ip_network_interval(value, strict = True):
+    """Return the IP version, first and last addresses (as integers), and
+    normalized form of the IP network ``value``, or :obj:`None <python:None>` if
+    it is not a valid IP network.
 
+    :rtype: :class:`tuple <python:tuple>` / :obj:`None <python:None>`
     """
-    if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
-    elif not value:
+    if not isinstance(value, basestring):
         return None
 
-    if is_py2 and value and isinstance(value, unicode):
+    if is_py2 and isinstance(value, unicode):
         value = value.encode('utf-8')
 
-    try:
-        value = ipv6(value, force_run = True)                                   # pylint: disable=E1123
-        ipv6_failed = False
-    except ValueError:
-        ipv6_failed = True
+    address, slash, prefix = value.partition('/')
+    colon_position = address.find(':')
+    dot_position = address.find('.')
+    if colon_position >= 0 and not 0 <= dot_position < colon_position:
+        if not isinstance(value, str):
+            return None
 
-    if ipv6_failed:
-        try:
-            value = ipv4(value, force_run = True)                               # pylint: disable=E1123
-        except ValueError:
-            raise errors.InvalidIPAddressError('value (%s) is not a valid IPv6 or '
-                                               'IPv4 address' % value)
+        value = value.lower().strip()
+        address, slash, prefix = value.partition('/')
+        groups = _ipv6_groups(address) if '%' not in address else None
+        if groups is None:
+            return None
 
-    return value
+        version, bits, packed = 6, 128, _ipv6_to_int(groups)
+    else:
+        version, bits, packed = 4, 32, _ipv4_to_int(address)
+        if packed is None:
+            return None
+
+    prefix_length = IP_PREFIX_LENGTHS.get(prefix) if slash else bits
+    if prefix_length is None or prefix_length > bits:
+        return None
+
+    host_mask = (1 << (bits - prefix_length)) - 1
+    if packed & host_mask:
+        if strict:
+            return None
+
+        packed &= ~host_mask
+
+    return version, packed, packed | host_mask, value
 
 
 @disable_on_env
-def ipv4(value, allow_empty = False):
+def ipv4(value,
+         allow_empty = False,
+         return_type = None,
+         **kwargs):
     """Validate that ``value`` is a valid IP version 4 address.
 
     :param value: The value to validate.
@@ -2509,42 +4666,105 @@ def ipv4(value, allow_empty = False):
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
-    :returns: ``value`` / :obj:`None <python:None>`
+    :param return_type: The form in which to return the validated address. If
+      :class:`int <python:int>`, returns the address as a 32-bit integer. If
+      :class:`ipaddress.IPv4Address <python:ipaddress.IPv4Address>`, returns an
+      instance of that class. If :obj:`None <python:None>`, returns ``value``
+      as supplied. Defaults to :obj:`None <python:None>`.
+    :type return_type: :class:`type <python:type>` / :obj:`None <python:None>`
+
+    :returns: ``value`` / :class:`int <python:int>` /
+      :class:`IPv4Address <python:ipaddress.IPv4Address>` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises InvalidIPAddressError: if ``value`` is not a valid IP version 4 address or
       empty with ``allow_empty`` set to ``True``
+    :raises ValidatorUsageError: if ``return_type`` is not one of the supported
+      types
     """
     if not value and allow_empty is False:
         raise errors.EmptyValueError('value (%s) was empty' % value)
     elif not value:
         return None
 
-    try:
-        components = value.split('.')
-    except AttributeError:
+    packed = _ipv4_to_int(value)
+    if packed is None:
         raise errors.InvalidIPAddressError('value (%s) is not a valid ipv4' % value)
 
-    if len(components) != 4 or not all(x.isdigit() for x in components):
-        raise errors.InvalidIPAddressError('value (%s) is not a valid ipv4' % value)
+    return _ip_as_type(value, packed, return_type, 4)
+
+
+def _ipv4_to_int(value):
+    """Return the IP version 4 address ``value`` as a 32-bit integer, or
+    :obj:`None <python:None>` if it is not a valid IP version 4 address.
+
+    Each of the four dot-separated octets must consist solely of decimal digits
+    and be no greater than ``255``. Leading zeros are permitted.
+
+    :rtype: :class:`int <python:int>` / :obj:`None <python:None>`
+    """
+    try:
+        octets = value.split('.')
+    except (AttributeError, TypeError):
+        return None
+
+    if len(octets) != 4:
+        return None
+
+    packed = 0
+    for octet in octets:
+        if not octet.isdigit():
+            return None
 
-    for x in components:
         try:
-            x = integer(x,
-                        minimum = 0,
-                        maximum = 255)
+            octet = int(octet)
         except ValueError:
-            raise errors.InvalidIPAddressError('value (%s) is not a valid ipv4' % value)
+            return None
 
-    return value
+        if octet > 255:
+            return None
+
+        packed = packed << 8 | octet
+
+    return packed
+
+
+def _ip_as_type(value, packed, return_type, version):
+    """Return the IP address ``value``, whose integer form is ``packed``, as
+    ``return_type``.
+
+    :param version: The IP version of ``value`` (``4`` or ``6``).
+    :type version: :class:`int <python:int>`
+
+    :raises ValidatorUsageError: if ``return_type`` is not supported
+    """
+    if return_type is None:
+        return value
+    elif return_type is int:
+        return packed
+
+    if ipaddress_ is not None:
+        address_type = ipaddress_.IPv4Address if version == 4 else ipaddress_.IPv6Address
+        if return_type is address_type:
+            return address_type(packed)
+
+    raise errors.ValidatorUsageError('return_type (%s) is not supported' % return_type)
 
 
 @disable_on_env
 def ipv6(value,
          allow_empty = False,
+         return_type = None,
          **kwargs):
     """Validate that ``value`` is a valid IP address version 6.
 
+    .. note::
+
+      Supports ``::`` compression, a trailing embedded IPv4 address (e.g.
+      ``::ffff:192.0.2.1``), and a zone ID in the form used in URIs (e.g.
+      ``fe80::1%25eth0``).
+
     :param value: The value to validate.
 
     :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
@@ -2553,11 +4773,24 @@ def ipv6(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
-    :returns: ``value`` / :obj:`None <python:None>`
+    :param return_type: The form in which to return the validated address. If
+      :class:`int <python:int>`, returns the address as a 128-bit integer
+      (ignoring any zone ID). If
+      :class:`ipaddress.IPv6Address <python:ipaddress.IPv6Address>`, returns an
+      instance of that class. If :obj:`None <python:None>`, returns ``value``
+      (in lowercase, with whitespace stripped). Defaults to
+      :obj:`None <python:None>`.
+    :type return_type: :class:`type <python:type>` / :obj:`None <python:None>`
+
+    :returns: ``value`` / :class:`int <python:int>` /
+      :class:`IPv6Address <python:ipaddress.IPv6Address>` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises InvalidIPAddressError: if ``value`` is not a valid IP version 6 address or
       empty with ``allow_empty`` is not set to ``True``
+    :raises ValidatorUsageError: if ``return_type`` is not one of the supported
+      types
 
     """
     if not value and allow_empty is False:
@@ -2570,20 +4803,319 @@ def ipv6(value,
 
     value = value.lower().strip()
 
-    is_valid = IPV6_REGEX.match(value)
-
-    if not is_valid:
+    groups = _ipv6_groups(value)
+    if groups is None:
         raise errors.InvalidIPAddressError('value (%s) is not a valid ipv6' % value)
 
-    return value
+    if return_type is None:
+        return value
+
+    return _ip_as_type(value, _ipv6_to_int(groups), return_type, 6)
+
+
+def _ipv6_groups(value):
+    """Return the eight 16-bit groups of the (lowercase) IP version 6 address
+    ``value``, or :obj:`None <python:None>` if it is not a valid IP version 6
+    address.
+
+    Any ``::`` compression is expanded, and any embedded IPv4 address is
+    converted into its two groups.
+
+    :rtype: :class:`list <python:list>` of :class:`str <python:str>` /
+      :obj:`None <python:None>`
+    """
+    zone_position = value.find('%')
+    if zone_position >= 0:
+        if not IPV6_ZONE_REGEX.match(value, zone_position):
+            return None
+        value = value[:zone_position]
+
+    if not IPV6_CHARACTERS.issuperset(value):
+        return None
+
+    if '.' in value:
+        colon_position = value.rfind(':')
+        embedded_ipv4 = IPV6_EMBEDDED_IPV4_REGEX.match(value, colon_position + 1)
+        if colon_position < 0 or not embedded_ipv4:
+            return None
+
+        octets = [int(x) for x in embedded_ipv4.groups()]
+        value = '%s%x:%x' % (value[:colon_position + 1],
+                             octets[0] << 8 | octets[1],
+                             octets[2] << 8 | octets[3])
+        if '.' in value:
+            return None
+
+    head, compressed, tail = value.partition('::')
+    groups = head.split(':') if head or not compressed else []
+    if compressed:
+        tail_groups = tail.split(':') if tail else []
+        missing = 8 - len(groups) - len(tail_groups)
+        if missing < 1:
+            return None
+
+        groups.extend(['0'] * missing)
+        groups.extend(tail_groups)
+    elif len(groups) != 8:
+        return None
+
+    if '' in groups or max(map(len, groups)) > 4:
+        return None
+
+    return groups
+
+
+def _ipv6_to_int(groups):
+    """Return the IP version 6 address whose groups (as returned by
+    :func:`_ipv6_groups`) are ``groups`` as a 128-bit integer.
+
+    :rtype: :class:`int <python:int>`
+    """
+    return int(''.join([group.zfill(4) for group in groups]), 16)
+
+
+@disable_on_env
+def ipv4_batch(values,
+               chunk_size = 65536,
+               **kwargs):
+    """Validate each of ``values`` as an IP version 4 address, returning them
+    as a `NumPy <https://numpy.org/>`_ array of 32-bit integers.
+
+    Addresses are parsed ``chunk_size`` at a time, with each chunk parsed by
+    vectorized NumPy operations rather than one address at a time. Each
+    address is accepted or rejected by the same rules as
+    :func:`ipv4() <validator_collection.validators.ipv4>`.
+
+    .. note::
+
+      Requires `NumPy <https://numpy.org/>`_.
+
+    :param values: The values to validate. :class:`bytes <python:bytes>`
+      (including the items of a NumPy bytes array) are read as the text of an
+      address, decoded as latin-1. Other bytes-like values (e.g.
+      :class:`bytearray <python:bytearray>`) are not valid.
+    :type values: :class:`numpy.ndarray` of :class:`bytes <python:bytes>` or
+      :class:`str <python:str>` / iterable
+
+    :param chunk_size: The number of values to parse at once, which bounds the
+      memory used by intermediate arrays. Defaults to ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
+    :returns: A ``uint32`` array holding each valid address as an integer (and
+      ``0`` for each invalid value), and a boolean array indicating which values
+      are valid.
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``values`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``values`` is not iterable
+    """
+    values = _batch_values(values)
+    count = len(values)
+    packed = numpy_.zeros(count, dtype = numpy_.uint32)
+    is_valid = numpy_.zeros(count, dtype = numpy_.bool_)
+
+    for start in range(0, count, chunk_size):
+        chunk = values[start:start + chunk_size]
+        if isinstance(chunk, numpy_.ndarray) and chunk.dtype.kind in 'SU':
+            texts = None
+        else:
+            texts = [_batch_text(x) for x in chunk]
+            chunk = numpy_.array(texts, dtype = numpy_.str_)
+
+        chunk_packed, chunk_is_valid, needs_check = _batch.ipv4_to_int(
+            _batch.character_codes(chunk)
+        )
+
+        if texts is not None:
+            # Trailing NUL characters are dropped when converting to an array.
+            lengths = numpy_.fromiter((len(x) for x in texts),
+                                      dtype = numpy_.intp,
+                                      count = len(texts))
+            needs_check |= numpy_.char.str_len(chunk) != lengths
+
+        for index in numpy_.flatnonzero(needs_check):
+            text = texts[index] if texts is not None else _batch_text(chunk[index])
+            address = _ipv4_to_int(text)
+            chunk_is_valid[index] = address is not None
+            chunk_packed[index] = address or 0
+
+        packed[start:start + len(chunk)] = chunk_packed
+        is_valid[start:start + len(chunk)] = chunk_is_valid
+
+    return packed, is_valid
+
+
+@disable_on_env
+def ipv6_batch(values,
+               chunk_size = 65536,
+               **kwargs):
+    """Validate each of ``values`` as an IP version 6 address, returning them
+    as a `NumPy <https://numpy.org/>`_ array of pairs of 64-bit integers.
+
+    Each address is accepted or rejected by the same rules as
+    :func:`ipv6() <validator_collection.validators.ipv6>`.
+
+    .. note::
+
+      Requires `NumPy <https://numpy.org/>`_.
+
+    :param values: The values to validate. :class:`bytes <python:bytes>`
+      (including the items of a NumPy bytes array) are read as the text of an
+      address, decoded as latin-1. Other bytes-like values (e.g.
+      :class:`bytearray <python:bytearray>`) are not valid.
+    :type values: :class:`numpy.ndarray` of :class:`bytes <python:bytes>` or
+      :class:`str <python:str>` / iterable
+
+    :param chunk_size: The number of values to parse before copying them into
+      the returned arrays. Defaults to ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
+    :returns: A ``uint64`` array with two columns holding the high and low 64
+      bits of each valid address (and ``0`` for each invalid value), and a
+      boolean array indicating which values are valid.
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``values`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``values`` is not iterable
+    """
+    values = _batch_values(values)
+    count = len(values)
+    packed = numpy_.zeros((count, 2), dtype = numpy_.uint64)
+    is_valid = numpy_.zeros(count, dtype = numpy_.bool_)
+
+    low_mask = (1 << 64) - 1
+    for start in range(0, count, chunk_size):
+        chunk_packed = []
+        chunk_is_valid = []
+        for value in values[start:start + chunk_size]:
+            groups = _ipv6_groups(_batch_text(value).lower().strip())
+            if groups is None:
+                chunk_packed.append((0, 0))
+                chunk_is_valid.append(False)
+            else:
+                address = _ipv6_to_int(groups)
+                chunk_packed.append((address >> 64, address & low_mask))
+                chunk_is_valid.append(True)
+
+        end = start + len(chunk_is_valid)
+        if chunk_packed:
+            packed[start:end] = numpy_.array(chunk_packed, dtype = numpy_.uint64)
+        is_valid[start:end] = chunk_is_valid
+
+    return packed, is_valid
+
+
+@disable_on_env
+def mac_address_batch(values,
+                      allow_eui64 = False,
+                      chunk_size = 65536,
+                      **kwargs):
+    """Validate each of ``values`` as a MAC address, returning them as a
+    `NumPy <https://numpy.org/>`_ array of 64-bit integers.
+
+    Each address is accepted or rejected by the same rules as
+    :func:`mac_address() <validator_collection.validators.mac_address>`.
+
+    .. note::
+
+      Requires `NumPy <https://numpy.org/>`_.
+
+    :param values: The values to validate. :class:`bytes <python:bytes>`
+      (including the items of a NumPy bytes array) are read as the text of an
+      address, decoded as latin-1. Other bytes-like values (e.g.
+      :class:`bytearray <python:bytearray>`) are not valid.
+    :type values: :class:`numpy.ndarray` of :class:`bytes <python:bytes>` or
+      :class:`str <python:str>` / iterable
+
+    :param allow_eui64: If ``True``, also accepts 64-bit (EUI-64) identifiers of
+      eight octets. Defaults to ``False``.
+    :type allow_eui64: :class:`bool <python:bool>`
+
+    :param chunk_size: The number of values to parse before copying them into
+      the returned arrays. Defaults to ``65536``.
+    :type chunk_size: :class:`int <python:int>`
+
+    :returns: A ``uint64`` array holding each valid address as an integer (and
+      ``0`` for each invalid value), and a boolean array indicating which values
+      are valid.
+    :rtype: :class:`tuple <python:tuple>` of :class:`numpy.ndarray`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``values`` is a :class:`str <python:str>`
+    :raises NotAnIterableError: if ``values`` is not iterable
+    """
+    values = _batch_values(values)
+    count = len(values)
+    packed = numpy_.zeros(count, dtype = numpy_.uint64)
+    is_valid = numpy_.zeros(count, dtype = numpy_.bool_)
+
+    for start in range(0, count, chunk_size):
+        chunk_packed = []
+        for value in values[start:start + chunk_size]:
+            digits = _mac_address_digits(_batch_text(value).lower().strip(),
+                                         allow_eui64)
+            chunk_packed.append(digits and int(digits, 16))
+
+        end = start + len(chunk_packed)
+        is_valid[start:end] = [x is not None for x in chunk_packed]
+        packed[start:end] = [x or 0 for x in chunk_packed]
+
+    return packed, is_valid
+
+
+def _batch_values(values):
+    """Return ``values`` as a sequence that supports slicing, for the batch
+    validators that return NumPy arrays.
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``values`` is a string
+    :raises NotAnIterableError: if ``values`` is not iterable
+    """
+    if numpy_ is None:
+        raise ImportError('batch validation requires NumPy')
+
+    if isinstance(values, (basestring, bytes)):
+        raise errors.CannotCoerceError('values must be an iterable of strings, '
+                                       'was %s' % type(values))
+
+    if isinstance(values, numpy_.ndarray):
+        return values.ravel()
+
+    try:
+        return list(values)
+    except TypeError:
+        raise errors.NotAnIterableError('value type (%s) not iterable' % type(values))
+
+
+def _batch_text(value):
+    """Return ``value`` as text, decoding :class:`bytes <python:bytes>` (and
+    returning an empty string for anything that is not text)."""
+    if isinstance(value, bytes) and not isinstance(value, str):
+        return value.decode('latin-1')
+    elif isinstance(value, basestring):
+        return value
+
+    return ''
 
 
 @disable_on_env
 def mac_address(value,
                 allow_empty = False,
+                allow_eui64 = False,
+                return_type = None,
                 **kwargs):
     """Validate that ``value`` is a valid MAC address.
 
+    .. note::
+
+      Accepts six octets separated by colons or hyphens
+      (``01:23:45:67:ab:cd``), three groups of four digits separated by dots
+      (``0123.4567.abcd``), and twelve hexadecimal digits without separators
+      (``01234567abcd``). The validated address is returned in the
+      colon-separated form.
+
     :param value: The value to validate.
     :type value: :class:`str <python:str>` / :obj:`None <python:None>`
 
@@ -2593,14 +5125,28 @@ def mac_address(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
-    :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    :param allow_eui64: If ``True``, also accepts 64-bit (EUI-64) identifiers of
+      eight octets, in any of the forms above. Defaults to ``False``.
+    :type allow_eui64: :class:`bool <python:bool>`
+
+    :param return_type: The form in which to return the validated address. If
+      :class:`int <python:int>`, returns the address as a 48-bit (or, for an
+      EUI-64 identifier, 64-bit) integer. If :obj:`None <python:None>`, returns
+      the address as a lowercase, colon-separated string. Defaults to
+      :obj:`None <python:None>`.
+    :type return_type: :class:`type <python:type>` / :obj:`None <python:None>`
+
+    :returns: ``value`` / :class:`int <python:int>` / :obj:`None <python:None>`
+    :rtype: :class:`str <python:str>` / :class:`int <python:int>` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     :raises CannotCoerceError: if ``value`` is not a valid :class:`str <python:str>`
       or string-like object
     :raises InvalidMACAddressError: if ``value`` is not a valid MAC address or empty with
       ``allow_empty`` set to ``True``
+    :raises ValidatorUsageError: if ``return_type`` is not one of the supported
+      types
 
     """
     if not value and not allow_empty:
@@ -2612,15 +5158,49 @@ def mac_address(value,
         raise errors.CannotCoerceError('value must be a valid string, '
                                        'was %s' % type(value))
 
-    if '-' in value:
-        value = value.replace('-', ':')
-
     value = value.lower().strip()
 
-    is_valid = MAC_ADDRESS_REGEX.match(value)
-
-    if not is_valid:
+    digits = _mac_address_digits(value, allow_eui64)
+    if digits is None:
         raise errors.InvalidMACAddressError('value (%s) is not a valid MAC '
                                             'address' % value)
 
-    return value
+    if return_type is None and len(value) == len(digits) * 3 // 2 - 1:
+        return value.replace('-', ':')
+    elif return_type is None:
+        return ':'.join([digits[x:x + 2] for x in range(0, len(digits), 2)])
+    elif return_type is int:
+        return int(digits, 16)
+
+    raise errors.ValidatorUsageError('return_type (%s) is not supported' % return_type)
+
+
+def _mac_address_digits(value, allow_eui64 = False):
+    """Return the hexadecimal digits of the (lowercase) MAC address ``value``
+    without separators, or :obj:`None <python:None>` if it is not a valid MAC
+    address.
+
+    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    """
+    length = len(value)
+    octets = 6
+    if allow_eui64 and length in (16, 19, 23):
+        octets = 8
+
+    if length == 3 * octets - 1:
+        if value[2::3].strip(':-'):
+            return None
+        digits = value.replace(':', '').replace('-', '')
+    elif length == 5 * octets // 2 - 1:
+        if value[4::5].strip('.'):
+            return None
+        digits = value.replace('.', '')
+    elif length == 2 * octets:
+        digits = value
+    else:
+        return None
+
+    if len(digits) != 2 * octets or not HEX_DIGITS.issuperset(digits):
+        return None
+
+    return digits